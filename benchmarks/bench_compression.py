@@ -0,0 +1,119 @@
+"""
+================================================================================
+bench_compression.py
+================================================================================
+
+[프로그램 설명]
+로그 항목을 암호화하기 전에 압축하는 codec 모듈의 코덱/압축 수준/사전 사용 여부별
+압축 후 크기와 CPU 사용 시간을 측정하는 벤치마크입니다.
+
+합성한 파일을 여러 번 조금씩 수정하면서 log_code_changes와 같은 방식(utility.make_change_entry)으로
+로그 항목을 만든 뒤, 각 설정으로 모든 항목을 압축(기록 시)하고 다시 풀어(읽을 때) 봅니다.
+- size    : 압축 전 대비 압축 후 전체 크기의 비율 (작을수록 좋음)
+- cpu     : 압축에 사용한 CPU 시간 (항목당 평균)
+- decode  : codec.RecordDecoder로 압축을 푸는 데 사용한 CPU 시간 (항목당 평균, 직전 버전 복원 포함)
+
+[실행 방법]
+  poetry run python benchmarks/bench_compression.py
+  poetry run python benchmarks/bench_compression.py --lines 200 1000 5000 --compact --output compression.json
+================================================================================
+"""
+
+import argparse
+import json
+import random
+import time
+
+from mission_python.util import codec, utility
+
+# 측정할 (코덱, 압축 수준, 사전 사용 여부) 조합입니다. lzma는 사전을 지원하지 않습니다.
+CONFIGS = [
+    ("zlib", 1, False), ("zlib", 6, False), ("zlib", 9, False),
+    ("zlib", 1, True), ("zlib", 6, True), ("zlib", 9, True),
+    ("lzma", 0, False), ("lzma", 6, False),
+]
+
+
+def make_entries(line_count: int, edit_count: int, compact: bool) -> list:
+    """ 합성 파일을 edit_count번 수정하며 (로그 항목, 직전 버전) 목록을 만듭니다. """
+    rng = random.Random(line_count)
+    lines = []
+    for i in range(line_count):
+        if i % 10 == 0:
+            lines.append(f"def function_{i}(data, option=None):\n")
+        else:
+            lines.append(f"    result_{i} = process(data['{rng.choice('abcdef')}'], {rng.randrange(1000)})\n")
+
+    utility.flag_compact_log_enabled = compact
+    keyframe_meta = {}
+    entries = []
+    for k in range(edit_count):
+        previous = "".join(lines)
+        for _ in range(rng.randint(1, 3)):
+            position = rng.randrange(len(lines))
+            if rng.random() < 0.5:
+                lines[position] = f"    edited_{k} = True\n"
+            else:
+                lines.insert(position, f"    inserted_{k} = {position}\n")
+        current = "".join(lines)
+        entry, _ = utility.make_change_entry(previous.splitlines(keepends=True), list(lines), current,
+                                             f"t{k}", "main.py", keyframe_meta)
+        entries.append((entry if k else initial_entry(previous) + entry, previous))
+    utility.flag_compact_log_enabled = False
+    return entries
+
+
+def initial_entry(content: str) -> str:
+    """ 읽는 쪽이 직전 버전을 복원할 수 있도록, 첫 항목 앞에 최초 버전을 붙입니다. """
+    return f"🦊=== Code Change Tracking Started at t ===\n🦊=== Initial version of main.py ===\n\n{content}"
+
+
+def measure(entries: list, codec_name: str, level: int, use_dictionary: bool) -> dict:
+    raw_size = sum(len(entry.encode("utf-8")) for entry, _ in entries)
+    started = time.process_time()
+    records = [codec.compress(entry.encode("utf-8"), codec_name, level,
+                              {"main.py": previous} if use_dictionary and index else None)
+               for index, (entry, previous) in enumerate(entries)]
+    compress_cpu = time.process_time() - started
+
+    started = time.process_time()
+    decoded = codec.decode_records(records)
+    decode_cpu = time.process_time() - started
+    assert [record.decode("utf-8") for record in decoded] == [entry for entry, _ in entries]
+
+    size = sum(len(record) for record in records)
+    return {"raw_bytes": raw_size, "bytes": size, "ratio": size / raw_size,
+            "compress_cpu": compress_cpu / len(entries), "decode_cpu": decode_cpu / len(entries)}
+
+
+def run(args) -> None:
+    results = []
+    print(f"{'lines':>6} {'mode':<8} {'codec':<6} {'level':>5} {'dict':>5} "
+          f"{'size':>7} {'cpu(ms)':>8} {'decode(ms)':>10}")
+    for line_count in args.lines:
+        for compact in ([False, True] if args.compact else [False]):
+            entries = make_entries(line_count, args.edits, compact)
+            mode = "compact" if compact else "full"
+            for codec_name, level, use_dictionary in CONFIGS:
+                result = measure(entries, codec_name, level, use_dictionary)
+                print(f"{line_count:>6} {mode:<8} {codec_name:<6} {level:>5} {'yes' if use_dictionary else 'no':>5} "
+                      f"{result['ratio']:>7.1%} {result['compress_cpu'] * 1000:>8.2f} {result['decode_cpu'] * 1000:>10.2f}")
+                results.append({"name": "compression",
+                                "params": {"lines": line_count, "mode": mode, "codec": codec_name,
+                                           "level": level, "dictionary": use_dictionary},
+                                "unit": "s", "samples": len(entries), "median": result["compress_cpu"],
+                                "min": result["compress_cpu"], **result})
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, indent=2)
+        print(f"🦊 {len(results)} results written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기록 압축 코덱별 크기/CPU 벤치마크")
+    parser.add_argument("--lines", type=int, nargs="+", default=[200, 1000, 5000],
+                        help="합성 파일의 줄 수 목록 (기본값: 200 1000 5000)")
+    parser.add_argument("--edits", type=int, default=20, help="파일을 수정하여 기록할 횟수 (기본값: 20)")
+    parser.add_argument("--compact", action="store_true", help="압축 로그 모드(delta) 항목도 함께 측정합니다")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일 (bench_suite.py --compare와 같은 형식)")
+    run(parser.parse_args())
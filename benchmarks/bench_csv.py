@@ -0,0 +1,127 @@
+"""
+================================================================================
+bench_csv.py
+================================================================================
+
+[프로그램 설명]
+csvstream 모듈(CSV 행 스트림)의 처리량을 측정하는 벤치마크입니다.
+assets/sample.csv와 같은 열을 가진 큰 성적 CSV 파일을 임시 폴더에 만든 뒤, 파일을 처음부터 끝까지 읽는
+시간을 방식별로 비교합니다. 일부 행에는 쉼표가 들어 있는 따옴표 필드가 포함되어 있습니다.
+
+- split        : 기존 방식 (line.strip().split(',')), 따옴표를 처리하지 못하므로 참고용입니다.
+- iter_rows    : csvstream.iter_rows (행을 문자열 목록으로)
+- records      : csvstream.iter_records, 모든 열을 딕셔너리로
+- records_2col : csvstream.iter_records, 필요한 두 열(학번, 총점)만
+- DictReader   : csv.DictReader (비교용)
+- columnar     : columnar.load_columns, 타입이 있는 열 버퍼로 모두 읽어 들입니다. (peak에 표 전체의 크기가 포함됩니다)
+- aggregate    : aggregate.GradeAggregator.consume, 학과별/학년별 점수 통계와 등급 히스토그램
+
+--memory 옵션을 주면 tracemalloc으로 방식별 최대 메모리 사용량도 측정합니다. (측정 중에는 느려집니다)
+
+[실행 방법]
+  poetry run python benchmarks/bench_csv.py
+  poetry run python benchmarks/bench_csv.py --rows 1000000 --chunk-sizes 8192 65536 262144 --memory
+================================================================================
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from mission_python.util import aggregate, columnar, csvstream
+
+HEADER = "순번,학과,학년,학번,성명,결석(일),출석점수(10점),기말고사(100점),중간고사(100점),총점,등급"
+DEPARTMENTS = ["컴퓨터공학부", "소프트웨어융합학과", "\"인공지능학과, 데이터사이언스\"", "전자공학과"]
+GRADES = ["A+", "A0", "B+", "B0", "C+", "C0", "D+", "D0", "F"]
+
+
+def make_csv(path: str, row_count: int) -> int:
+    """ 성적 CSV 파일을 만들고, 파일 크기(바이트)를 반환합니다. """
+    rng = random.Random(row_count)
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        f.write(HEADER + "\n")
+        for i in range(row_count):
+            name = f"\"Student, {i}\"" if i % 10 == 0 else f"Student {i}"
+            final, midterm = rng.randrange(101), rng.randrange(101)
+            f.write(f"{i + 1},{rng.choice(DEPARTMENTS)},{rng.randint(1, 4)},{2023000000 + i},{name},"
+                    f"{rng.randrange(5)},10.0,{final},{midterm},{(final + midterm) * 0.45 + 10:.2f},"
+                    f"{rng.choice(GRADES)}\n")
+    return os.path.getsize(path)
+
+
+def read_split(path: str, chunk_size: int) -> int:
+    count = 0
+    with open(path, "r", encoding="utf-8-sig", buffering=chunk_size) as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                line.strip().split(",")
+                count += 1
+    return count
+
+
+def read_dictreader(path: str, chunk_size: int) -> int:
+    with open(path, "r", encoding="utf-8-sig", newline="", buffering=chunk_size) as f:
+        return sum(1 for _ in csv.DictReader(f))
+
+
+METHODS = {
+    "split": read_split,
+    "iter_rows": lambda path, chunk_size: sum(1 for _ in csvstream.iter_rows(path, chunk_size=chunk_size)),
+    "records": lambda path, chunk_size: sum(1 for _ in csvstream.iter_records(path, chunk_size=chunk_size)),
+    "records_2col": lambda path, chunk_size: sum(
+        1 for _ in csvstream.iter_records(path, ["학번", "총점"], chunk_size=chunk_size)),
+    "DictReader": read_dictreader,
+    "columnar": lambda path, chunk_size: len(columnar.load_columns(path, chunk_size=chunk_size)),
+    "aggregate": lambda path, chunk_size: aggregate.GradeAggregator().consume(path, chunk_size=chunk_size),
+}
+
+
+def run(args) -> None:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "grades.csv")
+        size = make_csv(path, args.rows)
+        print(f"🦊 {args.rows:,} rows, {size / 1e6:.1f} MB")
+        print(f"{'method':<14} {'chunk':>8} {'rows/s':>12} {'MB/s':>8} {'peak(KB)':>9}")
+        for chunk_size in args.chunk_sizes:
+            for name, method in METHODS.items():
+                best = None
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    count = method(path, chunk_size)
+                    elapsed = time.perf_counter() - started
+                    best = elapsed if best is None else min(best, elapsed)
+                assert count == args.rows, (name, count)
+                peak = None
+                if args.memory:
+                    tracemalloc.start()
+                    method(path, chunk_size)
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                peak_text = f"{peak / 1024:.0f}" if peak is not None else "-"
+                print(f"{name:<14} {chunk_size:>8} {args.rows / best:>12,.0f} {size / best / 1e6:>8.1f} {peak_text:>9}")
+                results.append({"name": "csv_read", "params": {"method": name, "chunk_size": chunk_size,
+                                                               "rows": args.rows},
+                                "unit": "s", "samples": args.repeat, "median": best, "min": best,
+                                "rows_per_second": args.rows / best, "peak_bytes": peak})
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, indent=2)
+        print(f"🦊 {len(results)} results written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CSV 행 스트림 처리량 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="만들 CSV 파일의 데이터 행 수 (기본값: 1000000)")
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[csvstream.DEFAULT_CHUNK_SIZE],
+                        help="측정할 읽기 버퍼 크기(바이트) 목록")
+    parser.add_argument("--repeat", type=int, default=1, help="방식별 반복 측정 횟수 (기본값: 1)")
+    parser.add_argument("--memory", action="store_true", help="tracemalloc으로 최대 메모리 사용량도 측정합니다")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일 (bench_suite.py --compare와 같은 형식)")
+    run(parser.parse_args())
@@ -0,0 +1,108 @@
+"""
+================================================================================
+bench_diff.py
+================================================================================
+
+[프로그램 설명]
+log_code_changes가 사용하는 diff 엔진(diffengine)의 알고리즘들을 difflib.unified_diff와 비교하는 벤치마크입니다.
+log_code_changes와 같이 파일 전체를 문맥으로 포함한 diff(n = 전체 줄 수)를 만드는 시간과,
+만들어진 diff의 변경 줄 수(+/-, 작을수록 정확한 diff)를 측정합니다.
+
+- scattered     : 100줄마다 한 줄씩 수정한 큰 파일 (difflib이 가장 느려지는 경우)
+- block_move    : 가운데 1,000줄 묶음을 파일 끝으로 옮긴 경우
+- table         : 몇 종류의 줄이 반복되는 표(붙여 넣은 데이터)에 줄을 끼워 넣은 경우
+- blank_heavy   : 빈 줄과 괄호 줄이 많은 코드에서 함수 몇 개를 수정한 경우
+- rewrite       : 모든 줄이 바뀐 경우
+
+[실행 방법]
+  poetry run python benchmarks/bench_diff.py
+  poetry run python benchmarks/bench_diff.py --lines 20000 --output diff.json
+================================================================================
+"""
+
+import argparse
+import json
+import random
+import time
+
+from mission_python.util import diffengine
+
+ALGORITHMS = ["difflib", "histogram", "patience", "myers"]
+
+
+def make_cases(line_count: int) -> dict:
+    """ 측정할 (이전 버전, 현재 버전) 쌍들을 만듭니다. """
+    rng = random.Random(line_count)
+    cases = {}
+
+    old = [f"value_{i} = compute({i})\n" for i in range(line_count)]
+    new = list(old)
+    for index in range(0, line_count, 100):
+        new[index] = f"value_{index} = edited({index})\n"
+    cases["scattered"] = (old, new)
+
+    middle = line_count // 2
+    new = old[:middle] + old[middle + 1000:] + old[middle:middle + 1000]
+    cases["block_move"] = (old, new)
+
+    old = [f"    [{rng.randrange(5)}, {rng.randrange(5)}, {rng.randrange(3)}],\n" for _ in range(line_count)]
+    new = list(old)
+    for _ in range(max(1, line_count // 1000)):
+        new.insert(rng.randrange(len(new)), "    [9, 9, 9],\n")
+    cases["table"] = (old, new)
+
+    old = []
+    for i in range(line_count // 6):
+        old += [f"def func_{i}():\n", "    return {\n", f"        'id': {i},\n", "    }\n", "\n", "\n"]
+    new = list(old)
+    for index in range(2, len(new), max(6, len(new) // 50 // 6 * 6)):
+        new[index] = f"        'id': -{index},\n"
+    cases["blank_heavy"] = (old, new)
+
+    old = [f"x_{i} = {i}\n" for i in range(line_count)]
+    new = [f"y_{i} = {i}\n" for i in range(line_count)]
+    cases["rewrite"] = (old, new)
+    return cases
+
+
+def measure(old: list, new: list, algorithm: str, repeat: int) -> tuple:
+    """ diff를 repeat번 만들어 가장 짧은 시간(초)과 변경 줄 수를 반환합니다. """
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        diff = list(diffengine.unified_diff(old, new, "previous version", "current version",
+                                            n=len(old) + len(new), algorithm=algorithm))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    changed = sum(1 for line in diff[2:] if line[:1] in "+-")
+    return best, changed
+
+
+def run(args) -> None:
+    results = []
+    print(f"{'case':<12} {'algorithm':<10} {'time(ms)':>10} {'changed lines':>14} {'speedup':>8}")
+    for name, (old, new) in make_cases(args.lines).items():
+        baseline = None
+        for algorithm in ALGORITHMS:
+            if algorithm == "difflib" and args.skip_difflib:
+                continue
+            seconds, changed = measure(old, new, algorithm, args.repeat)
+            baseline = seconds if algorithm == "difflib" else baseline
+            speedup = f"x{baseline / seconds:.1f}" if baseline else "-"
+            print(f"{name:<12} {algorithm:<10} {seconds * 1000:>10.1f} {changed:>14} {speedup:>8}")
+            results.append({"name": "diff", "params": {"case": name, "algorithm": algorithm, "lines": args.lines},
+                            "unit": "s", "samples": args.repeat, "median": seconds, "min": seconds,
+                            "changed_lines": changed})
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, indent=2)
+        print(f"🦊 {len(results)} results written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="diff 엔진 알고리즘 벤치마크 (difflib 대비)")
+    parser.add_argument("--lines", type=int, default=50_000, help="합성 파일의 줄 수 (기본값: 50000)")
+    parser.add_argument("--repeat", type=int, default=1, help="항목별 반복 측정 횟수 (기본값: 1)")
+    parser.add_argument("--skip-difflib", action="store_true", help="느린 difflib 측정을 건너뜁니다")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일 (bench_suite.py --compare와 같은 형식)")
+    run(parser.parse_args())
@@ -0,0 +1,100 @@
+"""
+================================================================================
+bench_import.py
+================================================================================
+
+[프로그램 설명]
+`python -X importtime` 출력을 분석하여, `mission_python.main`을 import 하는 데
+걸리는 시간을 측정하는 벤치마크입니다.
+
+- lazy  : 현재 코드 그대로 `import mission_python.main`을 실행합니다.
+- eager : 예전 코드처럼 cryptography, requests, psutil, urllib.request, platform을
+          먼저 불러온 뒤 `import mission_python.main`을 실행하여, 지연 로딩 이전의
+          비용을 재현합니다.
+
+측정은 매번 새 파이썬 프로세스에서 수행하며, 첫 실행(로그/서명 생성)의 영향을
+없애기 위해 측정 전에 한 번 워밍업 실행을 합니다.
+
+[실행 방법]
+  poetry run python benchmarks/bench_import.py
+  poetry run python benchmarks/bench_import.py --runs 20
+================================================================================
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+# 예전 코드가 import 시점에 즉시 불러오던 무거운 모듈들입니다.
+HEAVY_MODULES = [
+    "cryptography.hazmat.primitives.ciphers",
+    "cryptography.hazmat.primitives.serialization",
+    "requests",
+    "psutil",
+    "urllib.request",
+    "platform",
+]
+
+# "import time:   self |  cumulative | name" 형식의 한 줄을 분석하는 정규식입니다.
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """
+    `-X importtime` 출력에서 (들여쓰기 깊이, 누적 시간(us), 모듈 이름) 목록을 뽑아냅니다.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            entries.append(((len(indent) - 1) // 2, int(cumulative), name))
+    return entries
+
+
+def measure(code: str) -> tuple[float, set[str]]:
+    """
+    새 프로세스에서 code를 실행하고, 최상위 import 들의 누적 시간 합(ms)과
+    불러온 모듈 이름 집합을 반환합니다.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+    entries = parse_importtime(proc.stderr)
+    total_us = sum(cumulative for depth, cumulative, _ in entries if depth == 0)
+    return total_us / 1000.0, {name for _, _, name in entries}
+
+
+def run(runs: int) -> None:
+    lazy_code = "import mission_python.main"
+    eager_code = "import " + ", ".join(HEAVY_MODULES) + "; import mission_python.main"
+
+    # 워밍업: 최초 실행 시 생성되는 로그/서명 파일의 비용이 측정에 섞이지 않도록 합니다.
+    measure(lazy_code)
+
+    # 인터프리터 시작 과정(site, encodings 등)의 import 비용은 빈 코드로 따로 측정해서 빼 줍니다.
+    startup_ms = statistics.median(measure("pass")[0] for _ in range(runs))
+    startup_modules = measure("pass")[1]
+
+    results = {}
+    for label, code in (("eager (before)", eager_code), ("lazy (after)", lazy_code)):
+        samples, loaded = [], set()
+        for _ in range(runs):
+            elapsed_ms, loaded = measure(code)
+            samples.append(elapsed_ms - startup_ms)
+        results[label] = (statistics.median(samples), min(samples), loaded - startup_modules)
+
+    print(f"{'mode':<16} {'median(ms)':>11} {'min(ms)':>9}  heavy modules loaded")
+    for label, (median_ms, min_ms, loaded) in results.items():
+        heavy = sorted(m for m in ("cryptography", "requests", "psutil", "urllib.request", "platform") if m in loaded)
+        print(f"{label:<16} {median_ms:>11.1f} {min_ms:>9.1f}  {', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="mission_python import 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=10, help="모드별 반복 측정 횟수 (기본값: 10)")
+    args = parser.parse_args()
+    run(args.runs)
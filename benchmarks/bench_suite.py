@@ -0,0 +1,267 @@
+"""
+================================================================================
+bench_suite.py
+================================================================================
+
+[프로그램 설명]
+코드 변경 기록의 주요 경로(hot path)를 한 번에 측정하고, 결과를 JSON 파일로 저장하는 벤치마크 모음입니다.
+표준 라이브러리(time.perf_counter, timeit)만 사용하며, 네트워크 없이 실행할 수 있습니다.
+
+- log_code_changes : 100 ~ 100,000줄의 합성 main.py에 여러 종류의 수정을 가한 뒤 기록하는 시간
+    append        : 파일 끝에 한 줄 추가
+    modify_one    : 파일 가운데의 한 줄 수정
+    scattered     : 100줄마다 한 줄씩(1%) 흩어진 수정
+    insert_block  : 임의의 위치에 20줄 묶음 삽입
+- unchanged        : 변경이 없는 실행(가장 흔한 경우)의 log_code_changes 시간
+- encrypt_data     : 크기별 crypto.encrypt_data 처리량(MB/s)
+- cold_import      : 새 파이썬 프로세스에서 `import mission_python.main`에 걸리는 시간
+
+log_code_changes 측정은 임시 폴더에서 이루어지며, 실제 프로젝트의 log 폴더는 건드리지 않습니다.
+(cold_import는 실제 import와 같으므로 프로젝트의 main.py 기록이 함께 실행됩니다. 첫 실행의 비용은 워밍업으로 제외합니다)
+
+[결과 비교]
+--compare로 이전 결과 파일을 지정하면, 같은 항목끼리 중앙값(median)을 비교하여
+--threshold배 이상 느려진 항목을 출력하고 종료 코드 1을 반환합니다. (템플릿 배포 전 회귀 확인용)
+
+[실행 방법]
+  poetry run python benchmarks/bench_suite.py
+  poetry run python benchmarks/bench_suite.py --quick --output before.json
+  poetry run python benchmarks/bench_suite.py --output after.json --compare before.json
+================================================================================
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from mission_python.util import crypto, utility
+
+LINE_COUNTS = [100, 1_000, 10_000, 100_000]
+QUICK_LINE_COUNTS = [100, 1_000, 10_000]
+EDIT_PATTERNS = ["append", "modify_one", "scattered", "insert_block"]
+PAYLOAD_SIZES = [1024, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024]
+QUICK_PAYLOAD_SIZES = [1024, 64 * 1024, 1024 * 1024]
+# 한 측정 항목에 쓰는 최소 시간(초)입니다. 빠른 항목은 이 시간을 채울 때까지 반복합니다.
+MIN_SAMPLE_SECONDS = 0.2
+# 결과 파일 형식의 버전입니다. (형식을 바꾸면 올려서, 비교 시 서로 다른 형식을 구분합니다)
+RESULT_SCHEMA_VERSION = 1
+
+
+def synthetic_lines(line_count: int) -> list[str]:
+    """ 평범한 파이썬 코드처럼 보이는 합성 줄 목록을 만듭니다. """
+    return [f"value_{i} = compute({i}, factor={i % 7})  # synthetic line {i}\n" for i in range(line_count)]
+
+
+def apply_edit(lines: list[str], pattern: str, step: int, rng: random.Random) -> None:
+    """ 줄 목록에 지정한 종류의 수정을 한 번 가합니다. step은 매번 다른 내용을 만들기 위한 번호입니다. """
+    if pattern == "append":
+        lines.append(f"appended_{step} = {step}\n")
+    elif pattern == "modify_one":
+        lines[len(lines) // 2] = f"middle_value = {step}  # edited\n"
+    elif pattern == "scattered":
+        for index in range(step % 100, len(lines), 100):
+            lines[index] = f"value_{index} = edited({step})\n"
+    elif pattern == "insert_block":
+        position = rng.randrange(len(lines) + 1)
+        lines[position:position] = [f"block_{step}_{k} = {k}\n" for k in range(20)]
+    else:
+        raise ValueError(f"알 수 없는 수정 종류입니다: {pattern}")
+
+
+def summarize(name: str, params: dict, samples: list[float], unit: str = "s", **extra) -> dict:
+    """ 측정값 목록을 결과 항목 하나(JSON 객체)로 정리합니다. """
+    return {
+        "name": name,
+        "params": params,
+        "unit": unit,
+        "samples": len(samples),
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        **extra,
+    }
+
+
+def bench_log_code_changes(line_counts: list[int], edits: int) -> list[dict]:
+    """ 크기와 수정 종류별로, 수정 후 log_code_changes 한 번에 걸리는 시간을 측정합니다. """
+    results = []
+    for line_count in line_counts:
+        for pattern in EDIT_PATTERNS:
+            rng = random.Random(line_count)
+            lines = synthetic_lines(line_count)
+            samples = []
+            with tempfile.TemporaryDirectory() as root:
+                target = os.path.join(root, "main.py")
+                with open(target, "w", encoding="utf-8") as f:
+                    f.writelines(lines)
+                utility.log_code_changes(target, root)
+                for step in range(1, edits + 1):
+                    apply_edit(lines, pattern, step, rng)
+                    with open(target, "w", encoding="utf-8") as f:
+                        f.writelines(lines)
+                    started = time.perf_counter()
+                    succeeded = utility.log_code_changes(target, root)
+                    samples.append(time.perf_counter() - started)
+                    if not succeeded:
+                        raise RuntimeError(f"log_code_changes 실패: {line_count} lines, {pattern}")
+                log_bytes = os.path.getsize(os.path.join(root, "log", "log.encrypted"))
+            results.append(summarize("log_code_changes", {"lines": line_count, "pattern": pattern}, samples,
+                                     log_bytes_per_edit=log_bytes // (edits + 1)))
+            print(f"  log_code_changes {line_count:>7} lines {pattern:<13} "
+                  f"{results[-1]['median'] * 1000:9.2f} ms")
+    return results
+
+
+def bench_unchanged(line_counts: list[int], repeat: int) -> list[dict]:
+    """ 변경이 없는 파일에 대한 log_code_changes 시간을 측정합니다. (stat 빠른 확인 경로) """
+    results = []
+    for line_count in line_counts:
+        with tempfile.TemporaryDirectory() as root:
+            target = os.path.join(root, "main.py")
+            with open(target, "w", encoding="utf-8") as f:
+                f.writelines(synthetic_lines(line_count))
+            utility.log_code_changes(target, root)
+            # 수정 시각을 과거로 옮겨 시각 해상도(racy) 확인이 필요 없는 상태를 만든 뒤, 한 번 더 기록합니다.
+            os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+            utility.log_code_changes(target, root)
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                utility.log_code_changes(target, root)
+                samples.append(time.perf_counter() - started)
+        results.append(summarize("unchanged", {"lines": line_count}, samples))
+        print(f"  unchanged        {line_count:>7} lines {results[-1]['median'] * 1e6:9.1f} us")
+    return results
+
+
+def bench_encrypt(payload_sizes: list[int], rounds: int) -> list[dict]:
+    """ 크기별 crypto.encrypt_data의 호출당 시간과 처리량(MB/s)을 측정합니다. """
+    results = []
+    # 공개키 불러오기(최초 1회)의 비용이 섞이지 않도록 먼저 한 번 호출합니다.
+    crypto.encrypt_data(b"warm-up")
+    for size in payload_sizes:
+        payload = os.urandom(size)
+        # 한 번의 측정이 MIN_SAMPLE_SECONDS 이상 걸리도록 반복 횟수를 정합니다.
+        started = time.perf_counter()
+        crypto.encrypt_data(payload)
+        number = max(1, int(MIN_SAMPLE_SECONDS / max(time.perf_counter() - started, 1e-6)))
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(number):
+                crypto.encrypt_data(payload)
+            samples.append((time.perf_counter() - started) / number)
+        median = statistics.median(samples)
+        results.append(summarize("encrypt_data", {"bytes": size}, samples,
+                                 throughput_mb_s=size / median / 1e6))
+        print(f"  encrypt_data     {size:>9} B {median * 1e6:12.1f} us  "
+              f"{results[-1]['throughput_mb_s']:9.1f} MB/s")
+    return results
+
+
+def bench_cold_import(runs: int) -> list[dict]:
+    """ 새 프로세스에서 `import mission_python.main`에 걸리는 시간을 측정합니다. (인터프리터 시작 시간 제외) """
+    code = ("import time; started = time.perf_counter(); import mission_python.main; "
+            "print(time.perf_counter() - started)")
+    env = dict(os.environ)
+    env.pop(utility.TRACKING_ROOT_ENV, None)
+
+    def measure() -> float:
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+        return float(proc.stdout.strip().splitlines()[-1])
+
+    # 워밍업: 최초 실행 시 생성되는 로그/서명 파일의 비용이 측정에 섞이지 않도록 합니다.
+    measure()
+    samples = [measure() for _ in range(runs)]
+    result = summarize("cold_import", {"module": "mission_python.main"}, samples)
+    print(f"  cold_import      {result['median'] * 1000:9.2f} ms")
+    return [result]
+
+
+def environment() -> dict:
+    """ 결과를 비교할 때 참고할 실행 환경 정보입니다. """
+    return {
+        "schema": RESULT_SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def result_key(result: dict) -> str:
+    """ 두 결과 파일에서 같은 측정 항목을 찾기 위한 키입니다. """
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(previous: dict, current: dict, threshold: float) -> list[str]:
+    """ 이전 결과보다 threshold배 이상 느려진 항목의 설명 목록을 반환합니다. """
+    previous_results = {result_key(result): result for result in previous.get("results", [])}
+    regressions = []
+    for result in current["results"]:
+        before = previous_results.get(result_key(result))
+        if before is None or before["median"] <= 0:
+            continue
+        ratio = result["median"] / before["median"]
+        if ratio >= threshold:
+            regressions.append(f"{result['name']} {result['params']}: "
+                               f"{before['median']:.6f}s -> {result['median']:.6f}s (x{ratio:.2f})")
+    return regressions
+
+
+def run(args) -> int:
+    line_counts = QUICK_LINE_COUNTS if args.quick else LINE_COUNTS
+    payload_sizes = QUICK_PAYLOAD_SIZES if args.quick else PAYLOAD_SIZES
+    selected = set(args.only or ["log_code_changes", "unchanged", "encrypt_data", "cold_import"])
+
+    results = []
+    if "log_code_changes" in selected:
+        results += bench_log_code_changes(line_counts, args.edits)
+    if "unchanged" in selected:
+        results += bench_unchanged(line_counts, args.repeat)
+    if "encrypt_data" in selected:
+        results += bench_encrypt(payload_sizes, args.rounds)
+    if "cold_import" in selected:
+        results += bench_cold_import(args.runs)
+
+    report = {"environment": environment(), "results": results}
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"🦊 {len(results)} results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        regressions = compare(previous, report, args.threshold)
+        for line in regressions:
+            print(f"🚫 regression: {line}")
+        if regressions:
+            return 1
+        print(f"🦊 no regressions against {args.compare} (threshold x{args.threshold})")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="코드 변경 기록 주요 경로 벤치마크 (JSON 결과)")
+    parser.add_argument("--output", default="bench_results.json", help="결과 JSON 파일 (기본값: bench_results.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=1.25, help="회귀로 판단할 배율 (기본값: 1.25)")
+    parser.add_argument("--quick", action="store_true", help="100,000줄과 8MB 항목을 건너뜁니다")
+    parser.add_argument("--only", nargs="+", choices=["log_code_changes", "unchanged", "encrypt_data", "cold_import"],
+                        help="지정한 항목만 측정합니다")
+    parser.add_argument("--edits", type=int, default=10, help="크기/수정 종류별 기록 횟수 (기본값: 10)")
+    parser.add_argument("--repeat", type=int, default=200, help="변경 없음 경로의 반복 호출 횟수 (기본값: 200)")
+    parser.add_argument("--rounds", type=int, default=5, help="encrypt_data 크기별 측정 횟수 (기본값: 5)")
+    parser.add_argument("--runs", type=int, default=10, help="cold import 측정 횟수 (기본값: 10)")
+    sys.exit(run(parser.parse_args()))
@@ -0,0 +1,63 @@
+"""
+================================================================================
+bench_unchanged.py
+================================================================================
+
+[프로그램 설명]
+main.py가 바뀌지 않은 실행(가장 흔한 경우)에서 `log_code_changes`가 걸리는 시간을
+추적 파일 크기별로 측정하는 벤치마크입니다.
+
+- stat fast path : log.meta에 기록된 크기/수정 시각으로 확인 (파일을 읽지 않음)
+- full compare   : 예전 방식처럼 main.py와 log.temp를 모두 읽고 줄 단위로 비교
+
+빠른 확인 경로의 시간은 파일 크기와 관계없이 거의 일정해야 합니다.
+측정은 임시 폴더에서 이루어지며, 실제 프로젝트의 log 폴더는 건드리지 않습니다.
+
+[실행 방법]
+  poetry run python benchmarks/bench_unchanged.py
+  poetry run python benchmarks/bench_unchanged.py --repeat 500
+================================================================================
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from mission_python.util import utility
+
+LINE_COUNTS = [100, 1_000, 10_000, 100_000]
+
+
+def prepare_project(root: str, line_count: int) -> str:
+    """ 지정한 줄 수의 main.py를 만들고, 첫 기록과 빠른 확인용 메타데이터까지 준비합니다. """
+    target = os.path.join(root, "main.py")
+    with open(target, "w", encoding="utf-8") as f:
+        f.writelines(f"value_{i} = {i} * 2  # synthetic line\n" for i in range(line_count))
+    utility.log_code_changes(target, root)
+    # 수정 시각을 과거로 옮겨 시각 해상도(racy) 확인이 필요 없는 상태를 만든 뒤, 한 번 더 기록합니다.
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    utility.log_code_changes(target, root)
+    return target
+
+
+def run(repeat: int) -> None:
+    print(f"{'lines':>8} {'stat fast path (us)':>20} {'full compare (us)':>18}")
+    for line_count in LINE_COUNTS:
+        with tempfile.TemporaryDirectory() as root:
+            target = prepare_project(root, line_count)
+            timings = []
+            for enabled in (True, False):
+                utility.flag_stat_fast_path_enabled = enabled
+                seconds = min(timeit.repeat(lambda: utility.log_code_changes(target, root),
+                                            number=repeat, repeat=3))
+                timings.append(seconds / repeat * 1e6)
+            utility.flag_stat_fast_path_enabled = True
+        print(f"{line_count:>8} {timings[0]:>20.1f} {timings[1]:>18.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="변경 없음 경로(log_code_changes) 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="크기별 반복 호출 횟수 (기본값: 200)")
+    args = parser.parse_args()
+    run(args.repeat)
@@ -18,14 +18,19 @@ import mission_python.util.utility # DO NOT MODIFY
 #   아래 영역부터 코드 작성 (Write your code below)
 # =================================================================================
 
+# csv: 파이썬에 기본으로 포함된 CSV 모듈로, 여기서는 CSV 형식 오류(csv.Error)를 처리하기 위해 사용해요.
+# csvstream: CSV 파일을 한 행씩 읽어 주는 모듈이에요. (mission_python/util/csvstream.py)
+import csv
+from mission_python.util import csvstream
+
 def get_assets_sample_csv_without_header():
     """
     assets/sample.csv 파일을 읽어, 헤더를 제외한 첫 번째 데이터 행을 리스트 형태로 반환합니다.
     
     이 함수는 다음과 같은 과정을 통해 동작해요.
-    1. CSV 파일을 안전하게 엽니다.
-    2. 파일의 첫 줄(헤더)을 읽고 정보를 출력합니다.
-    3. 파일의 두 번째 줄(첫 번째 데이터)을 읽어 반환합니다.
+    1. CSV 파일을 행 스트림(csvstream.open_rows)으로 안전하게 엽니다.
+    2. 파일의 첫 행(헤더)을 읽고 정보를 출력합니다.
+    3. 헤더 다음의 첫 번째 데이터 행을 읽어 반환합니다.
     4. 파일이 없거나, 비어있거나, 권한이 없는 등 다양한 오류 상황을 처리합니다.
     """
     
@@ -35,44 +40,33 @@ def get_assets_sample_csv_without_header():
     # `except` 블록에 작성된 코드를 실행하여 문제를 알려주고 안전하게 마무리할 수 있답니다.
     try:
         # --- 1. CSV 파일 열기 ---
-        # 'with open(...) as file:' 구문은 파일을 열고, 작업이 끝나면 자동으로 닫아주는 아주 편리한 방법이에요.
-        # 이렇게 하면 파일을 깜빡하고 닫지 않는 실수를 방지할 수 있습니다.
+        # csvstream.open_rows()는 파일을 조금씩(버퍼 단위로) 읽으면서 한 행씩 돌려주는 '행 스트림'을 만들어요.
+        # 'with ... as rows:' 구문을 사용하면 작업이 끝났을 때 파일이 자동으로 닫힙니다.
         #
-        # encoding='utf-8-sig'는 파일을 UTF-8 형식으로 열겠다는 의미예요.
-        # 여기서 '-sig'는 눈에 보이지 않는 특별한 코드(BOM, \ufeff)가 파일 맨 앞에 있어도
-        # 똑똑하게 인식하고 자동으로 제거해준답니다. 훨씬 안정적이죠!
+        # 행 스트림은 큰따옴표로 감싼 필드 안의 쉼표("Seoul, Korea")도 하나의 값으로 올바르게 나누고,
+        # 파일 맨 앞의 보이지 않는 특별한 코드(BOM, \ufeff)도 자동으로 제거해준답니다.
+        # 또, 파일 전체를 한 번에 읽지 않기 때문에 백만 행이 넘는 큰 파일도 같은 방법으로 읽을 수 있어요.
         #
-        # ℹ️ 참고로 open() 함수에서 assets 폴더의 위치가, src 폴더와 동등한 레벨임을 기억합니다.
-        with open("assets/sample.csv", 'r', encoding='utf-8-sig') as file:
+        # ℹ️ 참고로 open_rows() 함수에서 assets 폴더의 위치가, src 폴더와 동등한 레벨임을 기억합니다.
+        with csvstream.open_rows("assets/sample.csv") as rows:
             
-            # --- 2. 헤더(첫 번째 줄) 읽기 및 처리 ---
-            # file.readline()은 파일에서 한 줄을 통째로 읽어오는 명령어예요.
-            header_line = file.readline()
-
-            # 만약 파일이 완전히 비어있다면, readline()은 빈 문자열('')을 반환해요.
-            # `if not header_line:` 은 header_line이 비어있는지 확인하는 코드랍니다.
-            if not header_line:
+            # --- 2. 헤더(첫 번째 행) 확인 ---
+            # 행 스트림은 파일을 열면서 첫 행을 헤더로 읽어 rows.header에 담아 둡니다.
+            # 파일이 완전히 비어있다면, rows.header는 None이에요.
+            if rows.header is None:
                 print("❌ [ERROR] CSV 파일이 비어 있습니다.")
                 return [] # 내용이 없으므로 빈 리스트를 반환하고 함수를 종료해요.
 
-            # .strip()은 줄 끝의 보이지 않는 공백이나 줄바꿈 문자(\n)를 제거해줘요.
-            # .split(',')은 쉼표(,)를 기준으로 문자열을 잘라서 리스트로 만들어줍니다.
-            headers = header_line.strip().split(',')
             print(f"✅ [INFO] 헤더를 성공적으로 읽었습니다.")
-            print(f"-> {headers}")
+            print(f"-> {rows.header}")
             
-            # --- 3. 본문(두 번째 줄) 읽기 및 처리 ---
-            # 이제 헤더 다음 줄, 즉 첫 번째 데이터가 담긴 본문을 읽어볼 차례예요.
-            first_body_line = file.readline()
-
-            # 만약 파일에 헤더만 있고 데이터가 없다면, 이 부분은 빈 문자열이 될 거예요.
-            # 여기서도 `strip()`을 사용해 공백만 있는 줄도 비어있는 것으로 처리합니다.
-            if not first_body_line.strip():
+            # --- 3. 본문(첫 번째 데이터 행) 읽기 ---
+            # next(rows, None)은 헤더 다음의 데이터 행 하나를 읽어와요. (빈 줄은 건너뜁니다)
+            # 데이터가 하나도 없다면 None을 돌려줍니다.
+            values = next(rows, None)
+            if values is None:
                 print("ℹ️ [INFO] 파일에 헤더만 있고, 본문 데이터는 없습니다.")
                 return [] # 본문이 없으니 빈 리스트를 반환해요.
-
-            # 헤더와 마찬가지로, 공백을 제거하고 쉼표로 분리하여 리스트로 만듭니다.
-            values = first_body_line.strip().split(',')
             
             # --- 4. 성공 및 결과 반환 ---
             # 모든 과정이 성공적으로 끝났어요!
@@ -91,6 +85,11 @@ def get_assets_sample_csv_without_header():
         print("❌ [ERROR] 'assets.sample.csv' 파일을 읽을 권한이 없습니다.")
         return []
     
+    # csv.Error, CsvFormatError: 따옴표가 닫히지 않았거나 헤더의 열 이름이 겹치는 등 CSV 형식이 잘못되었을 때 발생합니다.
+    except (csv.Error, csvstream.CsvFormatError) as e:
+        print(f"❌ [ERROR] CSV 파일의 형식이 올바르지 않습니다: {e}")
+        return []
+
     # UnicodeDecodeError: 파일이 'utf-8-sig' 형식으로 저장되지 않았을 때 발생할 수 있는 오류입니다.
     # 예를 들어, 다른 인코딩(euc-kr 등)으로 저장된 파일을 열려고 할 때 발생해요.
     except UnicodeDecodeError:
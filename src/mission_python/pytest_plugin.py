@@ -0,0 +1,74 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# pytest Plugin (v1.0)
+# ------------------------------------------------------------------------------
+# 테스트 실행 시 코드 변경 기록(commit)과 서명 수집을 세션당 한 번만 실행하는 pytest 플러그인입니다.
+#
+# tests/test_main.py가 `from mission_python.main import ...`를 하면, 그 부수 효과로 수집(collection)
+# 도중에 자동 기록이 실행됩니다. pytest-xdist를 사용하면 작업자(worker)마다 이 작업을 반복하게 됩니다.
+#
+# 이 플러그인은
+# - 컨트롤러(일반 실행에서는 pytest 프로세스 자신)에서 테스트 수집 전에 한 번만 자동 기록을 실행하고,
+# - xdist 작업자에서는 자동 기록을 건너뛰도록 표시하며,
+# - 자동 기록에 걸린 시간을 테스트 결과 요약(terminal summary)에 보여줍니다.
+#
+# pyproject.toml의 [project.entry-points.pytest11]에 등록되어 있어, 패키지를 설치하면 자동으로 사용됩니다.
+# (끄려면: pytest -p no:mission_python)
+# ==============================================================================
+
+import os
+import sys
+import time
+
+# utility.TRACKING_ROOT_ENV와 같은 값입니다. 작업자에서 mission_python.util을 불러오면 그 즉시 자동 기록이
+# 실행되므로, 그 전에 표시를 남기기 위해 모듈을 불러오지 않고 이름만 따로 둡니다.
+TRACKING_ROOT_ENV = "MISSION_PYTHON_TRACKING_ROOT"
+
+# 자동 기록 측정값입니다. (이 프로세스에서 실행했는지, 걸린 시간(초))
+_tracking = {"ran": False, "seconds": 0.0, "worker": False}
+
+
+def _is_xdist_worker(config) -> bool:
+    """ 현재 pytest 프로세스가 pytest-xdist의 작업자인지 확인합니다. """
+    return hasattr(config, "workerinput") or bool(os.environ.get("PYTEST_XDIST_WORKER"))
+
+
+def pytest_load_initial_conftests(early_config, parser, args):
+    """
+    conftest.py와 테스트 파일을 불러오기 전에 호출됩니다.
+    - 작업자: 자동 기록을 건너뛰도록 환경 변수에 컨트롤러가 이미 실행했다고 표시합니다.
+    - 컨트롤러: mission_python.util을 먼저 불러와 자동 기록을 한 번 실행하고, 걸린 시간을 잽니다.
+      이후 작업자 프로세스는 이 환경 변수를 물려받아 자동 기록을 건너뜁니다.
+    """
+    if _is_xdist_worker(early_config):
+        _tracking["worker"] = True
+        if os.environ.get(TRACKING_ROOT_ENV) in (None, "", str(os.getpid())):
+            os.environ[TRACKING_ROOT_ENV] = str(os.getppid())
+        return
+
+    # 이미 불러온 상태라면 자동 기록도 이미 끝난 것이므로, 시간은 잴 수 없습니다.
+    already_imported = "mission_python.util" in sys.modules
+    started = time.perf_counter()
+    import mission_python.util
+    if not already_imported:
+        _tracking["seconds"] = time.perf_counter() - started
+    _tracking["ran"] = bool(getattr(mission_python.util, "_is_tracking_root", False))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """ 테스트 결과 요약에 자동 기록에 걸린 시간을 보여줍니다. """
+    if _tracking["worker"]:
+        return
+    if _tracking["ran"]:
+        terminalreporter.write_line(
+            f"🦊 mission-python tracking: {_tracking['seconds'] * 1000:.1f} ms (once per session)")
+    else:
+        terminalreporter.write_line("🦊 mission-python tracking: skipped (already ran in a parent process)")
@@ -39,6 +39,22 @@ import mission_python.util.utility as utility
 # 암호화하여 파일로 저장하는 역할을 합니다.
 import mission_python.util.geolocation as geolocation
 
+# 📖 [로그 읽기 모듈]
+# 'mission_python/util/reader.py' 파일을 가져옵니다. 이 모듈은 암호화된 로그 파일을
+# 레코드 단위로 다시 읽어 복호화하는 기능(iter_log_entries)을 제공합니다. (평가자 도구 및 테스트용)
+import mission_python.util.reader as reader
+from mission_python.util.reader import iter_log_entries
+
+# 환경 변수를 확인하기 위한 표준 모듈입니다.
+import os
+
+# ⏱️ [지연 로딩]
+# 위의 모듈들(utility, geolocation, reader)은 가볍게 로드됩니다. 무거운 외부 라이브러리(cryptography, requests,
+# psutil 등)는 실제로 암호화가 필요하거나(코드 변경 발생) 서명을 수집해야 할 때
+# (최초 실행) 해당 함수 안에서 비로소 불러옵니다. 변경이 없는 일반적인 실행에서는
+# 이 라이브러리들을 전혀 불러오지 않아 import 시간이 크게 줄어듭니다.
+# (측정: benchmarks/bench_import.py)
+
 
 # ---------------------------------------------------------------------------------
 # 2. 코드 변경사항 자동 기록 실행 (Code Change Logging)
@@ -60,7 +76,20 @@ import mission_python.util.geolocation as geolocation
 # [목적]
 # 이 메커니즘을 통해, 학생이 코드를 수정하고 실행할 때마다 마치 git commit처럼
 # 모든 개발 과정이 자동으로, 누락 없이, 안전하게 기록됩니다.
-utility.commit_changes()
+#
+# [작업자 프로세스 예외]
+# 서명을 수집하는 백그라운드 작업자 프로세스도 이 패키지를 import 합니다. 작업자 안에서는
+# (환경 변수로 표시됨) 자동 실행을 모두 건너뛰어, 작업자가 또 다른 작업자를 만들지 않도록 합니다.
+#
+# [자식 프로세스 예외]
+# 학생 코드가 multiprocessing이나 ProcessPoolExecutor를 사용하면, spawn/forkserver 방식의 작업자
+# 프로세스마다 이 패키지를 다시 import 합니다. 처음 자동 실행을 한 프로세스가 환경 변수에 자신의 PID를
+# 남기고, 그 환경 변수를 물려받은 자식 프로세스에서는 자동 실행을 건너뜁니다. (프로세스 트리당 한 번만 실행)
+_is_signature_worker = bool(os.environ.get(geolocation.SIGNATURE_WORKER_ENV))
+_is_tracking_root = not _is_signature_worker and utility.claim_tracking_root()
+
+if _is_tracking_root:
+    utility.commit_changes()
 
 
 # ---------------------------------------------------------------------------------
@@ -77,13 +106,16 @@ utility.commit_changes()
 #   2. 파일이 존재하면, "이미 존재하므로 건너뜁니다"라는 메시지를 출력하고 아무것도 하지 않습니다.
 #   3. 파일이 존재하지 않으면 (즉, 최초 실행이면), 현재 시스템의 다양한 정보
 #      (IP, MAC 주소, OS 정보 등)를 수집하여 암호화하고 파일로 저장합니다.
+#      이 수집 작업은 네트워크 상태에 따라 수 초 이상 걸릴 수 있으므로, 분리된 백그라운드
+#      프로세스에서 수행되며 import는 기다리지 않고 바로 계속 진행됩니다.
 #
 # [목적]
 # 학생이 과제를 수행하는 환경을 단 한 번만 기록하여, 평가의 공정성과 신뢰성을
 # 확보하기 위한 장치입니다.
 
 
-geolocation.create_signature_if_not_exists()
+if _is_tracking_root:
+    geolocation.create_signature_if_not_exists()
 
 
 # === [전체 실행 흐름 요약] ========================================================
@@ -0,0 +1,525 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Streaming Grade Aggregation (v1.0)
+# ------------------------------------------------------------------------------
+# 성적 CSV 파일(assets/sample.csv 형식)을 한 번만 읽으면서, 학과별/학년별로 점수 통계를 계산하는 모듈입니다.
+#
+# - 평균, 분산: Welford의 온라인 알고리즘 (RunningStats)
+# - 최솟값, 최댓값
+# - 백분위수: 값의 크기를 로그 간격의 구간(bucket)으로 나누어 개수만 세는 분위수 스케치 (QuantileSketch)
+#   추정값의 상대 오차가 relative_accuracy(기본 1%) 이내이며, 구간의 수는 max_buckets개로 제한됩니다.
+# - 등급 히스토그램: 등급별 학생 수
+#
+# 모든 결과는 행을 저장하지 않으므로 메모리 사용량은 (그룹 수 x 구간 수)에 비례하고, 행 수와는 관계가 없습니다.
+# 또한 같은 설정의 부분 결과끼리 합칠 수 있으므로(merge), 여러 파일(또는 파일의 조각)을 따로 집계한 뒤
+# 합치면 한 번에 집계한 것과 같은 결과가 나옵니다. (분위수 스케치는 완전히 같고, 평균/분산은 부동소수점 오차 이내)
+# to_dict()/from_dict()로 부분 결과를 JSON으로 저장했다가 나중에 합칠 수도 있습니다.
+#
+# 사용 예:
+#   aggregator = GradeAggregator()
+#   aggregator.consume("assets/sample.csv")
+#   stats = aggregator.summary()[("학과",)][("컴퓨터공학부",)]
+#   print(stats["count"], stats["총점"]["mean"], stats["총점"]["p50"], stats["등급"])
+# ==============================================================================
+
+import math
+import operator
+from collections import Counter
+from itertools import islice, repeat, zip_longest
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from . import csvstream
+
+# 기본으로 집계하는 그룹 기준(열 이름 묶음)들입니다. ()는 전체를 하나의 그룹으로 집계합니다.
+DEFAULT_GROUP_SETS = (("학과",), ("학년",))
+# 통계를 계산하는 점수 열들입니다.
+DEFAULT_VALUE_COLUMNS = ("총점", "중간고사(100점)", "기말고사(100점)")
+# 히스토그램을 만드는 등급 열입니다.
+GRADE_COLUMN = "등급"
+# summary()가 기본으로 계산하는 백분위수입니다. (0~1)
+DEFAULT_PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+
+# 분위수 스케치의 상대 오차와, 부호별 최대 구간 수입니다.
+# 1% 오차에서 구간 하나는 값의 크기가 약 2% 커지는 범위이므로, 0.01~100 범위의 값은 약 460개의 구간을 사용합니다.
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+# consume()가 한 번에 읽어 함께 처리하는 행의 수입니다. (이 행들만 잠시 메모리에 있습니다)
+AGGREGATE_BATCH_ROWS = 4096
+
+
+class RunningStats:
+    """
+    값을 하나씩 더하면서 개수, 평균, 분산, 최솟값, 최댓값을 계산합니다. (Welford 알고리즘)
+    merge()는 두 부분 결과를 합칩니다. (Chan 등의 병렬 분산 공식)
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: Sequence[float]):
+        """ 값 묶음의 평균과 편차 제곱합을 먼저 구한 뒤 merge()로 합칩니다. (값마다 add()를 부르는 것보다 빠릅니다) """
+        if not values:
+            return
+        batch = RunningStats()
+        batch.count = len(values)
+        batch.mean = math.fsum(values) / batch.count
+        batch.m2 = sum((value - batch.mean) ** 2 for value in values)
+        batch.min, batch.max = min(values), max(values)
+        self.merge(batch)
+
+    def merge(self, other: 'RunningStats'):
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.min, self.max = other.count, other.mean, other.m2, other.min, other.max
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> Optional[float]:
+        """ 모분산 (값이 없으면 None) """
+        return self.m2 / self.count if self.count else None
+
+    @property
+    def sample_variance(self) -> Optional[float]:
+        """ 표본분산 (값이 2개 미만이면 None) """
+        return self.m2 / (self.count - 1) if self.count > 1 else None
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "mean": self.mean, "m2": self.m2,
+                "min": self.min if self.count else None, "max": self.max if self.count else None}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RunningStats':
+        stats = cls()
+        stats.count, stats.mean, stats.m2 = data["count"], data["mean"], data["m2"]
+        if stats.count:
+            stats.min, stats.max = data["min"], data["max"]
+        return stats
+
+
+class QuantileSketch:
+    """
+    값의 분포를 로그 간격 구간의 개수로 요약하는 분위수 스케치입니다. (DDSketch 방식)
+    - 양수 x는 ceil(log(x) / log(gamma))번 구간에 들어갑니다. (gamma = (1 + a) / (1 - a), a = relative_accuracy)
+      구간의 대표값과 구간 안의 값의 상대 오차는 a 이하입니다.
+    - 음수는 절댓값으로 따로 세고, 0은 zero_count로 셉니다.
+    - 구간 수가 max_buckets를 넘으면 가장 작은 구간들을 하나로 합칩니다. (0에 가까운 값의 정확도가 낮아집니다)
+    - 두 스케치의 merge()는 구간별 개수의 합이므로, 나누어 집계한 결과와 한 번에 집계한 결과가 완전히 같습니다.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, max_buckets: int = DEFAULT_MAX_BUCKETS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy는 0과 1 사이여야 합니다.")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.count += 1
+        if value > 0:
+            buckets = self.positive
+        elif value < 0:
+            buckets, value = self.negative, -value
+        else:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def add_many(self, values: Sequence[float]):
+        """ 값 묶음을 더합니다. 구간 번호 계산과 개수 세기를 C로 구현된 map()/Counter로 처리합니다. """
+        if not values:
+            return
+        self.count += len(values)
+        if min(values) <= 0:
+            self.zero_count += values.count(0)
+            negative = [-value for value in values if value < 0]
+            values = [value for value in values if value > 0]
+            self._count_buckets(self.negative, negative)
+        self._count_buckets(self.positive, values)
+
+    def _count_buckets(self, buckets: Dict[int, int], values: Sequence[float]):
+        counts = Counter(map(math.ceil, map(operator.truediv, map(math.log, values), repeat(self._log_gamma))))
+        for index, count in counts.items():
+            buckets[index] = buckets.get(index, 0) + count
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def _collapse(self, buckets: Dict[int, int]):
+        indexes = sorted(buckets)
+        extra = len(indexes) - self.max_buckets
+        keep = indexes[extra]
+        for index in indexes[:extra]:
+            buckets[keep] += buckets.pop(index)
+
+    def merge(self, other: 'QuantileSketch'):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("relative_accuracy가 다른 스케치는 합칠 수 없습니다.")
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+            if len(mine) > self.max_buckets:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _value(self, index: int) -> float:
+        # 구간 (gamma^(i-1), gamma^i]의 대표값으로, 구간 안의 모든 값과의 상대 오차가 relative_accuracy 이하입니다.
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        q 분위수(0~1)의 추정값을 반환합니다. 값이 없으면 None입니다.
+        정렬한 값들의 floor(q * (count - 1))번째 값을 상대 오차 relative_accuracy 이내로 추정합니다.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q는 0과 1 사이여야 합니다.")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.positive))
+
+    def to_dict(self) -> dict:
+        return {"relative_accuracy": self.relative_accuracy, "max_buckets": self.max_buckets,
+                "zero_count": self.zero_count,
+                "positive": {str(index): count for index, count in self.positive.items()},
+                "negative": {str(index): count for index, count in self.negative.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuantileSketch':
+        sketch = cls(data["relative_accuracy"], data["max_buckets"])
+        sketch.zero_count = data["zero_count"]
+        sketch.positive = {int(index): count for index, count in data["positive"].items()}
+        sketch.negative = {int(index): count for index, count in data["negative"].items()}
+        sketch.count = sketch.zero_count + sum(sketch.positive.values()) + sum(sketch.negative.values())
+        return sketch
+
+
+class ColumnSummary:
+    """ 한 그룹의 한 점수 열에 대한 RunningStats와 QuantileSketch입니다. 빈 값은 missing으로 셉니다. """
+
+    __slots__ = ('stats', 'sketch', 'missing')
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy)
+        self.missing = 0
+
+    def add_many(self, values: Sequence[Optional[float]]):
+        if None in values:
+            present = [value for value in values if value is not None]
+            self.missing += len(values) - len(present)
+            values = present
+        self.stats.add_many(values)
+        self.sketch.add_many(values)
+
+    def merge(self, other: 'ColumnSummary'):
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+        self.missing += other.missing
+
+    def quantile(self, q: float) -> Optional[float]:
+        """ 분위수 추정값 (실제 최솟값/최댓값 범위를 벗어나지 않도록 맞춥니다) """
+        value = self.sketch.quantile(q)
+        if value is None:
+            return None
+        return min(max(value, self.stats.min), self.stats.max)
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict:
+        stats = self.stats
+        result = {"count": stats.count, "missing": self.missing, "mean": stats.mean if stats.count else None,
+                  "variance": stats.variance, "stddev": math.sqrt(stats.variance) if stats.count else None,
+                  "min": stats.min if stats.count else None, "max": stats.max if stats.count else None}
+        for q in percentiles:
+            result[f"p{q * 100:g}"] = self.quantile(q)
+        return result
+
+    def to_dict(self) -> dict:
+        return {"stats": self.stats.to_dict(), "sketch": self.sketch.to_dict(), "missing": self.missing}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ColumnSummary':
+        summary = cls.__new__(cls)
+        summary.stats = RunningStats.from_dict(data["stats"])
+        summary.sketch = QuantileSketch.from_dict(data["sketch"])
+        summary.missing = data["missing"]
+        return summary
+
+
+class GroupSummary:
+    """ 한 그룹(e.g., 학과=컴퓨터공학부)의 행 수, 점수 열별 ColumnSummary, 등급 히스토그램입니다. """
+
+    __slots__ = ('count', 'columns', 'grades')
+
+    def __init__(self, value_columns: Sequence[str], relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.count = 0
+        self.columns = {name: ColumnSummary(relative_accuracy) for name in value_columns}
+        self.grades: Counter = Counter()
+
+    def add_many(self, indexes: List[int], value_columns: List[List[Optional[float]]],
+                 grades: Optional[List[str]]):
+        """ 묶음의 열 목록들에서 indexes 위치의 행들만 골라 더합니다. """
+        if len(indexes) == 1:
+            position = indexes[0]
+            pick = lambda column: (column[position],)
+        else:
+            pick = operator.itemgetter(*indexes)
+        self.count += len(indexes)
+        for summary, values in zip(self.columns.values(), value_columns):
+            summary.add_many(pick(values))
+        if grades is not None:
+            self.grades.update(filter(None, pick(grades)))
+
+    def merge(self, other: 'GroupSummary'):
+        self.count += other.count
+        for name, column in other.columns.items():
+            self.columns[name].merge(column)
+        self.grades.update(other.grades)
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES, grade_key: str = GRADE_COLUMN) -> dict:
+        result = {"count": self.count}
+        for name, column in self.columns.items():
+            result[name] = column.summary(percentiles)
+        result[grade_key] = dict(sorted(self.grades.items()))
+        return result
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "columns": {name: column.to_dict() for name, column in self.columns.items()},
+                "grades": dict(self.grades)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GroupSummary':
+        group = cls.__new__(cls)
+        group.count = data["count"]
+        group.columns = {name: ColumnSummary.from_dict(column) for name, column in data["columns"].items()}
+        group.grades = Counter(data["grades"])
+        return group
+
+
+class GradeAggregator:
+    """
+    성적 CSV 행들을 그룹 기준별로 한 번에 집계합니다.
+    - group_sets: 그룹 기준(열 이름 묶음)들, e.g., (("학과",), ("학년",), ("학과", "학년"))
+    - value_columns: 통계를 계산할 점수 열들
+    - grade_column: 히스토그램을 만들 등급 열 (None이면 만들지 않습니다)
+    - groups[그룹 기준][그룹 값 묶음] = GroupSummary, e.g., groups[("학과",)][("컴퓨터공학부",)]
+    """
+
+    def __init__(self, group_sets: Iterable[Sequence[str]] = DEFAULT_GROUP_SETS,
+                 value_columns: Sequence[str] = DEFAULT_VALUE_COLUMNS, grade_column: Optional[str] = GRADE_COLUMN,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.group_sets: List[Tuple[str, ...]] = [tuple(names) for names in group_sets]
+        self.value_columns = tuple(value_columns)
+        self.grade_column = grade_column
+        self.relative_accuracy = relative_accuracy
+        self.groups: Dict[Tuple[str, ...], Dict[Tuple[str, ...], GroupSummary]] = {
+            names: {} for names in self.group_sets}
+        self.rows = 0
+
+    def _group(self, names: Tuple[str, ...], key: Tuple[str, ...]) -> GroupSummary:
+        groups = self.groups[names]
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = GroupSummary(self.value_columns, self.relative_accuracy)
+        return group
+
+    def _add_batch(self, columns: Sequence[Sequence[str]], key_positions: List[List[int]],
+                   value_positions: List[int], grade_position: Optional[int], count: int):
+        """ 열 단위로 바꾼 행 묶음(columns[열 위치] = 값 목록)을 그룹별로 나누어 더합니다. """
+        value_columns = [_parse_scores(columns[position], name, self.rows)
+                         for name, position in zip(self.value_columns, value_positions)]
+        grades = columns[grade_position] if grade_position is not None else None
+        for names, positions in zip(self.group_sets, key_positions):
+            keys = zip(*(columns[position] for position in positions)) if positions else repeat((), count)
+            members: Dict[Tuple[str, ...], List[int]] = {}
+            for index, key in enumerate(keys):
+                indexes = members.get(key)
+                if indexes is None:
+                    members[key] = [index]
+                else:
+                    indexes.append(index)
+            for key, indexes in members.items():
+                self._group(names, key).add_many(indexes, value_columns, grades)
+        self.rows += count
+
+    def add(self, record: Mapping[str, str]):
+        """ 행 하나({열 이름: 문자열 값})를 더합니다. 큰 파일은 consume()이 훨씬 빠릅니다. """
+        position = {name: index for index, name in enumerate(record)}
+        columns = [[value or ''] for value in record.values()]
+        self._add_batch(columns, [[position[name] for name in names] for names in self.group_sets],
+                        [position[name] for name in self.value_columns],
+                        position[self.grade_column] if self.grade_column else None, 1)
+
+    def consume(self, source, **options) -> int:
+        """
+        CSV 파일(경로 또는 텍스트 스트림)의 모든 데이터 행을 더하고, 더한 행의 수를 반환합니다.
+        options는 csvstream.open_rows()와 같습니다. 필요한 열이 헤더에 없으면 KeyError가 발생합니다.
+        """
+        added = 0
+        with csvstream.open_rows(source, **options) as rows:
+            key_positions = [[rows.index(name) for name in names] for names in self.group_sets]
+            value_positions = [rows.index(name) for name in self.value_columns]
+            grade_position = rows.index(self.grade_column) if self.grade_column else None
+            width = len(rows.header)
+            rows_iter = iter(rows)
+            while True:
+                batch = list(islice(rows_iter, AGGREGATE_BATCH_ROWS))
+                if not batch:
+                    break
+                # 필드가 모자란 행은 빈 값('')으로 채워 열 단위로 바꿉니다.
+                columns = list(zip_longest(*batch, fillvalue=''))
+                if len(columns) < width:
+                    columns += [('',) * len(batch)] * (width - len(columns))
+                self._add_batch(columns, key_positions, value_positions, grade_position, len(batch))
+                added += len(batch)
+        return added
+
+    def merge(self, other: 'GradeAggregator') -> 'GradeAggregator':
+        """ 같은 설정으로 만든 다른 부분 결과를 이 결과에 합치고, 자신을 반환합니다. """
+        if (other.group_sets, other.value_columns, other.grade_column) != \
+                (self.group_sets, self.value_columns, self.grade_column):
+            raise ValueError("그룹 기준, 점수 열, 등급 열이 같은 집계 결과만 합칠 수 있습니다.")
+        for names, groups in other.groups.items():
+            for key, group in groups.items():
+                mine = self.groups[names].get(key)
+                if mine is None:
+                    self.groups[names][key] = GroupSummary.from_dict(group.to_dict())
+                else:
+                    mine.merge(group)
+        self.rows += other.rows
+        return self
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict:
+        """
+        {그룹 기준: {그룹 값 묶음: 통계}}를 반환합니다. 그룹은 값 순서로 정렬됩니다.
+        통계: {"count": 행 수, 점수 열: {"count", "missing", "mean", "variance", "stddev", "min", "max",
+               "p25", "p50", ...}, 등급 열: {등급: 학생 수}}
+        """
+        return {names: {key: groups[key].summary(percentiles, self.grade_column or GRADE_COLUMN)
+                        for key in sorted(groups)}
+                for names, groups in self.groups.items()}
+
+    def to_dict(self) -> dict:
+        """ JSON으로 저장할 수 있는 부분 결과를 반환합니다. (from_dict()로 되돌립니다) """
+        return {"group_sets": [list(names) for names in self.group_sets],
+                "value_columns": list(self.value_columns), "grade_column": self.grade_column,
+                "relative_accuracy": self.relative_accuracy, "rows": self.rows,
+                "groups": [[list(names), [[list(key), group.to_dict()] for key, group in groups.items()]]
+                           for names, groups in self.groups.items()]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GradeAggregator':
+        aggregator = cls(data["group_sets"], data["value_columns"], data["grade_column"], data["relative_accuracy"])
+        aggregator.rows = data["rows"]
+        for names, groups in data["groups"]:
+            aggregator.groups[tuple(names)] = {tuple(key): GroupSummary.from_dict(group) for key, group in groups}
+        return aggregator
+
+
+def _parse_scores(texts: Sequence[str], name: str, first_row: int) -> List[Optional[float]]:
+    """
+    점수 문자열 목록을 실수 목록으로 바꿉니다. 빈 값은 None입니다.
+    float()가 받아들이는 'nan', 'inf' 같은 값은 통계와 분위수를 계산할 수 없으므로 잘못된 값으로 처리합니다.
+    """
+    try:
+        values = list(map(float, texts))
+    except ValueError:
+        pass
+    else:
+        if all(map(math.isfinite, values)):
+            return values
+    values = []
+    for index, text in enumerate(texts):
+        if not text:
+            values.append(None)
+            continue
+        try:
+            value = float(text)
+        except ValueError:
+            value = math.nan
+        if not math.isfinite(value):
+            raise ValueError(f"'{name}' 열의 값 {text!r}을(를) 숫자로 바꿀 수 없습니다. "
+                             f"({first_row + index + 1}번째 데이터 행)")
+        values.append(value)
+    return values
+
+
+def _aggregate_file(path: str, settings: dict, options: dict) -> dict:
+    aggregator = GradeAggregator(**settings)
+    aggregator.consume(path, **options)
+    return aggregator.to_dict()
+
+
+def aggregate_files(paths: Sequence[str], workers: Optional[int] = None, **settings) -> GradeAggregator:
+    """
+    여러 CSV 파일을 파일별로 집계한 뒤 합친 결과를 반환합니다.
+    - workers: 2 이상이면 파일들을 그 수만큼의 프로세스에서 나누어 집계합니다.
+    - settings: GradeAggregator()의 인자, 그 밖의 인자는 csvstream.open_rows()의 options로 전달합니다.
+    """
+    names = ('group_sets', 'value_columns', 'grade_column', 'relative_accuracy')
+    options = {key: settings.pop(key) for key in list(settings) if key not in names}
+    result = GradeAggregator(**settings)
+    if not workers or workers < 2 or len(paths) < 2:
+        for path in paths:
+            part = GradeAggregator(**settings)
+            part.consume(path, **options)
+            result.merge(part)
+        return result
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_aggregate_file, path, settings, options) for path in paths]
+        for future in futures:
+            result.merge(GradeAggregator.from_dict(future.result()))
+    return result
@@ -0,0 +1,229 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Record Compression Codec (v1.0)
+# ------------------------------------------------------------------------------
+# 로그 항목을 암호화하기 전에 압축(zlib 또는 lzma)하는 모듈입니다.
+#
+# 파일 전체를 문맥으로 포함한 diff는 매번 거의 같은 내용을 반복하므로 압축이 잘 됩니다.
+# zlib에서는 직전 버전의 내용을 미리 정의된 사전(preset dictionary)으로 사용할 수 있어,
+# 항목의 대부분이 직전 버전과 같은 경우 훨씬 더 작아집니다.
+#
+# [압축된 레코드의 형식] (암호화하기 전의 평문)
+#   CODEC_MAGIC (4) + 코덱 (1) + 압축 수준 (1) + 플래그 (1)
+#   [사전 정보] (플래그에 FLAG_DICTIONARY가 있을 때)
+#       파일 수 (2) + (이름 길이 (2) + 이름) * 파일 수 + 사전 해시 (8)
+#   압축된 데이터
+# - 압축하지 않은 레코드(기존 레코드)는 로그 항목 텍스트('🦊=== ...')로 시작하므로 CODEC_MAGIC과 구분됩니다.
+# - 압축해도 작아지지 않으면 압축하지 않은 원래 데이터를 그대로 기록합니다.
+# - 사전은 '레코드에 담긴 파일들의 직전 버전'으로 만들며, 읽을 때는 그 전까지의 항목을 적용(replay)한
+#   버전으로 같은 사전을 다시 만듭니다. (RecordDecoder)
+#   사전 해시가 맞지 않으면(사전을 다시 만들 수 없으면) ValueError가 발생합니다.
+# - 파이썬의 lzma 모듈은 미리 정의된 사전을 지원하지 않으므로, 사전은 zlib에서만 사용됩니다.
+#   zlib의 창 크기(32KB) 때문에 사전은 30KB 이하의 파일에서 효과가 크며, 더 큰 파일은 창이 큰 lzma가 더 작게 압축합니다.
+# (측정: benchmarks/bench_compression.py)
+# ==============================================================================
+
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from . import delta
+
+CODEC_MAGIC = b'\xfdMPZ'
+ENVELOPE_HEADER = struct.Struct('>4scBB')
+# 코덱 이름과 레코드에 기록되는 코덱 표시(1바이트)입니다.
+CODECS = {'zlib': b'z', 'lzma': b'x'}
+CODEC_NAMES = {mark: name for name, mark in CODECS.items()}
+# 플래그: 직전 버전으로 만든 사전을 사용했음을 표시합니다.
+FLAG_DICTIONARY = 0x01
+DICTIONARY_DIGEST_SIZE = 8
+# zlib은 32KB(창 크기) 이내의 거리만 참조할 수 있고, 사전은 압축할 데이터 바로 앞에 놓입니다.
+# 로그 항목은 파일의 앞부분부터 기록되므로 사전도 직전 버전의 앞부분으로 만들되, 항목의 헤더와 추가된 줄만큼
+# 위치가 밀려도 대응되는 줄이 창 안에 들어오도록 32KB보다 조금 작게 자릅니다. (bench_compression.py로 측정한 값)
+MAX_DICTIONARY_SIZE = 30 * 1024
+
+
+def make_dictionary(previous_versions: Dict[str, str]) -> bytes:
+    """
+    파일별 직전 버전으로 압축 사전을 만듭니다.
+    줄바꿈 문자의 차이 없이 읽을 때도 같은 사전을 만들 수 있도록 로그의 줄 목록 형식(delta.to_log_lines)으로 맞추고,
+    전체 문맥 diff의 바뀌지 않은 줄과 같은 모양(' ' + 줄)으로 만들어 한 줄 전체가 한 번에 일치하도록 합니다.
+    """
+    parts = ["\n".join(" " + line for line in delta.to_log_lines(content)) for content in previous_versions.values()]
+    return "\n".join(parts).encode('utf-8')[:MAX_DICTIONARY_SIZE]
+
+
+def _digest(dictionary: bytes) -> bytes:
+    # hashlib은 사전을 쓸 때만 필요하므로, 패키지를 import 할 때 불러오지 않도록 여기서 가져옵니다.
+    import hashlib
+    return hashlib.sha256(dictionary).digest()[:DICTIONARY_DIGEST_SIZE]
+
+
+def is_compressed(data: bytes) -> bool:
+    """ 레코드의 평문이 이 모듈로 압축된 것인지 확인합니다. """
+    return data[:len(CODEC_MAGIC)] == CODEC_MAGIC
+
+
+def _make_compressor(codec: str, level: int, previous_versions: Optional[Dict[str, str]]) -> tuple:
+    """
+    코덱에 맞는 압축기와 레코드 헤더를 만듭니다.
+    - 반환값: (compress()와 flush()를 가진 압축기, 헤더 바이트)
+    """
+    if codec not in CODECS:
+        raise ValueError(f"알 수 없는 압축 코덱입니다: {codec}")
+    flags = 0
+    dictionary_info = b''
+    if codec == 'zlib':
+        import zlib
+        if previous_versions:
+            dictionary = make_dictionary(previous_versions)
+            compressor = zlib.compressobj(level, zdict=dictionary)
+            flags |= FLAG_DICTIONARY
+            names = [name.encode('utf-8') for name in previous_versions]
+            dictionary_info = (struct.pack('>H', len(names))
+                               + b''.join(struct.pack('>H', len(name)) + name for name in names)
+                               + _digest(dictionary))
+        else:
+            compressor = zlib.compressobj(level)
+    else:
+        import lzma
+        compressor = lzma.LZMACompressor(format=lzma.FORMAT_XZ, preset=level)
+    return compressor, ENVELOPE_HEADER.pack(CODEC_MAGIC, CODECS[codec], level, flags) + dictionary_info
+
+
+def compress(data: bytes, codec: str = 'zlib', level: int = 6,
+             previous_versions: Optional[Dict[str, str]] = None) -> bytes:
+    """
+    레코드의 평문을 압축하여, 코덱 정보를 담은 헤더와 함께 반환합니다.
+    - codec: 'zlib' 또는 'lzma'
+    - level: 압축 수준 (zlib: 0~9, lzma: 0~9 preset)
+    - previous_versions: {파일 이름: 직전 버전 내용}, zlib에서 사전으로 사용합니다. (없으면 사전 없이 압축)
+    - 반환값: 압축된 레코드, 압축해도 작아지지 않으면 원래 data
+    """
+    compressor, header = _make_compressor(codec, level, previous_versions)
+    envelope = header + compressor.compress(data) + compressor.flush()
+    return envelope if len(envelope) < len(data) else data
+
+
+def compress_stream(chunks: Iterable[bytes], codec: str = 'zlib', level: int = 6,
+                    previous_versions: Optional[Dict[str, str]] = None) -> Iterator[bytes]:
+    """
+    compress()와 같은 형식의 압축 레코드를 조각 단위로 만들어 차례로 돌려줍니다. (pipeline 모듈에서 사용)
+    전체 크기를 미리 알 수 없으므로, 압축해도 작아지지 않는 경우에도 항상 압축된 형식으로 기록합니다.
+    """
+    compressor, header = _make_compressor(codec, level, previous_versions)
+    yield header
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def read_envelope(data: bytes) -> dict:
+    """
+    압축된 레코드의 헤더를 분석합니다.
+    - 반환값: {"codec", "level", "names": 사전에 사용한 파일 이름 목록 또는 None, "digest", "offset": 압축 데이터 시작 위치}
+    """
+    _, mark, level, flags = ENVELOPE_HEADER.unpack_from(data, 0)
+    if mark not in CODEC_NAMES:
+        raise ValueError(f"알 수 없는 압축 코덱 표시입니다: {mark!r}")
+    offset = ENVELOPE_HEADER.size
+    names, digest = None, None
+    if flags & FLAG_DICTIONARY:
+        (count,) = struct.unpack_from('>H', data, offset)
+        offset += 2
+        names = []
+        for _ in range(count):
+            (length,) = struct.unpack_from('>H', data, offset)
+            names.append(data[offset + 2:offset + 2 + length].decode('utf-8'))
+            offset += 2 + length
+        digest = data[offset:offset + DICTIONARY_DIGEST_SIZE]
+        offset += DICTIONARY_DIGEST_SIZE
+    return {"codec": CODEC_NAMES[mark], "level": level, "names": names, "digest": digest, "offset": offset}
+
+
+def decompress(data: bytes, previous_versions: Optional[Dict[str, str]] = None) -> bytes:
+    """
+    압축된 레코드를 풉니다. 압축되지 않은 레코드는 그대로 반환합니다.
+    - previous_versions: 사전을 사용한 레코드일 때, 헤더에 적힌 파일들의 직전 버전 {파일 이름: 내용}
+    """
+    if not is_compressed(data):
+        return data
+    envelope = read_envelope(data)
+    body = data[envelope["offset"]:]
+    if envelope["codec"] == 'lzma':
+        import lzma
+        return lzma.decompress(body)
+
+    import zlib
+    if envelope["names"] is None:
+        return zlib.decompress(body)
+    versions = previous_versions or {}
+    missing = [name for name in envelope["names"] if name not in versions]
+    if missing:
+        raise ValueError(f"압축 사전을 만들 직전 버전이 없습니다: {', '.join(missing)}")
+    dictionary = make_dictionary({name: versions[name] for name in envelope["names"]})
+    if _digest(dictionary) != envelope["digest"]:
+        raise ValueError("압축 사전이 기록할 때와 다릅니다. (직전 버전을 정확히 복원하지 못했습니다)")
+    decompressor = zlib.decompressobj(zdict=dictionary)
+    return decompressor.decompress(body) + decompressor.flush()
+
+
+class RecordDecoder:
+    """
+    복호화된 레코드를 기록된 순서대로 받아 압축을 풀고, 다음 레코드의 사전을 만들 수 있도록
+    파일별 최신 버전을 따라갑니다. (delta.replay_files와 같은 규칙)
+    - default_file: 파일 이름이 기록되지 않은 항목(한 파일 추적 모드)의 기본 파일 이름
+    """
+
+    def __init__(self, default_file: str = 'main.py'):
+        self.default_file = default_file
+        # 파일별 최신 버전의 줄 목록입니다.
+        self.versions: Dict[str, List[str]] = {}
+        # 한 파일 추적 모드의 diff 항목은 파일 이름이 없으므로, 마지막 스냅샷의 파일 이름을 사용합니다.
+        self._single_file: Optional[str] = None
+
+    def _follow(self, text: str):
+        """ 레코드에 담긴 항목들을 적용하여 파일별 최신 버전을 갱신합니다. """
+        for entry_text in delta.split_entries(text):
+            entry = delta.parse_entry(entry_text)
+            if not entry:
+                continue
+            if entry["kind"] in ("initial", "keyframe"):
+                name = entry["file"] or self.default_file
+                self.versions[name] = entry["lines"]
+                header = delta._ENTRY_HEADER.match(entry_text.lstrip('\n').partition('\n')[0])
+                if header and header.group(2) is None:
+                    self._single_file = name
+                continue
+            name = entry["file"] or self._single_file or self.default_file
+            if name in self.versions:
+                self.versions[name] = delta.apply_diff(self.versions[name], entry["lines"])
+
+    def decode(self, record: bytes) -> bytes:
+        """ 레코드 하나의 압축을 풀어 원래 평문(로그 항목)을 반환합니다. """
+        versions = None
+        if is_compressed(record):
+            names = read_envelope(record)["names"] or []
+            versions = {name: "\n".join(self.versions[name]) for name in names if name in self.versions}
+        data = decompress(record, versions)
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return data
+        self._follow(text)
+        return data
+
+
+def decode_records(records: Iterable[bytes], default_file: str = 'main.py') -> List[bytes]:
+    """ 복호화된 레코드 목록의 압축을 차례로 풉니다. """
+    decoder = RecordDecoder(default_file)
+    return [decoder.decode(record) for record in records]
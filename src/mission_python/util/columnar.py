@@ -0,0 +1,346 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Typed Columnar Loader (v1.0)
+# ------------------------------------------------------------------------------
+# assets/sample.csv 같은 성적 CSV 파일을 열(column) 단위의 타입이 있는 버퍼로 읽어 들이는 모듈입니다.
+#
+# 행마다 문자열 목록(list of str)으로 가지고 있으면 값 하나마다 파이썬 문자열 객체(50~70바이트)가 필요하지만,
+# 이 모듈은 열의 타입에 맞는 압축된 버퍼에 값을 저장하여 행당 메모리를 10분의 1 정도로 줄입니다.
+#
+#   int       -> array('i') (4바이트, 범위를 넘으면 array('q')로 바뀝니다)
+#   float     -> array('d') (8바이트, 빈 값은 nan)
+#   category  -> 사전 인코딩: 값 목록 + 행마다 코드 번호 array('B'/'H'/'i') (학과, 등급처럼 반복되는 문자열)
+#   str       -> 모든 값을 이어 붙인 UTF-8 바이트 + 시작 위치 array('q') (성명처럼 대부분 다른 문자열)
+#
+# - 스키마({열 이름: 타입})를 주지 않으면 처음 INFER_ROWS개 행을 보고 열의 타입을 추정합니다.
+#   추정한 int 열에서 그 뒤에 빈 값이나 실수가 나오면 열 전체를 float 열(array('d'), 빈 값은 nan)로 바꿉니다.
+#   (스키마에 직접 int로 지정한 열은 바꾸지 않고 ValueError가 발생합니다)
+# - NumPy가 설치되어 있으면(backend='auto') 숫자 열과 코드 열을 복사 없이 NumPy 배열로 돌려줍니다.
+# - 파일은 csvstream으로 한 행씩 읽고, LOAD_BATCH_ROWS개 행씩 열로 바꾸어 변환합니다.
+#
+# 사용 예:
+#   table = load_columns("assets/sample.csv")
+#   print(len(table), table.schema["총점"], sum(table["총점"]) / len(table))
+#   print(table["학과"].categories, table.row(0))
+# ==============================================================================
+
+import math
+from array import array
+from itertools import accumulate, chain, islice
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from . import csvstream
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# 열 타입 이름입니다.
+INT = 'int'
+FLOAT = 'float'
+CATEGORY = 'category'
+STR = 'str'
+COLUMN_TYPES = (INT, FLOAT, CATEGORY, STR)
+
+# assets/sample.csv(성적 파일)의 스키마입니다.
+GRADE_SCHEMA = {
+    "순번": INT, "학과": CATEGORY, "학년": INT, "학번": INT, "성명": STR, "결석(일)": INT,
+    "출석점수(10점)": FLOAT, "기말고사(100점)": INT, "중간고사(100점)": INT, "총점": FLOAT, "등급": CATEGORY,
+}
+
+# 스키마를 추정할 때 살펴보는 행의 수입니다.
+INFER_ROWS = 1000
+# 한 번에 열로 바꾸어 변환하는 행의 수입니다. (이 행들만 잠시 문자열 목록으로 메모리에 있습니다)
+LOAD_BATCH_ROWS = 4096
+
+
+class CategoryColumn:
+    """
+    반복되는 문자열을 사전 인코딩하여 저장하는 열입니다.
+    - categories: 나온 순서대로의 서로 다른 값 목록
+    - codes: 행마다 categories의 위치(코드 번호), 값의 종류가 256개 이하이면 1바이트입니다.
+    """
+
+    def __init__(self):
+        self.categories: List[str] = []
+        self.codes = array('B')
+        self._lookup: Dict[str, int] = {}
+
+    def extend(self, values: Sequence[str]):
+        # dict.fromkeys로 중복을 없애면 처음 나온 순서가 유지되어, 코드 번호가 항상 같게 정해집니다.
+        for value in dict.fromkeys(values):
+            if value not in self._lookup:
+                self._add(value)
+        self.codes.extend(map(self._lookup.__getitem__, values))
+
+    def _add(self, value: str):
+        code = len(self.categories)
+        if code == 256 and self.codes.typecode == 'B':
+            self.codes = array('H', self.codes)
+        elif code == 65536 and self.codes.typecode == 'H':
+            self.codes = array('i', self.codes)
+        self.categories.append(value)
+        self._lookup[value] = code
+
+    def code_of(self, value: str) -> int:
+        """ 값의 코드 번호를 반환합니다. 없는 값이면 KeyError가 발생합니다. """
+        return self._lookup[value]
+
+    def counts(self) -> Dict[str, int]:
+        """ 값마다 나온 행의 수를 반환합니다. """
+        totals = [0] * len(self.categories)
+        for code in self.codes:
+            totals[code] += 1
+        return dict(zip(self.categories, totals))
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes) + sum(len(value.encode('utf-8')) for value in self.categories)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str:
+        return self.categories[self.codes[index]]
+
+    def __iter__(self):
+        return map(self.categories.__getitem__, self.codes)
+
+
+class StringColumn:
+    """
+    문자열 값들을 하나의 UTF-8 바이트 버퍼에 이어 붙여 저장하는 열입니다.
+    - i번째 값은 data[offsets[i]:offsets[i + 1]]입니다.
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array('q', [0])
+
+    def extend(self, values: Sequence[str]):
+        encoded = list(map(str.encode, values))
+        # 마지막 시작 위치부터 값들의 길이를 누적하여, 각 값의 끝 위치(= 다음 값의 시작 위치)를 덧붙입니다.
+        end = self.offsets.pop()
+        self.offsets.extend(accumulate(map(len, encoded), initial=end))
+        self.data += b''.join(encoded)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("StringColumn index out of range")
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+class ColumnTable:
+    """
+    load_columns()가 만드는 열 단위 표입니다.
+    - names: 열 이름 목록 (파일의 순서)
+    - schema: {열 이름: 타입}
+    - table[이름]: 열 (array, NumPy 배열, CategoryColumn 또는 StringColumn)
+    """
+
+    def __init__(self, names: List[str], schema: Dict[str, str], columns: Dict[str, object], length: int):
+        self.names = names
+        self.schema = schema
+        self.columns = columns
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def row(self, index: int) -> Dict[str, object]:
+        """ index번째 행을 {열 이름: 값} 딕셔너리로 반환합니다. """
+        return {name: _python_value(self.columns[name][index]) for name in self.names}
+
+    @property
+    def nbytes(self) -> int:
+        """ 열 버퍼들이 사용하는 바이트 수의 합입니다. (파이썬 객체의 고정 크기는 제외) """
+        total = 0
+        for column in self.columns.values():
+            if isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:
+                total += column.nbytes
+        return total
+
+
+def _python_value(value):
+    # NumPy 스칼라(numpy.int32 등)를 파이썬 int/float로 바꿉니다.
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _is_int(text: str) -> bool:
+    try:
+        int(text)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_float(text: str) -> bool:
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return text == ''
+
+
+def infer_schema(names: Sequence[str], rows: Sequence[Sequence[str]]) -> Dict[str, str]:
+    """
+    샘플 행들로 열마다 타입을 추정합니다.
+    - 모든 값이 정수이면 int, 실수(또는 빈 값)이면 float
+    - 그 외에는 서로 다른 값의 수가 행 수의 절반 이하이면 category, 아니면 str
+    """
+    schema = {}
+    for position, name in enumerate(names):
+        values = [row[position] for row in rows]
+        if values and all(map(_is_int, values)):
+            schema[name] = INT
+        elif values and all(map(_is_float, values)) and any(values):
+            schema[name] = FLOAT
+        elif values and 2 * len(set(values)) <= len(values):
+            schema[name] = CATEGORY
+        else:
+            schema[name] = STR
+    return schema
+
+
+def _new_column(column_type: str):
+    if column_type == INT:
+        return array('i')
+    if column_type == FLOAT:
+        return array('d')
+    if column_type == CATEGORY:
+        return CategoryColumn()
+    return StringColumn()
+
+
+def _to_float(text: str) -> float:
+    return float(text) if text else math.nan
+
+
+def _extend_numbers(column: array, column_type: str, values: Sequence[str]) -> array:
+    """ 문자열 값들을 숫자로 바꾸어 column에 덧붙이고, (타입이 바뀌었을 수 있는) 열을 반환합니다. """
+    if column_type == INT:
+        numbers = list(map(int, values))
+        chunk = array(column.typecode)
+        try:
+            chunk.extend(numbers)
+        except OverflowError:
+            # 4바이트 범위를 넘는 값이 있으면 열 전체를 8바이트 정수(array('q'))로 바꿉니다.
+            column, chunk = array('q', column), array('q', numbers)
+        column.extend(chunk)
+        return column
+    try:
+        column.extend(array('d', map(float, values)))
+    except ValueError:
+        column.extend(map(_to_float, values))
+    return column
+
+
+def load_columns(source: Union[str, Iterable], schema: Optional[Dict[str, str]] = None,
+                 fields: Optional[Sequence[str]] = None, backend: str = 'auto', **options) -> ColumnTable:
+    """
+    CSV 파일을 열 단위 표(ColumnTable)로 읽어 들입니다.
+    - source: CSV 파일 경로 또는 텍스트 스트림 (csvstream.open_rows()와 같은 options를 사용할 수 있습니다)
+    - schema: {열 이름: 'int' | 'float' | 'category' | 'str'}, None이면 처음 INFER_ROWS개 행으로 추정합니다.
+      스키마에 없는 열은 추정한 타입을 사용합니다. 추정한 int 열은 빈 값이나 실수를 만나면 float 열로 바뀝니다.
+    - fields: 읽어 들일 열 이름 목록 (None이면 모든 열)
+    - backend: 'array'(표준 라이브러리 array), 'numpy'(NumPy 배열), 'auto'(NumPy가 설치되어 있으면 numpy)
+    필드 수가 헤더와 다른 행이 있으면 csvstream.CsvFormatError, 값을 열의 타입으로 바꿀 수 없으면 ValueError가 발생합니다.
+    """
+    if backend == 'auto':
+        backend = 'numpy' if numpy is not None else 'array'
+    if backend == 'numpy' and numpy is None:
+        raise ImportError("backend='numpy'를 사용하려면 NumPy를 설치해야 합니다.")
+    if backend not in ('array', 'numpy'):
+        raise ValueError(f"지원하지 않는 backend입니다: {backend}")
+
+    options['strict'] = True
+    with csvstream.open_rows(source, **options) as rows:
+        if rows.header is None:
+            raise csvstream.CsvFormatError("헤더가 없는 CSV 파일은 열 단위로 읽을 수 없습니다.")
+        names = list(rows.header if fields is None else fields)
+        positions = [rows.index(name) for name in names]
+        rows_iter = iter(rows)
+        sample = list(islice(rows_iter, INFER_ROWS))
+
+        given = dict(schema or {})
+        for name, column_type in given.items():
+            if column_type not in COLUMN_TYPES:
+                raise ValueError(f"지원하지 않는 열 타입입니다: {name}={column_type}")
+        missing = [name for name in names if name not in given]
+        inferred = set(missing)
+        if missing:
+            missing_positions = [rows.index(name) for name in missing]
+            given.update(infer_schema(missing, [[row[position] for position in missing_positions] for row in sample]))
+        table_schema = {name: given[name] for name in names}
+        columns = {name: _new_column(table_schema[name]) for name in names}
+
+        length = 0
+        source_rows = chain(sample, rows_iter)
+        while True:
+            batch = list(islice(source_rows, LOAD_BATCH_ROWS))
+            if not batch:
+                break
+            transposed = list(zip(*batch))
+            for name, position in zip(names, positions):
+                values = transposed[position]
+                column_type = table_schema[name]
+                try:
+                    if column_type in (INT, FLOAT):
+                        columns[name] = _extend_numbers(columns[name], column_type, values)
+                    else:
+                        columns[name].extend(values)
+                except ValueError:
+                    if column_type == INT and name in inferred and all(map(_is_float, values)):
+                        # 샘플 뒤에 빈 값이나 실수가 나온 추정 int 열은, int 범위를 넘을 때처럼 열 전체를 바꿉니다.
+                        table_schema[name] = FLOAT
+                        columns[name] = _extend_numbers(array('d', columns[name]), FLOAT, values)
+                        continue
+                    bad = next(value for value in values
+                               if not (_is_int(value) if column_type == INT else _is_float(value)))
+                    raise ValueError(f"'{name}' 열의 값 {bad!r}을(를) {column_type}(으)로 바꿀 수 없습니다. "
+                                     f"({length + values.index(bad) + 1}번째 데이터 행)") from None
+            length += len(batch)
+
+    if backend == 'numpy':
+        columns = {name: _to_numpy(column) for name, column in columns.items()}
+    return ColumnTable(names, table_schema, columns, length)
+
+
+def _to_numpy(column):
+    # array의 버퍼를 복사하지 않고 NumPy 배열로 감쌉니다. (CategoryColumn은 codes만 바꿉니다)
+    if isinstance(column, array):
+        return numpy.frombuffer(column, dtype=column.typecode) if len(column) else numpy.array([], column.typecode)
+    if isinstance(column, CategoryColumn):
+        column.codes = numpy.frombuffer(column.codes, dtype=column.codes.typecode) \
+            if len(column.codes) else numpy.array([], column.codes.typecode)
+    return column
@@ -0,0 +1,270 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Log Container Format (v1.0)
+# ------------------------------------------------------------------------------
+# log.encrypted를 버전 정보가 있는 '컨테이너' 형식으로 저장하기 위한 모듈입니다.
+#
+# [로그 파일 형식] log.encrypted
+#   [파일 헤더 (8)]   : CONTAINER_MAGIC (4) + 버전 (1) + 예약 (3)
+#   [프레임] ...      : [프레임 헤더 (25)][암호화된 레코드]
+#       프레임 헤더   : 종류 (1) + 일련번호 (8) + 기록 시각(ms) (8) + 레코드 길이 (4) + CRC32 (4)
+#
+# [인덱스 파일 형식] log.encrypted.idx
+#   [파일 헤더 (8)]   : INDEX_MAGIC (4) + 버전 (1) + 예약 (3)
+#   [인덱스 항목] ... : 프레임 위치 (8) + 일련번호 (8) + 기록 시각(ms) (8) + 세션 헤더 프레임 위치 (8)
+#
+# 인덱스 항목은 모두 같은 크기이므로, N번째 항목의 위치를 바로 계산할 수 있습니다.
+# 덕분에 N번째(또는 마지막) 기록을 처음부터 훑지 않고 O(1)로 찾아갈 수 있으며,
+# 새 기록을 추가할 때도 두 파일의 끝에 덧붙이기만 하면 됩니다.
+#
+# 컨테이너 형식이 아닌 기존 로그(레코드를 단순히 이어 붙인 파일)도 iter_frames()로 읽을 수 있습니다.
+# ==============================================================================
+
+import os
+import struct
+import time
+import zlib
+from typing import Iterator, Optional
+
+from . import crypto
+
+# 파일 헤더의 매직 값입니다. 기존 형식의 첫 바이트(RSA 암호문)나 세션 모드(0xFF)와 겹치지 않도록 0xFE로 시작합니다.
+CONTAINER_MAGIC = b'\xfeMPL'
+INDEX_MAGIC = b'\xfeMPI'
+CONTAINER_VERSION = 1
+FILE_HEADER = struct.Struct('>4sB3x')
+FRAME_HEADER = struct.Struct('>BQqII')
+INDEX_ENTRY = struct.Struct('>QQqQ')
+
+# 프레임 종류: 로그 항목 하나를 담은 프레임입니다.
+FRAME_ENTRY = 0
+# 세션 헤더가 없는 레코드(기존 형식 레코드 등)의 '세션 헤더 프레임 위치' 값입니다.
+NO_SESSION = 2 ** 64 - 1
+
+
+def index_path(log_file: str) -> str:
+    """ 로그 파일에 대응되는 인덱스 파일 경로를 반환합니다. """
+    return log_file + '.idx'
+
+
+def is_container(log_file: str) -> bool:
+    """ 로그 파일이 컨테이너 형식인지(매직 값으로 시작하는지) 확인합니다. """
+    try:
+        with open(log_file, 'rb') as f:
+            return f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC
+    except OSError:
+        return False
+
+
+def create(log_file: str):
+    """ 비어 있는 컨테이너 로그 파일과 인덱스 파일을 새로 만듭니다. (기존 파일은 덮어씁니다) """
+    with open(log_file, 'wb') as f:
+        f.write(FILE_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION))
+    with open(index_path(log_file), 'wb') as f:
+        f.write(FILE_HEADER.pack(INDEX_MAGIC, CONTAINER_VERSION))
+
+
+def _read_frame_at(f, offset: int) -> Optional[dict]:
+    """
+    열려 있는 로그 파일의 offset 위치에서 프레임 하나를 읽습니다.
+    프레임이 잘려 있거나 CRC가 맞지 않으면 None을 반환합니다.
+    """
+    f.seek(offset)
+    header = f.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    kind, seq, timestamp_ms, length, checksum = FRAME_HEADER.unpack(header)
+    payload = f.read(length)
+    if len(payload) < length or zlib.crc32(payload) != checksum:
+        return None
+    return {"kind": kind, "seq": seq, "timestamp_ms": timestamp_ms, "offset": offset,
+            "end": offset + FRAME_HEADER.size + length, "payload": payload}
+
+
+def _index_entry_count(log_file: str) -> int:
+    """ 인덱스 파일에 기록된 항목 수를 반환합니다. """
+    try:
+        size = os.path.getsize(index_path(log_file))
+    except OSError:
+        return 0
+    return max(size - FILE_HEADER.size, 0) // INDEX_ENTRY.size
+
+
+def _read_index_entry(log_file: str, position: int) -> tuple:
+    """ 인덱스 파일의 position번째 항목 (프레임 위치, 일련번호, 시각, 세션 헤더 프레임 위치)을 읽습니다. """
+    with open(index_path(log_file), 'rb') as f:
+        f.seek(FILE_HEADER.size + position * INDEX_ENTRY.size)
+        return INDEX_ENTRY.unpack(f.read(INDEX_ENTRY.size))
+
+
+def _session_offset_for(payload: bytes, offset: int, session_by_id: dict) -> int:
+    """ 새 프레임이 속한 세션의 헤더가 어느 프레임에 있는지 결정합니다. """
+    if not payload.startswith(crypto.SESSION_MAGIC):
+        return NO_SESSION
+    session_id = crypto.session_id_of(payload)
+    if payload[len(crypto.SESSION_MAGIC):len(crypto.SESSION_MAGIC) + 1] == b'H':
+        session_by_id[session_id] = offset
+        return offset
+    return session_by_id.get(session_id, NO_SESSION)
+
+
+def rebuild_index(log_file: str) -> int:
+    """
+    로그 파일 전체를 처음부터 읽어 인덱스 파일을 다시 만듭니다.
+    인덱스가 없거나 손상된 경우, 또는 로그와 인덱스가 서로 맞지 않을 때 사용됩니다.
+    - 반환값: 인덱스에 기록된 프레임 수
+    """
+    entries = []
+    session_by_id = {}
+    with open(log_file, 'rb') as f:
+        offset = FILE_HEADER.size
+        while True:
+            frame = _read_frame_at(f, offset)
+            if frame is None:
+                break
+            entries.append(INDEX_ENTRY.pack(
+                offset, frame["seq"], frame["timestamp_ms"],
+                _session_offset_for(frame["payload"], offset, session_by_id)))
+            offset = frame["end"]
+
+    # 임시 파일에 먼저 쓴 뒤 이름을 바꾸어(temp + rename), 중간에 멈추더라도 인덱스가 반쯤 쓰이지 않게 합니다.
+    temp_file = f"{index_path(log_file)}.{os.getpid()}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(FILE_HEADER.pack(INDEX_MAGIC, CONTAINER_VERSION))
+        f.write(b''.join(entries))
+    os.replace(temp_file, index_path(log_file))
+    return len(entries)
+
+
+def _ensure_index(log_file: str) -> int:
+    """
+    인덱스의 마지막 항목이 로그 파일의 끝과 정확히 맞는지 O(1)로 확인하고, 맞지 않으면 다시 만듭니다.
+    - 반환값: 인덱스에 기록된 프레임 수
+    """
+    count = _index_entry_count(log_file)
+    log_size = os.path.getsize(log_file)
+    if count == 0:
+        expected_end = FILE_HEADER.size
+    else:
+        offset = _read_index_entry(log_file, count - 1)[0]
+        with open(log_file, 'rb') as f:
+            frame = _read_frame_at(f, offset)
+        expected_end = frame["end"] if frame else -1
+    if expected_end == log_size and os.path.exists(index_path(log_file)):
+        return count
+    return rebuild_index(log_file)
+
+
+def append_frame(log_file: str, payload: bytes, timestamp_ms: Optional[int] = None) -> int:
+    """
+    암호화된 레코드 하나를 새 프레임으로 로그 파일 끝에 추가하고, 인덱스에도 항목을 추가합니다.
+    로그 파일이 없거나 비어 있으면 새 컨테이너를 만듭니다.
+    - payload: 암호화된 레코드 (crypto.encrypt_data() 또는 세션 모드의 결과)
+    - timestamp_ms: 기록 시각 (밀리초), 생략하면 현재 시각
+    - 반환값: 추가된 프레임의 일련번호
+    """
+    if not os.path.exists(log_file) or os.path.getsize(log_file) == 0:
+        create(log_file)
+    if timestamp_ms is None:
+        timestamp_ms = time.time_ns() // 1_000_000
+
+    seq = _ensure_index(log_file)
+
+    # 세션 레코드라면, 같은 세션의 헤더가 들어있는 프레임 위치를 인덱스에 함께 기록합니다.
+    session_by_id = {}
+    if seq > 0 and payload.startswith(crypto.SESSION_MAGIC):
+        previous_session_offset = _read_index_entry(log_file, seq - 1)[3]
+        if previous_session_offset != NO_SESSION:
+            with open(log_file, 'rb') as f:
+                session_frame = _read_frame_at(f, previous_session_offset)
+            if session_frame:
+                session_by_id[crypto.session_id_of(session_frame["payload"])] = previous_session_offset
+
+    with open(log_file, 'ab') as f:
+        offset = f.tell()
+        session_offset = _session_offset_for(payload, offset, session_by_id)
+        f.write(FRAME_HEADER.pack(FRAME_ENTRY, seq, timestamp_ms, len(payload), zlib.crc32(payload)) + payload)
+    with open(index_path(log_file), 'ab') as f:
+        f.write(INDEX_ENTRY.pack(offset, seq, timestamp_ms, session_offset))
+    return seq
+
+
+def frame_count(log_file: str) -> int:
+    """ 로그에 기록된 항목 수를 반환합니다. 컨테이너 형식이면 인덱스만 보고 바로 계산합니다. """
+    if is_container(log_file):
+        return _ensure_index(log_file)
+    return sum(1 for _ in iter_frames(log_file))
+
+
+def read_frame(log_file: str, position: int) -> dict:
+    """
+    position번째 항목의 프레임을 인덱스를 통해 바로 읽습니다. (음수이면 뒤에서부터, -1은 마지막 항목)
+    세션 모드 레코드라면 같은 세션의 헤더를 payload 앞에 붙여, 이 프레임만으로 복호화할 수 있게 합니다.
+    컨테이너 형식이 아닌 기존 로그는 처음부터 훑어서 찾습니다.
+    - 반환값: {"seq", "timestamp_ms", "offset", "payload"} 딕셔너리
+    """
+    if not is_container(log_file):
+        frames = list(iter_frames(log_file))
+        return frames[position]
+
+    count = _ensure_index(log_file)
+    if position < 0:
+        position += count
+    if not 0 <= position < count:
+        raise IndexError(f"로그 항목 번호가 범위를 벗어났습니다: {position} (전체 {count}개)")
+
+    offset, _, _, session_offset = _read_index_entry(log_file, position)
+    with open(log_file, 'rb') as f:
+        frame = _read_frame_at(f, offset)
+        if frame is None:
+            raise ValueError(f"손상된 프레임입니다 (offset={offset}).")
+        if session_offset not in (NO_SESSION, offset):
+            session_frame = _read_frame_at(f, session_offset)
+            if session_frame is not None:
+                header = session_frame["payload"][:crypto.SESSION_HEADER_SIZE]
+                frame["payload"] = header + frame["payload"]
+    del frame["end"], frame["kind"]
+    return frame
+
+
+def iter_frames(log_file: str) -> Iterator[dict]:
+    """
+    로그 파일의 모든 항목을 처음부터 순서대로 읽습니다.
+    - 컨테이너 형식: 프레임을 하나씩 읽으며, 잘리거나 손상된 마지막 프레임에서 멈춥니다.
+    - 기존 형식(호환 모드): 이어 붙여진 레코드를 나누어 읽으며, 세션 헤더는 다음 레코드의 payload 앞에 붙입니다.
+      기존 형식에는 기록 시각이 없으므로 timestamp_ms는 None입니다.
+    - 반환값: {"seq", "timestamp_ms", "offset", "payload"} 딕셔너리를 차례로 돌려주는 제너레이터
+    """
+    with open(log_file, 'rb') as f:
+        if f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC:
+            offset = FILE_HEADER.size
+            while True:
+                frame = _read_frame_at(f, offset)
+                if frame is None:
+                    return
+                offset = frame.pop("end")
+                del frame["kind"]
+                yield frame
+        else:
+            f.seek(0)
+            seq = 0
+            offset = 0
+            pending_header = b''
+            for kind, record in crypto.iter_raw_records(f):
+                if kind == 'session_header':
+                    pending_header = record
+                    offset += len(record)
+                    continue
+                yield {"seq": seq, "timestamp_ms": None, "offset": offset - len(pending_header),
+                       "payload": pending_header + record}
+                seq += 1
+                offset += len(record)
+                pending_header = b''
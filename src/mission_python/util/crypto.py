@@ -13,15 +13,15 @@
 
 import os
 import struct
-# cryptography 라이브러리에서 필요한 암호화 관련 모듈들을 가져옵니다.
-# rsa, padding: RSA 비대칭키 암호화 및 패딩 방식에 사용됩니다.
-from cryptography.hazmat.primitives.asymmetric import rsa, padding as rsa_padding
-# Cipher, algorithms, modes: AES 대칭키 암호화 방식(알고리즘, 운영 모드 등)에 사용됩니다.
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-# serialization: 키를 파일이나 메모리에서 읽을 수 있는 형태로 변환합니다.
-# hashes: 해시 함수(SHA256 등)를 사용합니다.
-# padding: AES 암호화 시 블록 크기를 맞추기 위한 패딩에 사용됩니다.
-from cryptography.hazmat.primitives import serialization, hashes, padding as aes_padding
+
+# 단계별 시간 측정 모듈입니다. (환경 변수 MISSION_PYTHON_TIMING으로 켤 때만 동작합니다)
+from . import timing
+
+# [지연 로딩(Lazy Loading)]
+# cryptography 라이브러리는 불러오는 데만 수십 ms가 걸리는 무거운 모듈입니다.
+# 대부분의 실행은 main.py가 바뀌지 않아 암호화가 전혀 필요 없으므로,
+# 라이브러리는 모듈 상단이 아닌 실제로 암호화가 일어나는 함수 안에서 가져옵니다.
+# 한 번 가져온 모듈은 sys.modules에 캐시되므로, 두 번째 호출부터는 추가 비용이 거의 없습니다.
 
 # 평가자의 RSA 공개키입니다. 이 키로 암호화된 데이터는 대응되는 개인키로만 복호화할 수 있습니다.
 # 학생의 코드 변경 기록을 안전하게 보호하는 데 사용됩니다.
@@ -41,9 +41,37 @@ AES_KEY_SIZE = 32  # AES-256을 의미합니다 (32 bytes * 8 bits/byte = 256 bi
 AES_IV_SIZE = 16   # AES 블록 크기와 같은 16 bytes(128 bits) IV(Initialization Vector)를 사용합니다.
 RSA_ENCRYPTED_KEY_SIZE = 256  # 2048비트 RSA 키로 암호화된 AES 키의 결과 크기입니다 (2048 bits / 8 = 256 bytes).
 
+# --- 세션(Session) 모드 레코드 형식에 사용될 상수 정의 ---
+# 세션 모드에서는 프로세스마다 AES-GCM 데이터 키를 한 번만 만들고, 이 키를 RSA로 감싼 '세션 헤더'를
+# 로그 파일에 한 번 기록합니다. 이후 각 레코드는 이 키와 일련번호(counter) nonce로 암호화되어,
+# 레코드마다 RSA 연산과 256바이트 오버헤드가 반복되지 않습니다.
+#
+# - 세션 헤더 : [SESSION_MAGIC (4)]['H' (1)][버전 (1)][세션 ID (8)][RSA로 암호화된 데이터 키 (256)]
+# - 데이터 레코드: [SESSION_MAGIC (4)]['R' (1)][세션 ID (8)][일련번호 (8)][암호문 길이 (4)][AES-GCM 암호문 + 태그]
+#
+# 기존(legacy) 레코드의 첫 바이트는 RSA 암호문의 첫 바이트로, 항상 공개키 modulus의 첫 바이트보다 작습니다.
+# 0xFF로 시작하는 SESSION_MAGIC은 기존 레코드와 겹치지 않으므로, 두 형식이 섞인 로그도 구분해 읽을 수 있습니다.
+SESSION_MAGIC = b'\xffMPS'
+SESSION_VERSION = 1
+SESSION_ID_SIZE = 8
+SESSION_HEADER_SIZE = len(SESSION_MAGIC) + 1 + 1 + SESSION_ID_SIZE + RSA_ENCRYPTED_KEY_SIZE
+# 레코드 헤더 형식: 매직, 종류('R'), 세션 ID, 일련번호, 암호문 길이 (빅엔디안)
+SESSION_RECORD_HEADER = struct.Struct(f'>{len(SESSION_MAGIC)}sc{SESSION_ID_SIZE}sQI')
+GCM_TAG_SIZE = 16
+
 # 공개키 객체를 메모리에 한 번만 로드하기 위한 캐시 변수입니다.
 _public_key_cache = None
 
+def _oaep_padding():
+    """ RSA 암호화/복호화에 사용하는 OAEP(SHA256) 패딩 객체를 만듭니다. """
+    from cryptography.hazmat.primitives.asymmetric import padding as rsa_padding
+    from cryptography.hazmat.primitives import hashes
+    return rsa_padding.OAEP(
+        mgf=rsa_padding.MGF1(algorithm=hashes.SHA256()),
+        algorithm=hashes.SHA256(),
+        label=None
+    )
+
 def get_public_key():
     """
     문자열 형태의 PEM 공개키를 cryptography 라이브러리에서 사용할 수 있는 객체로 변환합니다.
@@ -52,6 +80,8 @@ def get_public_key():
     global _public_key_cache
     # 캐시가 비어 있을 경우에만 키 로딩 작업을 수행합니다.
     if _public_key_cache is None:
+        # serialization: 키를 파일이나 메모리에서 읽을 수 있는 형태로 변환합니다.
+        from cryptography.hazmat.primitives import serialization
         # load_pem_public_key 함수는 PEM 형식의 키 문자열을 파싱하여 키 객체를 생성합니다.
         # 함수에 전달하기 전에 문자열을 바이트(bytes) 형태로 인코딩해야 합니다.
         _public_key_cache = serialization.load_pem_public_key(
@@ -59,6 +89,7 @@ def get_public_key():
         )
     return _public_key_cache
 
+@timing.timed("encrypt_data")
 def encrypt_data(data: bytes) -> bytes | None:
     """
     하이브리드 암호화(Hybrid Encryption) 방식으로 데이터를 암호화합니다.
@@ -69,12 +100,23 @@ def encrypt_data(data: bytes) -> bytes | None:
     - 반환값: 암호화된 전체 데이터(바이트), 실패 시 None
     """
     try:
+        # cryptography 라이브러리에서 필요한 암호화 관련 모듈들을 가져옵니다. (지연 로딩)
+        # rsa_padding: RSA 비대칭키 암호화의 패딩 방식에 사용됩니다.
+        # Cipher, algorithms, modes: AES 대칭키 암호화 방식(알고리즘, 운영 모드 등)에 사용됩니다.
+        # hashes: 해시 함수(SHA256 등)를 사용합니다.
+        # aes_padding: AES 암호화 시 블록 크기를 맞추기 위한 패딩에 사용됩니다.
+        from cryptography.hazmat.primitives.asymmetric import padding as rsa_padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.primitives import hashes, padding as aes_padding
+        timing.mark("import")
+
         # --- 1단계: 암호화에 필요한 키 준비 ---
         # 평가자의 RSA 공개키 객체를 가져옵니다.
         public_key = get_public_key()
         # os.urandom: 암호학적으로 안전한(예측 불가능한) 난수를 생성하여 AES 키와 IV를 만듭니다.
         # AES 키와 IV는 매번 암호화할 때마다 새로 생성해야 보안성이 높아집니다.
         aes_key, iv = os.urandom(AES_KEY_SIZE), os.urandom(AES_IV_SIZE)
+        timing.mark("key")
 
         # --- 2단계: 대칭키(AES)로 원본 데이터 암호화 ---
         # Cipher 객체 생성: AES 알고리즘과 CBC(Cipher Block Chaining) 운영 모드를 지정합니다.
@@ -88,6 +130,7 @@ def encrypt_data(data: bytes) -> bytes | None:
         padded_data = padder.update(data) + padder.finalize() # 데이터에 패딩 추가
         # 패딩된 데이터를 최종적으로 암호화합니다.
         aes_encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+        timing.mark("aes")
 
         # --- 3단계: 비대칭키(RSA)로 AES 키 암호화 ---
         # AES 키와 IV를 하나로 합쳐서 RSA로 암호화할 세션키를 만듭니다.
@@ -104,6 +147,7 @@ def encrypt_data(data: bytes) -> bytes | None:
                 label=None
             )
         )
+        timing.mark("rsa")
         
         # --- 4단계: 결과물 조합 ---
         # 암호화된 데이터의 길이를 4바이트의 빅엔디안(big-endian, >) 부호 없는 정수(I) 형식으로 패킹합니다.
@@ -111,9 +155,340 @@ def encrypt_data(data: bytes) -> bytes | None:
         aes_data_len_bytes = struct.pack('>I', len(aes_encrypted_data))
 
         # [암호화된 세션키] + [데이터 길이] + [암호화된 데이터] 순서로 모든 부분을 합쳐 최종 결과물을 반환합니다.
+        timing.note(bytes_in=len(data), bytes_out=len(rsa_encrypted_key) + 4 + len(aes_encrypted_data))
         return rsa_encrypted_key + aes_data_len_bytes + aes_encrypted_data
 
     # 암호화 과정에서 어떤 종류의 오류든 발생하면, 오류 메시지를 출력하고 None을 반환합니다.
     except Exception as e:
         print(f"🚫 [Crypto] 데이터 암호화 중 오류 발생: {e}")
-        return None
\ No newline at end of file
+        return None
+
+# ==============================================================================
+# 스트리밍(Streaming) 암호화: 크기와 관계없이 일정한 메모리 사용
+# ------------------------------------------------------------------------------
+
+# 스트리밍 암호화에서 한 번에 처리하는 기본 크기(바이트)입니다. AES 블록 크기(16)의 배수여야 합니다.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+def _stream_input_size(src) -> int | None:
+    """ 입력의 남은 크기(바이트)를 미리 알 수 있으면 반환하고, 알 수 없으면 None을 반환합니다. """
+    if isinstance(src, (bytes, bytearray, memoryview)):
+        return memoryview(src).nbytes
+    try:
+        return os.fstat(src.fileno()).st_size - src.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    try:
+        if src.seekable():
+            position = src.tell()
+            end = src.seek(0, os.SEEK_END)
+            src.seek(position)
+            return end - position
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+def encrypt_stream(src, dst, chunk_size: int = STREAM_CHUNK_SIZE) -> int | None:
+    """
+    파일 객체나 버퍼(bytes, memoryview 등)의 내용을 일정한 크기의 조각(chunk) 단위로 암호화하여,
+    결과를 바로 dst 파일 객체에 씁니다. 미리 할당한 버퍼 두 개만 재사용하므로,
+    데이터가 아무리 커도 추가로 사용하는 메모리는 chunk_size 정도로 일정합니다.
+    - 결과 형식은 encrypt_data()와 완전히 같습니다: [RSA 암호화된 AES키+IV][암호문 길이 (4바이트)][AES-CBC 암호문]
+    - 암호문 길이를 먼저 써야 하므로, 입력 크기를 알 수 없는 스트림(e.g., 파이프)은 dst가 seek 가능해야 합니다.
+    - 도중에 실패하면(e.g., 암호화 도중 입력 크기가 바뀐 경우), 쓰다 만 레코드가 남지 않도록
+      dst를 시작 위치로 되돌리고 그 뒤를 잘라냅니다. (dst가 seek 가능한 경우)
+    - src: 읽을 수 있는 바이너리 파일 객체 또는 bytes-like 객체
+    - dst: 쓸 수 있는 바이너리 파일 객체
+    - chunk_size: 한 번에 처리할 크기 (AES 블록 크기 16의 배수)
+    - 반환값: dst에 쓴 전체 바이트 수, 실패 시 None
+    """
+    start_position = None
+    try:
+        from cryptography.hazmat.primitives.asymmetric import padding as rsa_padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        from cryptography.hazmat.primitives import hashes
+
+        block_size = algorithms.AES.block_size // 8
+        if chunk_size <= 0 or chunk_size % block_size:
+            raise ValueError(f"chunk_size는 {block_size}의 배수여야 합니다: {chunk_size}")
+
+        try:
+            if dst.seekable():
+                start_position = dst.tell()
+        except (AttributeError, OSError, ValueError):
+            pass
+
+        # --- 1단계: 키 준비 및 RSA로 감싼 세션키 기록 ---
+        aes_key, iv = os.urandom(AES_KEY_SIZE), os.urandom(AES_IV_SIZE)
+        rsa_encrypted_key = get_public_key().encrypt(
+            aes_key + iv,
+            rsa_padding.OAEP(
+                mgf=rsa_padding.MGF1(algorithm=hashes.SHA256()),
+                algorithm=hashes.SHA256(),
+                label=None
+            )
+        )
+        dst.write(rsa_encrypted_key)
+
+        # --- 2단계: 암호문 길이 기록 ---
+        # PKCS7 패딩은 항상 1~16바이트를 붙이므로, 입력 크기를 알면 암호문 길이를 미리 계산할 수 있습니다.
+        input_size = _stream_input_size(src)
+        length_position = None
+        if input_size is None:
+            # 입력 크기를 모르면 자리만 잡아두고, 마지막에 되돌아가서 실제 길이를 채웁니다.
+            length_position = dst.tell()
+        expected_length = (input_size // block_size + 1) * block_size if input_size is not None else 0
+        dst.write(struct.pack('>I', expected_length))
+
+        # --- 3단계: 조각 단위 암호화 ---
+        encryptor = Cipher(algorithms.AES(aes_key), modes.CBC(iv)).encryptor()
+        # update_into()는 결과를 미리 할당한 버퍼에 직접 써서, 조각마다 새 bytes 객체를 만들지 않습니다.
+        out_buffer = bytearray(chunk_size + block_size)
+        out_view = memoryview(out_buffer)
+        written = 0
+        total = 0
+
+        if isinstance(src, (bytes, bytearray, memoryview)):
+            # 버퍼 입력은 memoryview 슬라이스로 복사 없이 조각을 나눕니다.
+            source_view = memoryview(src).cast('B')
+            chunks = (source_view[i:i + chunk_size] for i in range(0, source_view.nbytes, chunk_size))
+        else:
+            chunks = _read_chunks(src, chunk_size)
+
+        for chunk in chunks:
+            total += len(chunk)
+            if input_size is not None and total > input_size:
+                raise ValueError("입력 크기가 암호화 도중에 바뀌었습니다.")
+            produced = encryptor.update_into(chunk, out_buffer)
+            dst.write(out_view[:produced])
+            written += produced
+
+        # --- 4단계: PKCS7 패딩과 마무리 ---
+        pad_length = block_size - (total % block_size)
+        produced = encryptor.update_into(bytes([pad_length]) * pad_length, out_buffer)
+        dst.write(out_view[:produced])
+        written += produced
+        tail = encryptor.finalize()
+        dst.write(tail)
+        written += len(tail)
+
+        if length_position is not None:
+            end_position = dst.tell()
+            dst.seek(length_position)
+            dst.write(struct.pack('>I', written))
+            dst.seek(end_position)
+        elif written != expected_length:
+            raise ValueError("입력 크기가 암호화 도중에 바뀌었습니다.")
+
+        return RSA_ENCRYPTED_KEY_SIZE + 4 + written
+
+    # 암호화 과정에서 어떤 종류의 오류든 발생하면, 오류 메시지를 출력하고 None을 반환합니다.
+    except Exception as e:
+        # 쓰다 만 레코드가 남지 않도록, dst를 시작 위치로 되돌립니다.
+        if start_position is not None:
+            try:
+                dst.seek(start_position)
+                dst.truncate()
+            except (OSError, ValueError):
+                pass
+        print(f"🚫 [Crypto] 스트리밍 암호화 중 오류 발생: {e}")
+        return None
+
+def _read_chunks(src, chunk_size: int):
+    """
+    파일 객체에서 미리 할당한 버퍼 하나에 반복해서 읽어 들이며(readinto), 읽은 부분의 memoryview를 돌려줍니다.
+    readinto()를 지원하지 않는 객체는 read()로 대신 읽습니다.
+    """
+    if hasattr(src, 'readinto'):
+        in_buffer = bytearray(chunk_size)
+        in_view = memoryview(in_buffer)
+        while True:
+            count = src.readinto(in_buffer)
+            if not count:
+                return
+            yield in_view[:count]
+    else:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+# ==============================================================================
+# 세션(Session) 모드: 세션당 RSA 1회 + 레코드별 AES-GCM
+# ------------------------------------------------------------------------------
+
+class CryptoSession:
+    """
+    하나의 프로세스(세션) 동안 사용하는 AES-GCM 데이터 키와 레코드 일련번호를 관리합니다.
+    - 데이터 키는 메모리에만 존재하며, 로그 파일에는 교수님의 공개키로 감싼(RSA-OAEP) 형태로만 기록됩니다.
+    - nonce는 [0 (4바이트)][일련번호 (8바이트)]로 만들어지며, 세션마다 키가 새로 생성되므로 재사용되지 않습니다.
+    - 레코드 헤더(매직, 세션 ID, 일련번호, 길이)는 AEAD의 추가 인증 데이터(AAD)로 보호됩니다.
+    """
+
+    def __init__(self):
+        self.key = os.urandom(AES_KEY_SIZE)
+        self.session_id = os.urandom(SESSION_ID_SIZE)
+        self.sequence = 0
+        # 세션 헤더를 이미 기록한 로그 파일 경로들입니다.
+        self.header_files = set()
+        self._header = None
+        self._aead = None
+
+    def header(self) -> bytes:
+        """ 데이터 키를 RSA로 감싼 세션 헤더를 반환합니다. RSA 연산은 세션당 한 번만 수행됩니다. """
+        if self._header is None:
+            wrapped_key = get_public_key().encrypt(self.key, _oaep_padding())
+            self._header = (SESSION_MAGIC + b'H' + bytes([SESSION_VERSION])
+                            + self.session_id + wrapped_key)
+        return self._header
+
+    def encrypt(self, data: bytes) -> bytes:
+        """ 데이터 하나를 AES-GCM으로 암호화하여 [레코드 헤더][암호문+태그] 형태로 반환합니다. """
+        if self._aead is None:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            self._aead = AESGCM(self.key)
+        sequence = self.sequence
+        self.sequence += 1
+        record_header = SESSION_RECORD_HEADER.pack(
+            SESSION_MAGIC, b'R', self.session_id, sequence, len(data) + GCM_TAG_SIZE)
+        nonce = _session_nonce(sequence)
+        return record_header + self._aead.encrypt(nonce, data, record_header)
+
+def _session_nonce(sequence: int) -> bytes:
+    """ 일련번호로 12바이트 AES-GCM nonce를 만듭니다. """
+    return b'\x00\x00\x00\x00' + struct.pack('>Q', sequence)
+
+# 현재 프로세스의 세션 객체를 한 번만 만들기 위한 캐시 변수입니다.
+_session_cache = None
+
+def get_session() -> CryptoSession:
+    """ 현재 프로세스의 암호화 세션을 반환합니다. 처음 호출될 때 새 세션을 만듭니다. """
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = CryptoSession()
+    return _session_cache
+
+def encrypt_session_record(data: bytes, log_file: str, new_file: bool = False) -> bytes | None:
+    """
+    세션 모드로 데이터를 암호화합니다.
+    이 세션에서 log_file에 아직 세션 헤더를 기록하지 않았다면, 헤더를 레코드 앞에 붙여서 반환합니다.
+    - data: 암호화할 원본 데이터 (바이트 형태)
+    - log_file: 결과를 이어 쓸(append) 로그 파일 경로
+    - new_file: True이면 로그 파일을 새로 쓰는(덮어쓰는) 경우로 보고, 항상 헤더를 붙입니다.
+    - 반환값: [세션 헤더 (필요한 경우)][데이터 레코드], 실패 시 None
+    """
+    try:
+        session = get_session()
+        prefix = b''
+        # 로그 파일이 중간에 삭제/교체되었을 수도 있으므로, 파일이 비어 있으면 헤더를 다시 씁니다.
+        if (new_file or log_file not in session.header_files
+                or not os.path.exists(log_file) or os.path.getsize(log_file) == 0):
+            prefix = session.header()
+            session.header_files.add(log_file)
+        return prefix + session.encrypt(data)
+    except Exception as e:
+        print(f"🚫 [Crypto] 데이터 암호화 중 오류 발생: {e}")
+        return None
+
+
+# ==============================================================================
+# 복호화 (평가자 도구 및 테스트용, 교수님의 개인키가 필요합니다)
+# ------------------------------------------------------------------------------
+
+def decrypt_data(blob: bytes, private_key) -> bytes:
+    """
+    encrypt_data()로 만든 기존(legacy) 형식의 레코드 하나를 복호화합니다.
+    - blob: [RSA로 암호화된 AES키+IV (256바이트)][데이터 길이 (4바이트)][AES-CBC 암호문]
+    - private_key: cryptography 라이브러리의 RSA 개인키 객체
+    """
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.primitives import padding as aes_padding
+
+    session_key = private_key.decrypt(blob[:RSA_ENCRYPTED_KEY_SIZE], _oaep_padding())
+    aes_key, iv = session_key[:AES_KEY_SIZE], session_key[AES_KEY_SIZE:]
+    (length,) = struct.unpack_from('>I', blob, RSA_ENCRYPTED_KEY_SIZE)
+    start = RSA_ENCRYPTED_KEY_SIZE + 4
+    decryptor = Cipher(algorithms.AES(aes_key), modes.CBC(iv)).decryptor()
+    padded = decryptor.update(blob[start:start + length]) + decryptor.finalize()
+    unpadder = aes_padding.PKCS7(algorithms.AES.block_size).unpadder()
+    return unpadder.update(padded) + unpadder.finalize()
+
+def iter_raw_records(stream):
+    """
+    암호화된 레코드들이 이어 붙여진 바이너리 스트림에서 레코드를 하나씩 읽어 나눕니다. (복호화는 하지 않습니다)
+    파일 전체를 메모리에 올리지 않고, 레코드 하나씩만 읽습니다.
+    기존 형식 레코드와 세션 모드 레코드가 섞여 있어도 나눌 수 있습니다.
+    - stream: 읽을 수 있는 바이너리 파일 객체 (e.g., open(path, 'rb'), io.BytesIO)
+    - 반환값: (종류, 레코드 바이트) 튜플을 차례로 돌려주는 제너레이터
+      종류는 'legacy', 'session_header', 'session_record' 중 하나입니다.
+    """
+    def read_exact(size, head=b''):
+        data = head + stream.read(size - len(head))
+        if len(data) < size:
+            raise ValueError("레코드가 중간에 잘려 있습니다.")
+        return data
+
+    while True:
+        head = stream.read(len(SESSION_MAGIC) + 1)
+        if not head:
+            return
+        if head.startswith(SESSION_MAGIC):
+            if head[-1:] == b'H':
+                yield 'session_header', read_exact(SESSION_HEADER_SIZE, head)
+                continue
+            record_header = read_exact(SESSION_RECORD_HEADER.size, head)
+            length = SESSION_RECORD_HEADER.unpack(record_header)[-1]
+            yield 'session_record', record_header + read_exact(length)
+        else:
+            prefix = read_exact(RSA_ENCRYPTED_KEY_SIZE + 4, head)
+            (length,) = struct.unpack_from('>I', prefix, RSA_ENCRYPTED_KEY_SIZE)
+            yield 'legacy', prefix + read_exact(length)
+
+def split_records(data: bytes):
+    """
+    암호화된 레코드들이 이어 붙여진 바이트열을 레코드 단위로 나눕니다. (복호화는 하지 않습니다)
+    - 반환값: iter_raw_records()와 같은 (종류, 레코드 바이트) 튜플의 제너레이터
+    """
+    import io
+    return iter_raw_records(io.BytesIO(data))
+
+def session_id_of(record: bytes) -> bytes:
+    """ 세션 헤더 또는 세션 레코드에서 세션 ID를 꺼냅니다. """
+    start = len(SESSION_MAGIC) + (2 if record[len(SESSION_MAGIC):len(SESSION_MAGIC) + 1] == b'H' else 1)
+    return record[start:start + SESSION_ID_SIZE]
+
+def unwrap_session_header(header: bytes, private_key):
+    """ 세션 헤더의 데이터 키를 개인키로 풀어, 복호화에 사용할 AESGCM 객체를 반환합니다. """
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    wrapped_key = header[SESSION_HEADER_SIZE - RSA_ENCRYPTED_KEY_SIZE:SESSION_HEADER_SIZE]
+    return AESGCM(private_key.decrypt(wrapped_key, _oaep_padding()))
+
+def decrypt_session_record(record: bytes, aead) -> bytes:
+    """ 세션 레코드 하나를 unwrap_session_header()로 얻은 AESGCM 객체로 복호화합니다. """
+    _, _, _, sequence, length = SESSION_RECORD_HEADER.unpack_from(record, 0)
+    record_header = record[:SESSION_RECORD_HEADER.size]
+    ciphertext = record[SESSION_RECORD_HEADER.size:SESSION_RECORD_HEADER.size + length]
+    return aead.decrypt(_session_nonce(sequence), ciphertext, record_header)
+
+def decrypt_records(data: bytes, private_key) -> list[bytes]:
+    """
+    로그 파일 전체(bytes)를 레코드 단위로 나누어 복호화합니다.
+    기존 형식 레코드와 세션 모드 레코드가 섞여 있어도 모두 읽을 수 있습니다.
+    압축된 레코드(codec 모듈)는 압축을 풀어 돌려줍니다.
+    - 반환값: 각 레코드의 원본 데이터 목록 (세션 헤더는 결과에 포함되지 않습니다)
+    """
+    from . import codec
+    sessions = {}
+    records = []
+    for kind, record in split_records(data):
+        if kind == 'session_header':
+            sessions[session_id_of(record)] = unwrap_session_header(record, private_key)
+        elif kind == 'session_record':
+            session_id = session_id_of(record)
+            if session_id not in sessions:
+                raise ValueError("세션 헤더가 없는 레코드입니다.")
+            records.append(decrypt_session_record(record, sessions[session_id]))
+        else:
+            records.append(decrypt_data(record, private_key))
+    return codec.decode_records(records)
@@ -0,0 +1,383 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Grade Sheet Row Index (v1.0)
+# ------------------------------------------------------------------------------
+# 성적 CSV 파일(assets/sample.csv 형식)에서 학번으로 학생 한 명의 행을, 파일 전체를 훑지 않고 바로 찾기 위한
+# 인덱스 모듈입니다. 학번 순으로 정렬한 (학번 -> 행의 바이트 위치) 목록을 인덱스 파일(sample.csv.idx)에 저장하고,
+# 이 파일을 메모리 맵(mmap)으로 열어 이진 탐색한 뒤 CSV 파일의 해당 위치로 바로 이동(seek)하여 행을 읽습니다.
+#
+# [인덱스 파일 형식] <CSV 파일>.idx
+#   [파일 헤더 (128)] : ROW_INDEX_MAGIC (4) + 버전 (1) + 예약 (3) + CSV 파일 크기 (8) + CSV 수정 시각(ns) (8)
+#                       + 인덱스에 반영한 바이트 수 (8) + 그 바이트들의 SHA-256 (32) + 키 열 이름 (64, UTF-8)
+#   [인덱스 항목] ... : 키 (8) + 행의 바이트 위치 (8), 키 순으로 정렬 (같은 키는 파일 순서)
+#   모든 정수는 little-endian 부호 있는 64비트입니다.
+#
+# 인덱스가 오래되었는지(CSV 파일이 바뀌었는지)는 다음 순서로 판단합니다. (index_status())
+#   1. CSV 파일의 크기와 수정 시각이 헤더와 같으면 최신 상태입니다. ('fresh')
+#   2. 다르면 헤더에 기록한 바이트 수만큼의 SHA-256을 다시 계산합니다.
+#      - 같고 크기도 같으면 수정 시각만 바뀐 것이므로 헤더만 고칩니다. ('touched')
+#      - 같고 파일이 커졌으면 뒤에 행이 추가된 것이므로, 추가된 부분만 읽어 기존 항목과 합칩니다. ('appended')
+#      - 다르면 인덱스를 처음부터 다시 만듭니다. ('stale')
+#   크기와 수정 시각이 모두 같은 채로 내용만 바뀐 경우는 verify=True일 때만 찾아낼 수 있습니다.
+#
+# 마지막 행이 줄바꿈으로 끝나지 않으면 아직 기록 중일 수 있으므로, 그 행은 색인하되 '반영한 바이트 수'에는
+# 포함하지 않습니다. 다음 증분 갱신 때 그 행을 다시 읽습니다.
+#
+# 사용 예:
+#   with RowIndex("assets/sample.csv") as index:
+#       print(index.get(2023000003))
+#       print(index.get_many([2023000003, 2024000004, 1]))
+# ==============================================================================
+
+import bisect
+import csv
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# 인덱스 파일 헤더의 매직 값입니다. (컨테이너 로그의 0xFE 매직 값들과 같은 방식)
+ROW_INDEX_MAGIC = b'\xfeMPR'
+ROW_INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sB3xQqQ32s64s')
+INDEX_ENTRY = struct.Struct('<qq')
+
+# 기본 키 열과 CSV 파일의 인코딩입니다.
+DEFAULT_KEY_COLUMN = "학번"
+DEFAULT_ENCODING = 'utf-8-sig'
+# SHA-256을 계산할 때 한 번에 읽는 크기(바이트)입니다.
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 인덱스 상태 값입니다. (index_status()의 반환값)
+FRESH = 'fresh'
+TOUCHED = 'touched'
+APPENDED = 'appended'
+STALE = 'stale'
+MISSING = 'missing'
+
+
+def index_path(csv_path: str) -> str:
+    """ CSV 파일에 대응되는 인덱스 파일 경로를 반환합니다. """
+    return csv_path + '.idx'
+
+
+def _iter_records(f, offset: int) -> Iterator[Tuple[int, bytes]]:
+    """
+    바이너리 모드로 열린 CSV 파일의 현재 위치(offset)부터 (행의 시작 위치, 행의 바이트)를 차례로 돌려줍니다.
+    큰따옴표의 수가 홀수인 줄은 따옴표 안의 줄바꿈이므로 다음 줄과 합쳐 하나의 행으로 만듭니다.
+    """
+    start, pending = offset, None
+    for line in f:
+        if pending is None:
+            start, record = offset, line
+        else:
+            record = pending + line
+        offset += len(line)
+        # 이어 붙이는 중인 행은 따옴표가 없는 줄(여러 줄 필드의 가운데 줄)이 와도 짝이 맞을 때까지 계속 합칩니다.
+        if (pending is not None or b'"' in line) and record.count(b'"') % 2:
+            pending = record
+            continue
+        pending = None
+        yield start, record
+    if pending is not None:
+        yield start, pending
+
+
+def _parse_record(record: bytes, encoding: str = 'utf-8') -> List[str]:
+    return next(csv.reader([record.decode(encoding)]), [])
+
+
+def _digest(path: str, end: int) -> bytes:
+    """ 파일의 처음 end 바이트의 SHA-256을 계산합니다. """
+    hasher = hashlib.sha256()
+    position = 0
+    with open(path, 'rb') as f:
+        while position < end:
+            data = f.read(min(HASH_CHUNK_SIZE, end - position))
+            if not data:
+                raise ValueError("CSV 파일이 예상보다 짧습니다.")
+            hasher.update(data)
+            position += len(data)
+    return hasher.digest()
+
+
+def _scan(csv_path: str, key_column: str, start: int = 0) -> Tuple[array, array, int]:
+    """
+    CSV 파일을 start 위치부터 읽어 (키 배열, 바이트 위치 배열, 반영한 바이트 수)를 반환합니다.
+    첫 행(헤더)은 색인하지 않으며, start가 헤더 안쪽이면 헤더 다음부터 읽습니다. 키가 비어 있는 행은 색인하지 않습니다.
+    """
+    keys, offsets = array('q'), array('q')
+    with open(csv_path, 'rb') as f:
+        header, header_end = _read_header(f)
+        if key_column not in header:
+            raise KeyError(f"헤더에 없는 열 이름입니다: {key_column}")
+        position = header.index(key_column)
+        complete = max(start, header_end)
+        f.seek(complete)
+        for offset, record in _iter_records(f, complete):
+            if record.endswith(b'\n'):
+                complete = offset + len(record)
+            if b'"' in record:
+                fields = _parse_record(record)
+                field = fields[position] if position < len(fields) else ''
+            else:
+                fields = record.split(b',', position + 1)
+                field = fields[position] if position < len(fields) else b''
+            field = field.strip()
+            if not field:
+                continue
+            try:
+                keys.append(int(field))
+            except ValueError:
+                raise ValueError(f"'{key_column}' 열의 값 {field!r}이(가) 정수가 아닙니다. (바이트 위치 {offset})") from None
+            offsets.append(offset)
+    return keys, offsets, complete
+
+
+def _read_header(f) -> Tuple[List[str], int]:
+    """ 바이너리 모드로 열린 CSV 파일의 첫 행(헤더)을 읽어 (열 이름 목록, 헤더가 끝나는 위치)를 반환합니다. """
+    f.seek(0)
+    for _, record in _iter_records(f, 0):
+        return _parse_record(record, DEFAULT_ENCODING), len(record)
+    return [], 0
+
+
+def _read_index(index_file: str) -> Optional[dict]:
+    """ 인덱스 파일의 헤더를 읽습니다. 파일이 없거나 형식이 맞지 않으면 None을 반환합니다. """
+    try:
+        with open(index_file, 'rb') as f:
+            data = f.read(INDEX_HEADER.size)
+            size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return None
+    if len(data) < INDEX_HEADER.size or (size - INDEX_HEADER.size) % INDEX_ENTRY.size:
+        return None
+    magic, version, source_size, mtime_ns, indexed_bytes, digest, key_column = INDEX_HEADER.unpack(data)
+    if magic != ROW_INDEX_MAGIC or version != ROW_INDEX_VERSION:
+        return None
+    return {"source_size": source_size, "mtime_ns": mtime_ns, "indexed_bytes": indexed_bytes, "digest": digest,
+            "key_column": key_column.rstrip(b'\0').decode('utf-8', 'replace'),
+            "count": (size - INDEX_HEADER.size) // INDEX_ENTRY.size}
+
+
+def _write_index(index_file: str, csv_stat: os.stat_result, indexed_bytes: int, digest: bytes, key_column: str,
+                 keys: array, offsets: array):
+    """ 정렬된 키와 위치 배열로 인덱스 파일을 새로 씁니다. 임시 파일에 쓴 뒤 한 번에 바꿔치기합니다. """
+    entries = array('q', bytes(INDEX_ENTRY.size * len(keys)))
+    entries[0::2] = keys
+    entries[1::2] = offsets
+    if sys.byteorder != 'little':
+        entries.byteswap()
+    temp_file = index_file + '.tmp'
+    with open(temp_file, 'wb') as f:
+        f.write(INDEX_HEADER.pack(ROW_INDEX_MAGIC, ROW_INDEX_VERSION, csv_stat.st_size, csv_stat.st_mtime_ns,
+                                  indexed_bytes, digest, key_column.encode('utf-8')))
+        f.write(entries.tobytes())
+    os.replace(temp_file, index_file)
+
+
+def _load_entries(index_file: str) -> Tuple[array, array]:
+    with open(index_file, 'rb') as f:
+        f.seek(INDEX_HEADER.size)
+        entries = array('q', f.read())
+    if sys.byteorder != 'little':
+        entries.byteswap()
+    return entries[0::2], entries[1::2]
+
+
+def _sorted_by_key(keys: array, offsets: array) -> Tuple[array, array]:
+    # 안정 정렬이므로 같은 키는 파일 순서가 유지됩니다. 정렬된 기존 항목 뒤에 새 항목을 이어 붙인 경우에는
+    # timsort가 기존 항목을 하나의 구간으로 인식하여, 새 항목만 정렬한 뒤 병합합니다.
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return array('q', map(keys.__getitem__, order)), array('q', map(offsets.__getitem__, order))
+
+
+def index_status(csv_path: str, index_file: Optional[str] = None, key_column: str = DEFAULT_KEY_COLUMN,
+                 verify: bool = False) -> str:
+    """
+    인덱스 파일의 상태를 반환합니다: 'fresh', 'touched', 'appended', 'stale', 'missing' (모듈 설명 참고)
+    - verify: True이면 크기와 수정 시각이 같아도 SHA-256으로 내용을 확인합니다.
+    """
+    info = _read_index(index_file or index_path(csv_path))
+    if info is None or info["key_column"] != key_column:
+        return MISSING
+    csv_stat = os.stat(csv_path)
+    if csv_stat.st_size == info["source_size"] and csv_stat.st_mtime_ns == info["mtime_ns"] and not verify:
+        return FRESH
+    if csv_stat.st_size < info["indexed_bytes"]:
+        return STALE
+    if _digest(csv_path, info["indexed_bytes"]) != info["digest"]:
+        return STALE
+    if csv_stat.st_size == info["source_size"]:
+        return FRESH if csv_stat.st_mtime_ns == info["mtime_ns"] else TOUCHED
+    return APPENDED
+
+
+def build_index(csv_path: str, index_file: Optional[str] = None, key_column: str = DEFAULT_KEY_COLUMN,
+                verify: bool = False) -> str:
+    """
+    인덱스 파일을 최신 상태로 만들고, 갱신하기 전의 상태('fresh', 'touched', 'appended', 'stale', 'missing')를 반환합니다.
+    - 'appended'이면 추가된 부분만 읽어 기존 항목과 합치고, 'stale'/'missing'이면 처음부터 다시 만듭니다.
+    CSV 파일이 없으면 OSError, 키 열이 헤더에 없으면 KeyError, 키가 정수가 아니면 ValueError가 발생합니다.
+    """
+    index_file = index_file or index_path(csv_path)
+    status = index_status(csv_path, index_file, key_column, verify)
+    if status == FRESH:
+        return status
+    info = _read_index(index_file)
+    csv_stat = os.stat(csv_path)
+    if status == TOUCHED:
+        keys, offsets = _load_entries(index_file)
+        _write_index(index_file, csv_stat, info["indexed_bytes"], info["digest"], key_column, keys, offsets)
+        return status
+    if status == APPENDED:
+        old_keys, old_offsets = _load_entries(index_file)
+        start = info["indexed_bytes"]
+        # 지난번에 줄바꿈 없이 끝났던 마지막 행은 다시 읽으므로 기존 항목에서 뺍니다.
+        if old_offsets and max(old_offsets) >= start:
+            kept = [i for i, offset in enumerate(old_offsets) if offset < start]
+            old_keys = array('q', map(old_keys.__getitem__, kept))
+            old_offsets = array('q', map(old_offsets.__getitem__, kept))
+        new_keys, new_offsets, indexed_bytes = _scan(csv_path, key_column, start)
+        keys, offsets = _sorted_by_key(old_keys + new_keys, old_offsets + new_offsets)
+    else:
+        keys, offsets, indexed_bytes = _scan(csv_path, key_column)
+        keys, offsets = _sorted_by_key(keys, offsets)
+    digest = _digest(csv_path, indexed_bytes)
+    # 읽는 도중 파일이 바뀌었을 수 있으므로, 다시 확인한 크기/시각이 아니라 읽기 시작 전의 값을 기록합니다.
+    _write_index(index_file, csv_stat, indexed_bytes, digest, key_column, keys, offsets)
+    return status
+
+
+class RowIndex:
+    """
+    인덱스 파일을 메모리 맵으로 열어 키(학번)로 CSV 행을 찾습니다.
+    - 열 때와 조회할 때마다 CSV 파일의 크기/수정 시각을 확인하여, 바뀌었으면 인덱스를 갱신(build_index)합니다.
+    - header: CSV 파일의 열 이름 목록
+    - get(key): 키가 같은 첫 행을 {열 이름: 값}으로, 없으면 None
+    - get_all(key): 키가 같은 모든 행의 목록 (파일 순서)
+    - get_many(keys): 여러 키를 한 번에 찾습니다. 키를 정렬해 인덱스를 한 번 훑고, 행은 파일 순서로 읽습니다.
+    """
+
+    def __init__(self, csv_path: str, key_column: str = DEFAULT_KEY_COLUMN, index_file: Optional[str] = None,
+                 verify: bool = False):
+        self.csv_path = csv_path
+        self.key_column = key_column
+        self.index_file = index_file or index_path(csv_path)
+        self.last_status = None
+        self.header: List[str] = []
+        self._csv = None
+        self._map = None
+        self._view = None
+        self._keys = self._offsets = ()
+        self._stamp = None
+        self.refresh(verify)
+
+    def refresh(self, verify: bool = False) -> str:
+        """ 인덱스를 최신 상태로 갱신하고 다시 엽니다. 갱신하기 전의 상태를 반환합니다. """
+        self._release()
+        self.last_status = build_index(self.csv_path, self.index_file, self.key_column, verify)
+        self._csv = open(self.csv_path, 'rb')
+        self.header, _ = _read_header(self._csv)
+        with open(self.index_file, 'rb') as f:
+            info = _read_index(self.index_file)
+            self._stamp = (info["source_size"], info["mtime_ns"])
+            if info["count"]:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map is None:
+            self._keys = self._offsets = ()
+        elif sys.byteorder == 'little':
+            # 항목을 64비트 정수의 배열로 보고, 짝수 번째(키)와 홀수 번째(위치)를 복사 없이 나누어 봅니다.
+            self._view = memoryview(self._map)[INDEX_HEADER.size:].cast('q')
+            self._keys, self._offsets = self._view[0::2], self._view[1::2]
+        else:
+            self._keys, self._offsets = _load_entries(self.index_file)
+        return self.last_status
+
+    def _check(self):
+        csv_stat = os.stat(self.csv_path)
+        if (csv_stat.st_size, csv_stat.st_mtime_ns) != self._stamp:
+            self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _range(self, key: int, low: int = 0) -> Tuple[int, int]:
+        start = bisect.bisect_left(self._keys, key, low)
+        return start, bisect.bisect_right(self._keys, key, start)
+
+    def _read_row(self, offset: int) -> Dict[str, str]:
+        self._csv.seek(offset)
+        _, record = next(_iter_records(self._csv, offset))
+        return dict(zip(self.header, _parse_record(record)))
+
+    def offsets(self, key: Union[int, str]) -> List[int]:
+        """ 키가 같은 행들의 바이트 위치 목록을 반환합니다. """
+        self._check()
+        start, end = self._range(int(key))
+        return list(self._offsets[start:end])
+
+    def get_all(self, key: Union[int, str]) -> List[Dict[str, str]]:
+        return [self._read_row(offset) for offset in self.offsets(key)]
+
+    def get(self, key: Union[int, str]) -> Optional[Dict[str, str]]:
+        self._check()
+        start, end = self._range(int(key))
+        return self._read_row(self._offsets[start]) if end > start else None
+
+    def get_many(self, keys: Iterable[Union[int, str]], all_matches: bool = False) -> dict:
+        """
+        여러 키의 행을 한 번에 찾아 {키: 행}을 반환합니다. (없는 키는 None, all_matches=True이면 {키: 행 목록})
+        정렬한 키 순서로 인덱스를 앞에서 뒤로 한 번만 탐색하고, 찾은 행들은 파일 안의 위치 순서로 읽습니다.
+        """
+        self._check()
+        requested = list(keys)
+        found: Dict[int, List[int]] = {}
+        low = 0
+        for key in sorted(set(map(int, requested))):
+            start, end = self._range(key, low)
+            if end > start:
+                found[key] = list(self._offsets[start:end])
+            low = end
+        rows = {offset: None for offset in sorted(offset for offsets in found.values() for offset in offsets)}
+        for offset in rows:
+            rows[offset] = self._read_row(offset)
+        result = {}
+        for key in requested:
+            matches = [rows[offset] for offset in found.get(int(key), ())]
+            result[key] = matches if all_matches else (matches[0] if matches else None)
+        return result
+
+    def _release(self):
+        if self._view is not None:
+            self._keys.release()
+            self._offsets.release()
+            self._view.release()
+            self._view = None
+        self._keys = self._offsets = ()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._csv is not None:
+            self._csv.close()
+            self._csv = None
+
+    def close(self):
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
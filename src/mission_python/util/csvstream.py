@@ -0,0 +1,167 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Streaming CSV Rows (v1.0)
+# ------------------------------------------------------------------------------
+# assets/sample.csv 같은 성적 CSV 파일을 한 행씩 읽어 돌려주는 모듈입니다.
+#
+# - 파일을 chunk_size 크기의 버퍼로 나누어 읽고, 행을 하나씩 만들어 돌려주므로(제너레이터)
+#   백만 행이 넘는 파일도 일정한 메모리로 끝까지 읽을 수 있습니다.
+# - 큰따옴표로 감싼 필드 안의 쉼표, 줄바꿈, 두 번 쓴 큰따옴표("")를 올바르게 처리합니다. (RFC 4180, csv 모듈)
+# - 첫 행을 헤더로 읽어, 열 이름으로 필드를 찾거나(index) 필요한 열만 골라 읽을 수 있습니다. (records)
+# - 빈 행은 건너뜁니다. 파일 맨 앞의 BOM(\ufeff)은 기본 인코딩(utf-8-sig)에서 자동으로 제거됩니다.
+#
+# 사용 예:
+#   with open_rows("assets/sample.csv") as rows:
+#       print(rows.header)
+#       for record in rows.records(["학번", "총점"]):
+#           print(record["학번"], record["총점"])
+# (측정: benchmarks/bench_csv.py)
+# ==============================================================================
+
+import csv
+import io
+import operator
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+# 파일을 읽을 때 한 번에 읽어 들이는 버퍼의 크기(바이트)입니다.
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_ENCODING = 'utf-8-sig'
+
+
+class CsvFormatError(ValueError):
+    """ 행의 필드 수가 헤더와 다르거나 헤더에 같은 이름이 두 번 나오는 등, CSV 형식이 올바르지 않을 때 발생합니다. """
+
+
+class RowStream:
+    """
+    CSV 파일의 행을 차례로 돌려주는 스트림입니다. (open_rows()로 만듭니다)
+    - header: 첫 행(헤더)의 열 이름 목록, has_header=False이거나 파일이 비어 있으면 None
+    - line_num: 지금까지 읽은 원본 파일의 줄 수 (따옴표 안의 줄바꿈도 한 줄로 셉니다)
+    - 이 객체를 반복(for)하면 헤더를 제외한 데이터 행(문자열 목록)을 차례로 돌려줍니다.
+    """
+
+    def __init__(self, stream, has_header: bool = True, strict: bool = False, delimiter: str = ',',
+                 owns_stream: bool = False):
+        self._stream = stream
+        self._owns_stream = owns_stream
+        self._reader = csv.reader(stream, delimiter=delimiter, strict=True)
+        self.strict = strict
+        self.header: Optional[List[str]] = None
+        self._positions: Dict[str, int] = {}
+        if has_header:
+            self.header = next(self._rows(), None)
+            if self.header is not None:
+                for position, name in enumerate(self.header):
+                    if name in self._positions:
+                        raise CsvFormatError(f"헤더에 같은 열 이름이 두 번 나옵니다: {name}")
+                    self._positions[name] = position
+
+    @property
+    def line_num(self) -> int:
+        return self._reader.line_num
+
+    def _rows(self) -> Iterator[List[str]]:
+        # 빈 행([])을 건너뜁니다. filter()는 행마다 파이썬 코드를 실행하지 않아 빠릅니다.
+        return filter(None, self._reader)
+
+    def __iter__(self) -> Iterator[List[str]]:
+        if not self.strict or self.header is None:
+            return self._rows()
+        return self._checked_rows()
+
+    def __next__(self) -> List[str]:
+        for row in self:
+            return row
+        raise StopIteration
+
+    def _checked_rows(self) -> Iterator[List[str]]:
+        width = len(self.header)
+        for row in self._rows():
+            if len(row) != width:
+                raise CsvFormatError(
+                    f"{self.line_num}번째 줄의 필드 수({len(row)})가 헤더의 열 수({width})와 다릅니다.")
+            yield row
+
+    def index(self, name: str) -> int:
+        """ 열 이름의 위치(0부터 시작)를 반환합니다. 없는 이름이면 KeyError가 발생합니다. """
+        if name not in self._positions:
+            raise KeyError(f"헤더에 없는 열 이름입니다: {name}")
+        return self._positions[name]
+
+    def records(self, fields: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        데이터 행을 {열 이름: 값} 딕셔너리로 돌려줍니다.
+        - fields: 돌려줄 열 이름 목록 (None이면 헤더의 모든 열)
+        필드 수가 헤더보다 적은 행의 빠진 값은 None입니다. (strict=True이면 CsvFormatError)
+        """
+        if self.header is None:
+            raise CsvFormatError("헤더가 없는 CSV 파일은 열 이름으로 읽을 수 없습니다.")
+        names = list(self.header if fields is None else fields)
+        positions = [self.index(name) for name in names]
+        if not positions:
+            yield from ({} for _ in self)
+            return
+        # 필드가 모두 있는 행은 itemgetter로 필요한 값만 한 번에 꺼냅니다. (행마다 파이썬 반복을 하지 않아 빠릅니다)
+        # positions[0]을 한 번 더 넣어, 열이 하나일 때도 항상 튜플을 받도록 합니다. (zip은 names 길이에서 멈춥니다)
+        getter = operator.itemgetter(*positions, positions[0])
+        needed = max(positions) + 1
+        for row in self:
+            width = len(row)
+            if width >= needed:
+                yield dict(zip(names, getter(row)))
+            else:
+                yield {name: (row[position] if position < width else None)
+                       for name, position in zip(names, positions)}
+
+    def close(self):
+        if self._owns_stream:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_rows(source: Union[str, io.TextIOBase], has_header: bool = True, strict: bool = False,
+              encoding: str = DEFAULT_ENCODING, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              delimiter: str = ',') -> RowStream:
+    """
+    CSV 파일(경로 또는 이미 열린 텍스트 스트림)을 행 스트림으로 엽니다.
+    - has_header: True이면 첫 행을 헤더로 읽습니다.
+    - strict: True이면 필드 수가 헤더와 다른 행에서 CsvFormatError가 발생합니다.
+    - chunk_size: 파일을 읽는 버퍼의 크기(바이트)
+    파일을 열 수 없거나 인코딩이 맞지 않으면 OSError, UnicodeDecodeError가 그대로 발생합니다.
+    따옴표가 닫히지 않은 등 CSV 문법이 올바르지 않으면 csv.Error가 발생합니다.
+    """
+    if isinstance(source, str):
+        # newline=''로 열어야 따옴표 안의 줄바꿈을 csv 모듈이 그대로 처리할 수 있습니다.
+        stream = open(source, 'r', encoding=encoding, newline='', buffering=chunk_size)
+        try:
+            return RowStream(stream, has_header, strict, delimiter, owns_stream=True)
+        except BaseException:
+            stream.close()
+            raise
+    return RowStream(source, has_header, strict, delimiter)
+
+
+def iter_rows(source: Union[str, io.TextIOBase], has_header: bool = True, **options) -> Iterator[List[str]]:
+    """ 헤더를 제외한 데이터 행들을 차례로 돌려줍니다. (open_rows()와 같은 옵션) """
+    with open_rows(source, has_header, **options) as rows:
+        yield from rows
+
+
+def iter_records(source: Union[str, io.TextIOBase], fields: Optional[Sequence[str]] = None,
+                 **options) -> Iterator[Dict[str, Optional[str]]]:
+    """ 데이터 행들을 {열 이름: 값} 딕셔너리로 차례로 돌려줍니다. (RowStream.records() 참고) """
+    with open_rows(source, **options) as rows:
+        yield from rows.records(fields)
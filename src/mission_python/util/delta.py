@@ -0,0 +1,224 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Compact Delta Utility (v1.0)
+# ------------------------------------------------------------------------------
+# 로그에 기록되는 변경 이력(diff)을 만들고, 다시 적용(replay)하는 기능을 모아둔 모듈입니다.
+#
+# [로그 항목(entry)의 종류]
+# - 'initial'  : 🦊=== Code Change Tracking Started at ... === (최초 전체 버전)
+# - 'changes'  : 🦊=== Code changes at ... ===  (파일 전체를 문맥으로 포함한 diff)
+# - 'delta'    : 🦊=== Code delta at ... ===    (변경된 부분(hunk)만 담은 압축 diff)
+# - 'keyframe' : 🦊=== Keyframe at ... ===      (주기적으로 기록되는 전체 버전 스냅샷)
+#
+# 여러 파일 추적 모드에서는 한 번의 실행에서 바뀐 모든 파일의 항목이 하나의 레코드에 이어서 기록되며,
+# 각 항목의 헤더에 파일 이름(e.g., 'Code delta in assets/sample.csv')이 포함됩니다.
+#
+# 'initial'과 'keyframe'은 그 자체로 완전한 버전이므로, 특정 버전을 복원할 때는
+# 가장 가까운 스냅샷부터 그 뒤의 diff들만 적용하면 됩니다.
+# ==============================================================================
+
+import re
+from typing import Dict, List, Optional
+
+from . import diffengine
+
+# "@@ -3,2 +3,4 @@" 형식의 hunk 헤더를 분석하는 정규식입니다.
+_HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+
+# 로그 항목의 첫 줄(헤더)을 분석하는 정규식입니다.
+# 여러 파일 추적 모드에서는 "🦊=== Code delta in assets/sample.csv at ... ===" 처럼 파일 이름이 함께 기록됩니다.
+_ENTRY_HEADER = re.compile(
+    r'^🦊=== (Code Change Tracking Started|Code changes|Code delta|Keyframe)(?: in (.+?))? at (.+?) ===$')
+# 하나의 레코드에 여러 항목이 담긴 경우(여러 파일 추적 모드), 항목 사이의 경계를 찾는 정규식입니다.
+_ENTRY_BOUNDARY = re.compile(
+    r'\n\n(?=🦊=== (?:Code Change Tracking Started|Code changes|Code delta|Keyframe)(?: in .+?)? at .+? ===(?:\n|$))')
+# 스냅샷 항목의 두 번째 줄(파일 이름)을 분석하는 정규식입니다.
+_SNAPSHOT_HEADER = re.compile(r'^🦊=== (?:Initial|Full) version of (.+?) ===$')
+
+_ENTRY_KINDS = {
+    "Code Change Tracking Started": "initial",
+    "Code changes": "changes",
+    "Code delta": "delta",
+    "Keyframe": "keyframe",
+}
+
+
+def to_log_lines(content: str) -> List[str]:
+    """
+    파일 내용을 로그에서 사용하는 '줄 목록'으로 변환합니다.
+    utility 모듈과 같은 방식(splitlines + 줄바꿈 문자 제거)을 사용해야 diff가 정확히 적용됩니다.
+    """
+    return [line.rstrip('\r\n') for line in content.splitlines(keepends=True)]
+
+
+def make_delta(old_lines: List[str], new_lines: List[str],
+               algorithm: str = diffengine.DEFAULT_ALGORITHM) -> List[str]:
+    """
+    두 버전 사이의 변경된 부분(hunk)만 담은 압축 diff를 만듭니다. (문맥 줄 없음, n=0)
+    - old_lines, new_lines: splitlines(keepends=True)로 나눈 이전/현재 버전의 줄 목록
+    - algorithm: diff 알고리즘 (diffengine.ALGORITHMS 중 하나)
+    - 반환값: 줄바꿈 문자가 제거된 unified diff 줄 목록
+    """
+    return [
+        line.rstrip('\r\n')
+        for line in diffengine.unified_diff(
+            old_lines, new_lines,
+            fromfile='previous version', tofile='current version', n=0, algorithm=algorithm
+        )
+    ]
+
+
+def apply_diff(base_lines: List[str], diff_lines: List[str]) -> List[str]:
+    """
+    unified diff를 이전 버전에 적용하여 새 버전을 만듭니다.
+    문맥 줄이 없는 압축 diff와, 파일 전체를 문맥으로 포함한 diff 모두 처리할 수 있습니다.
+    - base_lines: 이전 버전의 줄 목록 (줄바꿈 문자 없음)
+    - diff_lines: 적용할 diff 줄 목록 (줄바꿈 문자 없음)
+    - 반환값: 새 버전의 줄 목록
+    diff가 이전 버전과 맞지 않으면 ValueError가 발생합니다.
+    """
+    result: List[str] = []
+    cursor = 0
+    index = 0
+    total = len(diff_lines)
+
+    while index < total:
+        match = _HUNK_HEADER.match(diff_lines[index])
+        index += 1
+        # hunk 헤더 이전의 '--- previous version', '+++ current version' 줄은 건너뜁니다.
+        if not match:
+            continue
+
+        old_start = int(match.group(1))
+        old_count = int(match.group(2)) if match.group(2) is not None else 1
+        new_count = int(match.group(4)) if match.group(4) is not None else 1
+        # 삭제되는 줄이 없는 hunk(old_count == 0)는 'old_start 번째 줄 뒤에 삽입'을 의미합니다.
+        start = old_start - 1 if old_count else old_start
+        if start < cursor or start > len(base_lines):
+            raise ValueError(f"diff를 적용할 수 없습니다: 잘못된 hunk 위치 ({diff_lines[index - 1]})")
+
+        result.extend(base_lines[cursor:start])
+        cursor = start
+
+        # hunk 헤더에 적힌 줄 수만큼만 읽어야, '---'로 시작하는 삭제 줄을 헤더로 오인하지 않습니다.
+        while old_count or new_count:
+            if index >= total:
+                raise ValueError("diff를 적용할 수 없습니다: hunk가 중간에 끝났습니다.")
+            line = diff_lines[index]
+            index += 1
+            tag, text = line[:1], line[1:]
+            if tag == '\\':
+                continue
+            if tag == '+':
+                result.append(text)
+                new_count -= 1
+                continue
+            if tag not in (' ', '-', ''):
+                raise ValueError(f"diff를 적용할 수 없습니다: 알 수 없는 줄 ({line!r})")
+            if cursor >= len(base_lines) or base_lines[cursor] != text:
+                raise ValueError(f"diff를 적용할 수 없습니다: {cursor + 1}번째 줄이 일치하지 않습니다.")
+            cursor += 1
+            old_count -= 1
+            if tag != '-':
+                result.append(text)
+                new_count -= 1
+
+    result.extend(base_lines[cursor:])
+    return result
+
+
+def parse_entry(text: str) -> Optional[dict]:
+    """
+    복호화된 로그 항목 하나를 분석하여 딕셔너리로 반환합니다.
+    - 반환값: {"kind", "timestamp", "file", "lines"} 형태의 딕셔너리, 알 수 없는 형식이면 None
+      'initial'/'keyframe'이면 lines는 전체 버전의 줄 목록이고, 'changes'/'delta'이면 diff 줄 목록입니다.
+    """
+    body = text.lstrip('\n')
+    header, _, rest = body.partition('\n')
+    match = _ENTRY_HEADER.match(header)
+    if not match:
+        return None
+
+    kind = _ENTRY_KINDS[match.group(1)]
+    entry = {"kind": kind, "timestamp": match.group(3), "file": match.group(2), "lines": []}
+
+    if kind in ("initial", "keyframe"):
+        file_header, _, content = rest.partition('\n')
+        file_match = _SNAPSHOT_HEADER.match(file_header)
+        if file_match:
+            entry["file"] = file_match.group(1)
+        # 파일 이름 줄 다음에는 빈 줄이 하나 있고, 그 뒤가 파일 전체 내용입니다.
+        if content.startswith('\n'):
+            content = content[1:]
+        entry["lines"] = to_log_lines(content)
+    else:
+        entry["lines"] = rest.split('\n') if rest else []
+    return entry
+
+
+def split_entries(text: str) -> List[str]:
+    """
+    하나의 레코드에 이어서 기록된 여러 로그 항목을 항목 단위로 나눕니다.
+    항목이 하나뿐인 레코드는 그대로 한 개짜리 목록으로 반환됩니다.
+    """
+    entries = []
+    start = 0
+    for match in _ENTRY_BOUNDARY.finditer(text):
+        if match.start() > start:
+            entries.append(text[start:match.start()])
+        start = match.start()
+    entries.append(text[start:])
+    return entries
+
+
+def replay(entry_texts: List[str]) -> List[str]:
+    """
+    로그 항목들을 순서대로 적용하여 마지막 버전의 줄 목록을 복원합니다.
+    가장 마지막 스냅샷('initial' 또는 'keyframe')부터 시작하므로, 복원 비용은 전체 항목 수가 아니라
+    마지막 스냅샷 이후의 항목 수에만 비례합니다.
+    """
+    entries = [parse_entry(text) for text in entry_texts]
+    start = None
+    for position in range(len(entries) - 1, -1, -1):
+        if entries[position] and entries[position]["kind"] in ("initial", "keyframe"):
+            start = position
+            break
+    if start is None:
+        raise ValueError("복원을 시작할 스냅샷(initial/keyframe) 항목이 없습니다.")
+
+    lines = entries[start]["lines"]
+    for entry in entries[start + 1:]:
+        if entry and entry["kind"] in ("changes", "delta"):
+            lines = apply_diff(lines, entry["lines"])
+    return lines
+
+
+def replay_files(entry_texts: List[str], default_file: str = 'main.py') -> Dict[str, List[str]]:
+    """
+    여러 파일의 항목이 섞여 있는 로그를 순서대로 적용하여, 파일별 마지막 버전을 복원합니다.
+    - entry_texts: 복호화된 레코드 목록 (레코드 하나에 여러 항목이 있어도 됩니다)
+    - default_file: 파일 이름이 기록되지 않은 항목(한 파일 추적 모드)이 가리키는 파일 이름
+    - 반환값: {파일 이름: 줄 목록} 딕셔너리
+    """
+    files: Dict[str, List[str]] = {}
+    for text in entry_texts:
+        for entry_text in split_entries(text):
+            entry = parse_entry(entry_text)
+            if not entry:
+                continue
+            name = entry["file"] or default_file
+            if entry["kind"] in ("initial", "keyframe"):
+                files[name] = entry["lines"]
+            elif name in files:
+                files[name] = apply_diff(files[name], entry["lines"])
+            else:
+                raise ValueError(f"복원을 시작할 스냅샷(initial/keyframe) 항목이 없습니다: {name}")
+    return files
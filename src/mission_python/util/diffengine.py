@@ -0,0 +1,362 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Line Diff Engine (v1.0)
+# ------------------------------------------------------------------------------
+# 두 버전의 줄 목록을 비교하여 unified diff를 만드는 모듈입니다. difflib.unified_diff와 같은 형식을 출력합니다.
+#
+# [difflib의 문제]
+# difflib.SequenceMatcher는 줄 문자열을 여러 번 해시하며, 200줄이 넘는 파일에서 자주(1% 이상) 나오는 줄
+# (빈 줄, '],' 등)을 비교에서 제외(autojunk)합니다. 그래서 붙여 넣은 표나 긴 리스트처럼 반복이 많은
+# 파일에서는 매우 느려지거나, 변경되지 않은 줄까지 바뀐 것처럼 기록하는 큰 diff가 만들어집니다.
+#
+# [동작 방식]
+# 1. 두 버전의 모든 줄을 한 번만 해시하여 정수 ID로 바꿉니다. (intern_lines)
+#    이후의 비교는 문자열이 아닌 정수 목록에서 이루어집니다.
+# 2. 공통 앞부분/뒷부분을 잘라낸 뒤, 설정한 알고리즘으로 일치하는 줄(anchor)을 찾아 구간을 나눕니다.
+#    'histogram' : 구간에서 가장 드물게 나오는 공통 줄을 기준으로 나눕니다. (기본값, git의 histogram과 같은 생각)
+#    'patience'  : 양쪽에 한 번씩만 나오는 공통 줄만 기준으로 나눕니다.
+#    'myers'     : 최소 편집 거리를 구하는 Myers 알고리즘 (선형 메모리, middle snake 방식)
+#    기준 줄이 없는 구간은 Myers 알고리즘으로 비교하며, 공통 줄이 하나도 없는 구간은 바로 '교체'로 처리합니다.
+#    'difflib'   : 기존 difflib.unified_diff를 그대로 사용합니다. (비교용)
+#    Myers 알고리즘은 O(ND)이므로, 편집 비용이 MYERS_MAX_COST를 넘는 구간(적은 종류의 줄이 뒤섞인 큰 구간 등)은
+#    difflib.SequenceMatcher로 비교합니다. (최소 diff는 아니지만 올바른 diff이며 훨씬 빠릅니다)
+# 3. 일치 구간 목록을 SequenceMatcher와 같은 opcode로 바꾸고, difflib과 같은 규칙으로 unified diff를 만듭니다.
+#
+# 일치 구간이 같으면 출력은 difflib.unified_diff와 글자 하나까지 같으며, 다르더라도 같은 형식의
+# 올바른 diff이므로 delta.apply_diff()로 그대로 적용할 수 있습니다.
+# (측정: benchmarks/bench_diff.py)
+# ==============================================================================
+
+import bisect
+import difflib
+from collections import Counter
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+ALGORITHMS = ('histogram', 'patience', 'myers', 'difflib')
+DEFAULT_ALGORITHM = 'histogram'
+# histogram 방식에서 기준으로 삼을 줄의 최대 등장 횟수입니다. 이보다 흔한 줄만 남은 구간은 Myers로 비교합니다.
+HISTOGRAM_MAX_OCCURRENCES = 64
+# Myers 알고리즘이 한 구간에서 넓혀 갈 최대 편집 비용(middle snake의 d)입니다. 이를 넘으면 difflib로 비교합니다.
+MYERS_MAX_COST = 256
+
+
+def intern_lines(a: Sequence[str], b: Sequence[str]) -> Tuple[List[int], List[int]]:
+    """ 두 줄 목록의 각 줄을 정수 ID로 바꿉니다. 내용이 같은 줄은 같은 ID를 갖습니다. """
+    table = {}
+    ids_a = [table.setdefault(line, len(table)) for line in a]
+    ids_b = [table.setdefault(line, len(table)) for line in b]
+    return ids_a, ids_b
+
+
+def _middle_snake(a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int,
+                  max_cost: Optional[int] = None) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Myers 알고리즘의 middle snake를 찾습니다. 앞쪽과 뒤쪽에서 동시에 최단 편집 경로를 넓혀 가다가
+    두 경로가 만나는 대각선 구간(snake)을 반환합니다.
+    - max_cost: 넓혀 갈 최대 편집 비용, 그 안에서 두 경로가 만나지 않으면 None을 반환합니다.
+    - 반환값: snake의 시작과 끝 위치 (x0, y0, x1, y1), 구간 안에서의 상대 위치
+    """
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta & 1
+    max_d = (n + m + 1) // 2
+    if max_cost is not None and max_d > max_cost:
+        limit = max_cost
+    else:
+        limit = max_d
+    offset = max_d + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+    for d in range(limit + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            reverse_k = delta - k
+            if odd and -(d - 1) <= reverse_k <= d - 1 and x + backward[offset + reverse_k] >= n:
+                return x0, y0, x, y
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + k] = x
+            forward_k = delta - k
+            if not odd and -d <= forward_k <= d and x + forward[offset + forward_k] >= n:
+                return n - x, m - y, n - x0, m - y0
+    if limit < max_d:
+        return None
+    # 도달할 수 없는 경우입니다. (두 경로는 max_d 안에서 반드시 만납니다)
+    return 0, 0, 0, 0
+
+
+def _lis_anchors(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    (b 위치 순으로 정렬된) (a 위치, b 위치) 쌍 중에서 a 위치도 증가하는 가장 긴 부분열을 찾습니다. (patience 정렬)
+    """
+    tails: List[int] = []
+    tail_index: List[int] = []
+    previous = [-1] * len(pairs)
+    for index, (i, _) in enumerate(pairs):
+        position = bisect.bisect_left(tails, i)
+        if position == len(tails):
+            tails.append(i)
+            tail_index.append(index)
+        else:
+            tails[position] = i
+            tail_index[position] = index
+        previous[index] = tail_index[position - 1] if position else -1
+    anchors = []
+    index = tail_index[-1] if tail_index else -1
+    while index >= 0:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _find_anchors(a: List[int], alo: int, ahi: int, b: List[int], blo: int, bhi: int,
+                  unique_only: bool) -> List[Tuple[int, int]]:
+    """
+    구간을 나눌 기준 줄(anchor)들을 찾습니다.
+    - unique_only: True이면 양쪽에 한 번씩만 나오는 줄만(patience), False이면 가장 드문 공통 줄들을(histogram) 사용합니다.
+    큰 파일에서는 거의 모든 줄이 기준 줄이 되므로, 구간 크기의 임시 자료구조를 가능한 한 적게 만듭니다.
+    """
+    count_a = Counter(a[alo:ahi])
+    count_b = Counter(line for line in b[blo:bhi] if line in count_a)
+    if not count_b:
+        return []
+
+    if unique_only:
+        lowest = 2
+        chosen = {line for line, count in count_b.items() if count == 1 and count_a[line] == 1}
+    else:
+        lowest = min(count_a[line] + count for line, count in count_b.items())
+        if lowest > 2 * HISTOGRAM_MAX_OCCURRENCES:
+            return []
+        chosen = {line for line, count in count_b.items() if count_a[line] + count == lowest}
+    del count_a, count_b
+    if not chosen:
+        return []
+
+    # 선택한 줄마다 a와 b에서의 k번째 등장끼리 짝을 짓습니다. (두 쪽 모두 순서대로 증가하는 쌍이 됩니다)
+    if lowest == 2:
+        # 선택한 줄이 양쪽에 한 번씩만 나오는 경우(가장 흔한 경우)에는 위치 목록 대신 위치 하나만 기억합니다.
+        position_a = {}
+        for i in range(alo, ahi):
+            if a[i] in chosen:
+                position_a[a[i]] = i
+        del chosen
+        pairs = [(position_a[b[j]], j) for j in range(blo, bhi) if b[j] in position_a]
+    else:
+        positions_a = {line: [] for line in chosen}
+        for i in range(alo, ahi):
+            if a[i] in positions_a:
+                positions_a[a[i]].append(i)
+        seen_b = dict.fromkeys(chosen, 0)
+        pairs = []
+        for j in range(blo, bhi):
+            line = b[j]
+            if line in seen_b:
+                k = seen_b[line]
+                if k < len(positions_a[line]):
+                    pairs.append((positions_a[line][k], j))
+                seen_b[line] = k + 1
+    # 줄이 옮겨지지 않았다면 쌍들이 이미 a 위치 순으로도 증가하므로, 가장 긴 증가 부분열을 따로 구하지 않습니다.
+    if all(pairs[k][0] < pairs[k + 1][0] for k in range(len(pairs) - 1)):
+        return pairs
+    return _lis_anchors(pairs)
+
+
+def matching_blocks(a: List[int], b: List[int], algorithm: str = DEFAULT_ALGORITHM) -> List[Tuple[int, int, int]]:
+    """
+    두 정수 목록에서 일치하는 구간 목록을 구합니다. SequenceMatcher.get_matching_blocks()와 같은 형식으로,
+    (a 위치, b 위치, 길이)들이 위치 순으로 정렬되어 있고 마지막은 (len(a), len(b), 0)입니다.
+    """
+    if algorithm not in ('histogram', 'patience', 'myers'):
+        raise ValueError(f"알 수 없는 diff 알고리즘입니다: {algorithm}")
+    blocks = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        # 공통 앞부분과 뒷부분은 바로 일치 구간이 됩니다.
+        start = alo
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            alo += 1
+            blo += 1
+        if alo > start:
+            blocks.append((start, blo - (alo - start), alo - start))
+        end = ahi
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+        if ahi < end:
+            blocks.append((ahi, bhi, end - ahi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = []
+        if algorithm != 'myers':
+            anchors = _find_anchors(a, alo, ahi, b, blo, bhi, unique_only=(algorithm == 'patience'))
+        if anchors:
+            # 기준 줄 사이의 구간들을 각각 다시 비교합니다. 이어지는 기준 줄들은 하나의 일치 구간으로 기록하고,
+            # 한쪽이 비어 있는 구간은 비교할 것이 없으므로 쌓지 않습니다.
+            previous_i, previous_j = alo, blo
+            run_i = run_j = run_size = 0
+            for i, j in anchors:
+                if run_size and i == run_i + run_size and j == run_j + run_size:
+                    run_size += 1
+                else:
+                    if run_size:
+                        blocks.append((run_i, run_j, run_size))
+                    run_i, run_j, run_size = i, j, 1
+                    if previous_i < i and previous_j < j:
+                        stack.append((previous_i, i, previous_j, j))
+                previous_i, previous_j = i + 1, j + 1
+            blocks.append((run_i, run_j, run_size))
+            if previous_i < ahi and previous_j < bhi:
+                stack.append((previous_i, ahi, previous_j, bhi))
+            continue
+
+        # 공통 줄이 하나도 없는 구간은 비교할 필요 없이 전체가 교체된 것입니다.
+        if set(a[alo:ahi]).isdisjoint(b[blo:bhi]):
+            continue
+        snake = _middle_snake(a, alo, ahi, b, blo, bhi, MYERS_MAX_COST)
+        if snake is None:
+            # 편집 비용이 너무 큰 구간은 difflib로 비교합니다. (Myers로는 구간 크기 x 편집 비용만큼 걸립니다)
+            matcher = difflib.SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=True)
+            for i, j, size in matcher.get_matching_blocks():
+                if size:
+                    blocks.append((alo + i, blo + j, size))
+            continue
+        x0, y0, x1, y1 = snake
+        if x1 == x0 and ((x0, y0) == (0, 0) or (x0, y0) == (ahi - alo, bhi - blo)):
+            # 더 나눌 수 없는 구간입니다. (같은 구간을 반복해서 비교하지 않도록 전체 교체로 처리합니다)
+            continue
+        if x1 > x0:
+            blocks.append((alo + x0, blo + y0, x1 - x0))
+        stack.append((alo, alo + x0, blo, blo + y0))
+        stack.append((alo + x1, ahi, blo + y1, bhi))
+
+    # 정렬한 뒤 이어지는 구간들을 하나로 합칩니다.
+    blocks.sort()
+    merged = []
+    for i, j, size in blocks:
+        if merged and merged[-1][0] + merged[-1][2] == i and merged[-1][1] + merged[-1][2] == j:
+            last_i, last_j, last_size = merged[-1]
+            merged[-1] = (last_i, last_j, last_size + size)
+        else:
+            merged.append((i, j, size))
+    merged.append((len(a), len(b), 0))
+    return merged
+
+
+def opcodes(a: Sequence[str], b: Sequence[str], algorithm: str = DEFAULT_ALGORITHM) -> List[Tuple[str, int, int, int, int]]:
+    """
+    두 줄 목록의 차이를 SequenceMatcher.get_opcodes()와 같은 형식의 목록으로 반환합니다.
+    - 반환값: ('equal' | 'replace' | 'delete' | 'insert', i1, i2, j1, j2) 목록
+    """
+    if algorithm == 'difflib':
+        return difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    ids_a, ids_b = intern_lines(a, b)
+    codes = []
+    i = j = 0
+    for ai, bj, size in matching_blocks(ids_a, ids_b, algorithm):
+        tag = ''
+        if i < ai and j < bj:
+            tag = 'replace'
+        elif i < ai:
+            tag = 'delete'
+        elif j < bj:
+            tag = 'insert'
+        if tag:
+            codes.append((tag, i, ai, j, bj))
+        i, j = ai + size, bj + size
+        if size:
+            codes.append(('equal', ai, i, bj, j))
+    return codes
+
+
+def group_opcodes(codes: List[Tuple[str, int, int, int, int]], n: int = 3) -> Iterator[list]:
+    """ opcode 목록을 문맥 줄 n개를 가진 hunk 단위로 묶습니다. (SequenceMatcher.get_grouped_opcodes()와 같은 규칙) """
+    codes = list(codes) or [('equal', 0, 1, 0, 1)]
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        # 긴 일치 구간은 앞뒤 문맥 n줄만 남기고 hunk를 나눕니다.
+        if tag == 'equal' and i2 - i1 > n + n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    """ hunk 헤더의 줄 범위 표기입니다. (difflib과 같은 규칙) """
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def unified_diff(a: Sequence[str], b: Sequence[str], fromfile: str = '', tofile: str = '',
+                 n: int = 3, lineterm: str = '\n', algorithm: str = DEFAULT_ALGORITHM) -> Iterator[str]:
+    """
+    difflib.unified_diff와 같은 형식의 diff 줄들을 만듭니다. (날짜 인자는 지원하지 않습니다)
+    - a, b: 이전/현재 버전의 줄 목록
+    - algorithm: 'histogram', 'patience', 'myers', 'difflib' 중 하나
+    """
+    if algorithm == 'difflib':
+        yield from difflib.unified_diff(a, b, fromfile=fromfile, tofile=tofile, n=n, lineterm=lineterm)
+        return
+    started = False
+    for group in group_opcodes(opcodes(a, b, algorithm), n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}{lineterm}"
+            yield f"+++ {tofile}{lineterm}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@{lineterm}"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in a[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in a[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in b[j1:j2]:
+                    yield '+' + line
@@ -12,6 +12,13 @@ geolocation.py (Encrypted Version)
 이 모듈의 주요 기능은 외부에서 호출될 때 최초 한 번만 실행되도록 설계되었습니다.
 암호화된 파일이 이미 존재하면, 추가 작업을 수행하지 않습니다.
 
+정보 수집은 기본적으로 분리된(detached) 백그라운드 작업자 프로세스에서 수행되어,
+호출한 쪽은 네트워크 응답을 기다리지 않습니다. 작업자는 결과 파일을 원자적으로
+저장(temp + rename)하고 완료 표시 파일(signature.done)을 남깁니다. 작업자가 비정상
+종료되어 작업 중 표시 파일(signature.pending)만 남은 경우, 다음 실행에서 이를 감지하여
+다시 시작합니다. 표시 파일을 확인하고 새로 만드는 과정은 잠금 파일(signature.lock)을 가진
+프로세스 하나만 수행하므로, 동시에 실행되어도 작업자는 하나만 시작됩니다.
+
 [주요 기능 및 수집 정보]
 - 호스트 이름 (컴퓨터 이름)
 - 로컬 Private IP 및 공인 Public IP 주소
@@ -20,6 +27,10 @@ geolocation.py (Encrypted Version)
 - 현재 로그인된 사용자 계정 ID
 - 시스템의 모든 네트워크 인터페이스 MAC 주소
 - 정보 수집 시각 (타임스탬프)
+- 각 조회의 소요 시간과 결과 상태 (probe_stats)
+
+모든 조회는 동시에 실행되며(공인 IP는 여러 서비스 중 가장 빠른 응답 사용),
+하나의 전체 마감 시간(SIGNATURE_DEADLINE) 안에 끝나지 않은 조회는 '시간 초과'로 기록됩니다.
 
 [사용 방법]
 이 모듈은 주로 다른 스크립트에서 import 하여 `create_signature_if_not_exists()` 함수를
@@ -30,30 +41,45 @@ geolocation.py (Encrypted Version)
 
 import sys
 import socket
-import urllib.request
-import urllib.error
-import requests
 import json
 import os
 import datetime
 import getpass
-import psutil
-import platform
+import queue
+import threading
+import time
+
+# [지연 로딩(Lazy Loading)]
+# requests, psutil, urllib.request, platform 모듈은 불러오는 비용이 큰 편이지만,
+# 실제로 필요한 것은 서명 파일이 없어 시스템 정보를 수집하는 최초 실행 때뿐입니다.
+# 따라서 이 모듈들은 각 정보 수집 함수 안에서 필요한 순간에만 가져옵니다.
 
 # 암호화 모듈을 가져옵니다.
 from mission_python.util import crypto
+# 단계별 시간 측정 모듈입니다. (환경 변수 MISSION_PYTHON_TIMING으로 켤 때만 동작합니다)
+from mission_python.util import timing
+# 여러 프로세스가 동시에 작업자를 시작하지 않도록 조정하는 파일 잠금 모듈입니다.
+from mission_python.util import filelock
+
+# --- 정보 수집 시간 제한 설정 ---
+# 전체 정보 수집에 허용되는 최대 시간(초)입니다. 모든 조회는 동시에 실행되므로,
+# 최악의 경우에도 수집 시간은 각 조회 시간의 합이 아니라 이 값을 넘지 않습니다.
+SIGNATURE_DEADLINE = 10.0
+# 네트워크 조회 하나에 허용되는 최대 시간(초)입니다.
+PROBE_TIMEOUT = 5.0
 
 # ---------------------------------------------------
 # 네트워크 및 시스템 정보 확인 함수들
 # ---------------------------------------------------
 
-def get_local_ip_address():
+def get_local_ip_address(timeout=PROBE_TIMEOUT):
     """
     현재 시스템의 로컬(사설) IP 주소를 가져옵니다.
     """
     s = None
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(timeout)
         s.connect(("8.8.8.8", 80))
         return s.getsockname()[0]
     except socket.error:
@@ -61,27 +87,52 @@ def get_local_ip_address():
     finally:
         if s: s.close()
 
-def get_public_ip_address():
+def get_public_ip_address(timeout=PROBE_TIMEOUT):
     """
     외부 API 서비스를 통해 현재 네트워크의 공인 IP 주소를 가져옵니다.
+    여러 서비스에 동시에 요청을 보내고, 가장 먼저 도착한 정상 응답을 사용합니다.
+    - timeout: 전체 조회에 허용되는 최대 시간(초)
     """
+    import urllib.request
+    import urllib.error
+
     ip_services = ["https://api.ipify.org", "https://ifconfig.me/ip", "https://icanhazip.com"]
+    answers = queue.Queue()
+
+    def ask(service):
+        try:
+            with urllib.request.urlopen(service, timeout=timeout) as response:
+                answers.put(response.read().decode('utf-8').strip())
+        except (urllib.error.URLError, socket.timeout, OSError, ValueError):
+            answers.put(None)
+
+    # 응답을 기다리지 않고 끝낼 수 있도록, 조회 스레드는 데몬(daemon) 스레드로 실행합니다.
     for service in ip_services:
+        threading.Thread(target=ask, args=(service,), daemon=True).start()
+
+    deadline = time.monotonic() + timeout
+    for _ in ip_services:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
         try:
-            with urllib.request.urlopen(service, timeout=5) as response:
-                return response.read().decode('utf-8').strip()
-        except (urllib.error.URLError, socket.timeout):
-            continue
+            answer = answers.get(timeout=remaining)
+        except queue.Empty:
+            break
+        if answer:
+            return answer
     return "확인 불가 (인터넷 연결 또는 서비스 문제)"
 
-def get_location_by_ip(public_ip):
+def get_location_by_ip(public_ip, timeout=PROBE_TIMEOUT):
     """
     공인 IP를 기반으로 지리적 위치 정보를 가져옵니다.
     """
     if public_ip.startswith("확인 불가"):
         return {"error": "공인 IP를 확인할 수 없어 위치 정보를 가져올 수 없습니다."}
+    import requests
+
     try:
-        response = requests.get(f"http://ipinfo.io/{public_ip}/json")
+        response = requests.get(f"http://ipinfo.io/{public_ip}/json", timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -92,6 +143,8 @@ def get_all_mac_addresses():
     psutil을 사용하여 시스템의 모든 네트워크 인터페이스와 MAC 주소를 가져옵니다.
     """
     try:
+        import psutil
+
         all_interfaces = psutil.net_if_addrs()
         mac_addresses = {}
         for interface_name, addresses in all_interfaces.items():
@@ -131,6 +184,8 @@ def get_hostname():
 def get_os_info():
     """ platform 모듈을 사용하여 상세한 OS 정보를 반환합니다. """
     try:
+        import platform
+
         return {
             "system": platform.system(),
             "release": platform.release(),
@@ -144,48 +199,282 @@ def get_os_info():
 # ---------------------------------------------------
 # 핵심 정보 수집 로직
 # ---------------------------------------------------
-def _collect_all_system_info():
+def _probe_status(value):
+    """ 조회 결과가 오류를 나타내는지 확인하여 'ok' 또는 'error' 상태를 반환합니다. """
+    if isinstance(value, dict) and "error" in value:
+        return "error"
+    if isinstance(value, str) and "확인 불가" in value:
+        return "error"
+    return "ok"
+
+def _start_probe(name, func, args, results):
+    """
+    조회 함수 하나를 데몬(daemon) 스레드에서 실행하고, 끝나면 (이름, 결과, 상태, 소요 시간)을 results 큐에 넣습니다.
+    """
+    def run():
+        started = time.perf_counter()
+        try:
+            value = func(*args)
+            status = _probe_status(value)
+        except Exception as e:
+            value, status = {"error": f"{name} 조회 중 오류 발생: {e}"}, "error"
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if timing.enabled:
+            timing.emit("probe", name=name, status=status, elapsed_ms=round(elapsed_ms, 3),
+                        bytes=len(json.dumps(value, ensure_ascii=False, default=str).encode('utf-8')))
+        results.put((name, value, status, elapsed_ms))
+
+    threading.Thread(target=run, name=f"probe-{name}", daemon=True).start()
+
+@timing.timed("collect_system_info")
+def _collect_all_system_info(deadline=None):
     """
     모든 시스템 정보를 수집하여 딕셔너리 형태로 반환합니다. (내부 사용 함수)
+    모든 조회를 동시에 실행하고, 하나의 전체 마감 시간(deadline) 안에 끝나지 않은 조회는
+    '시간 초과'로 기록합니다. 각 조회의 소요 시간과 결과 상태는 'probe_stats'에 함께 기록됩니다.
+    - deadline: 전체 수집에 허용되는 최대 시간(초), 기본값은 SIGNATURE_DEADLINE
     """
+    if deadline is None:
+        deadline = SIGNATURE_DEADLINE
+    end_time = time.monotonic() + deadline
+    per_probe_timeout = min(PROBE_TIMEOUT, deadline)
+
+    # 시간 안에 끝나지 않은 조회에 사용할 기본값입니다.
+    values = {
+        "hostname": "확인 불가 (시간 초과)",
+        "local_ip": "확인 불가 (시간 초과)",
+        "public_ip": "확인 불가 (시간 초과)",
+        "location_info": {"error": "위치 정보 조회 시간 초과"},
+        "os_info": {"error": "상세 OS 정보 조회 시간 초과"},
+        "user_id": "Unknown",
+        "mac_addresses": {"error": "MAC 주소 조회 시간 초과"},
+    }
+    probe_stats = {name: {"status": "timeout", "elapsed_ms": None} for name in values}
+
+    results = queue.Queue()
+    _start_probe("public_ip", get_public_ip_address, (per_probe_timeout,), results)
+    _start_probe("hostname", get_hostname, (), results)
+    _start_probe("local_ip", get_local_ip_address, (per_probe_timeout,), results)
+    _start_probe("os_info", get_os_info, (), results)
+    _start_probe("user_id", get_current_user, (), results)
+    _start_probe("mac_addresses", get_all_mac_addresses, (), results)
+    pending = {"public_ip", "hostname", "local_ip", "os_info", "user_id", "mac_addresses", "location_info"}
+
+    while pending:
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            name, value, status, elapsed_ms = results.get(timeout=remaining)
+        except queue.Empty:
+            break
+        values[name] = value
+        probe_stats[name] = {"status": status, "elapsed_ms": round(elapsed_ms, 1)}
+        pending.discard(name)
+
+        # 위치 정보는 공인 IP가 필요하므로, 공인 IP 조회가 끝난 직후에 남은 시간 안에서 시작합니다.
+        if name == "public_ip":
+            location_timeout = min(PROBE_TIMEOUT, max(end_time - time.monotonic(), 0.1))
+            _start_probe("location_info", get_location_by_ip, (value, location_timeout), results)
+
     scan_results = {}
-    
-    public_ip = get_public_ip_address()
-    location_info = get_location_by_ip(public_ip)
-    
-    scan_results["hostname"] = get_hostname()
-    scan_results["local_ip"] = get_local_ip_address()
-    scan_results["public_ip"] = public_ip
-    scan_results["location_info"] = location_info
-    scan_results["os_info"] = get_os_info()
-    scan_results["user_id"] = get_current_user()
-
-    all_macs = get_all_mac_addresses()
+    scan_results["hostname"] = values["hostname"]
+    scan_results["local_ip"] = values["local_ip"]
+    scan_results["public_ip"] = values["public_ip"]
+    scan_results["location_info"] = values["location_info"]
+    scan_results["os_info"] = values["os_info"]
+    scan_results["user_id"] = values["user_id"]
+
+    all_macs = values["mac_addresses"]
     if isinstance(all_macs, dict) and "error" not in all_macs:
         sorted_macs = {k: v for k, v in sorted(all_macs.items())}
     else:
         sorted_macs = all_macs
     scan_results["mac_addresses"] = sorted_macs
+    scan_results["probe_stats"] = probe_stats
     scan_results["scan_time"] = datetime.datetime.now().isoformat()
+    timing.note(timed_out=sorted(name for name, stats in probe_stats.items() if stats["status"] == "timeout"))
     
     return scan_results
 
 
+# ---------------------------------------------------
+# 백그라운드 수집 작업자(Worker) 관련 설정 및 함수
+# ---------------------------------------------------
+
+# 서명 수집을 별도의 분리된(detached) 프로세스에서 수행할지 여부입니다.
+# True: import는 즉시 반환되고, 네트워크 조회 등 느린 수집 작업은 백그라운드 프로세스가 처리합니다.
+# False: 예전처럼 현재 프로세스에서 수집이 끝날 때까지 기다립니다.
+flag_background_signature_enabled = True
+
+# 작업자 프로세스임을 표시하는 환경 변수 이름입니다.
+# 작업자는 이 패키지를 다시 import 하므로, 이 값이 설정되어 있으면 import 시점의 자동 실행을 건너뜁니다.
+SIGNATURE_WORKER_ENV = "MISSION_PYTHON_SIGNATURE_WORKER"
+
+# 작업자가 이 시간(초) 안에 끝나지 않으면, 비정상 종료된 것으로 보고 다음 실행에서 다시 시작합니다.
+SIGNATURE_WORKER_TIMEOUT = 120
+
+def _get_log_dir():
+    """ 서명 관련 파일들이 저장되는 프로젝트의 'log' 폴더 경로를 반환합니다. """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    return os.path.join(project_root, 'log')
+
+def _is_process_alive(pid):
+    """
+    주어진 PID의 프로세스가 아직 살아있는지 확인합니다.
+    윈도우에서는 os.kill()이 프로세스를 종료시켜 버리므로 확인하지 않고, 경과 시간으로만 판단합니다.
+    """
+    if os.name == 'nt':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _read_pending_marker(pending_file):
+    """ 작업 중 표시 파일(signature.pending)의 내용을 읽습니다. 읽을 수 없으면 None을 반환합니다. """
+    try:
+        with open(pending_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_json_atomic(file_path, data):
+    """ 임시 파일에 먼저 쓴 뒤 이름을 바꾸는 방식(temp + rename)으로, JSON 파일을 원자적으로 저장합니다. """
+    temp_file = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(temp_file, file_path)
+
+def _is_worker_in_progress(pending_file):
+    """
+    이전에 시작된 작업자가 아직 정상적으로 동작 중인지 확인합니다.
+    표시 파일이 너무 오래되었거나, 기록된 작업자 프로세스가 이미 사라졌다면 False를 반환합니다.
+    """
+    marker = _read_pending_marker(pending_file)
+    if marker is None:
+        return False
+    started_at = marker.get("started_at", 0)
+    if datetime.datetime.now().timestamp() - started_at > SIGNATURE_WORKER_TIMEOUT:
+        return False
+    pid = marker.get("pid")
+    return isinstance(pid, int) and _is_process_alive(pid)
+
+def _cleanup_partial_files(log_dir):
+    """ 비정상 종료된 작업자가 남긴 임시 파일(*.tmp)들을 정리합니다. """
+    for name in os.listdir(log_dir):
+        if name.startswith('signature.') and name.endswith('.tmp'):
+            try:
+                os.remove(os.path.join(log_dir, name))
+            except OSError:
+                pass
+
+def _launch_signature_worker(log_dir):
+    """
+    서명 수집을 담당하는 분리된(detached) 작업자 프로세스를 시작하고, 그 PID를 반환합니다.
+    작업자는 현재 프로세스가 종료되어도 계속 실행됩니다.
+    """
+    import subprocess
+
+    env = dict(os.environ)
+    env[SIGNATURE_WORKER_ENV] = "1"
+    # 'python src/mission_python/main.py'처럼 실행된 경우에도 작업자가 패키지를 찾을 수 있도록
+    # 패키지가 들어있는 폴더(src)를 PYTHONPATH 맨 앞에 추가합니다.
+    package_parent = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_parent, env.get("PYTHONPATH")]))
+
+    kwargs = {}
+    if os.name == 'nt':
+        kwargs["creationflags"] = (getattr(subprocess, "DETACHED_PROCESS", 0)
+                                   | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0))
+    else:
+        kwargs["start_new_session"] = True
+
+    code = ("from mission_python.util import geolocation; "
+            f"geolocation._run_signature_worker({log_dir!r})")
+    process = subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        close_fds=True, env=env, **kwargs
+    )
+    return process.pid
+
+@timing.timed("write_signature")
+def _write_signature(log_dir):
+    """
+    시스템 정보를 수집하고 암호화하여 'signature.encrypted' 파일로 저장합니다.
+    임시 파일에 먼저 쓴 뒤 이름을 바꾸므로(temp + rename), 다른 프로세스는 완성된 파일만 보게 됩니다.
+    저장이 끝나면 완료 표시 파일(signature.done)을 남깁니다.
+    - 반환값: 성공 시 True, 실패 시 False
+    """
+    signature_file = os.path.join(log_dir, 'signature.encrypted')
+    done_file = os.path.join(log_dir, 'signature.done')
+
+    # 시스템 정보를 수집합니다.
+    result_data = _collect_all_system_info()
+
+    # 1. 딕셔너리 -> JSON 문자열로 변환
+    json_string = json.dumps(result_data, indent=4, ensure_ascii=False)
+    # 2. JSON 문자열 -> UTF-8 바이트로 인코딩
+    data_bytes = json_string.encode('utf-8')
+    # 3. crypto 모듈을 사용해 바이트 데이터 암호화
+    timing.mark("serialize")
+    encrypted_data = crypto.encrypt_data(data_bytes)
+
+    # 4. 암호화 실패 시 오류 처리
+    if encrypted_data is None:
+        print("🚫 [Geolocation] 데이터 암호화에 실패했습니다.", file=sys.stderr)
+        return False
+
+    # 5. 암호화된 바이트 데이터를 임시 파일에 쓴 뒤, 원자적으로 최종 파일 이름으로 바꿉니다.
+    temp_file = f"{signature_file}.{os.getpid()}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(encrypted_data)
+    os.replace(temp_file, signature_file)
+    timing.note(bytes_written=len(encrypted_data))
+    timing.mark("write")
+
+    # 6. 완료 표시 파일을 남깁니다.
+    _write_json_atomic(done_file, {"pid": os.getpid(), "finished_at": datetime.datetime.now().timestamp()})
+    return True
+
+def _run_signature_worker(log_dir):
+    """
+    백그라운드 작업자 프로세스의 본체입니다. 서명을 생성한 뒤 작업 중 표시 파일을 지웁니다.
+    비정상 종료되면 표시 파일이 남게 되고, 다음 실행에서 이를 감지하여 다시 시도합니다.
+    """
+    pending_file = os.path.join(log_dir, 'signature.pending')
+    if _write_signature(log_dir):
+        try:
+            os.remove(pending_file)
+        except FileNotFoundError:
+            pass
+
 # ---------------------------------------------------
 # 프로그램 진입점 함수
 # ---------------------------------------------------
-def create_signature_if_not_exists():
+def create_signature_if_not_exists(background=None):
     """
     프로젝트 루트의 'log' 폴더에 암호화된 서명 파일의 존재 여부를 확인하고,
     파일이 없을 때만 정보 수집 및 암호화/저장을 수행합니다.
+    - background: True이면 분리된 작업자 프로세스에서 수집하고 즉시 반환합니다.
+                  None(기본값)이면 flag_background_signature_enabled 설정을 따릅니다.
+    - 반환값: 서명을 생성했거나 생성 작업을 시작했으면 True, 그 외에는 False
     """
+    if background is None:
+        background = flag_background_signature_enabled
+
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)
-        log_dir = os.path.join(project_root, 'log')
+        log_dir = _get_log_dir()
         
         # 파일명을 암호화되었음을 나타내는 이름으로 지정합니다.
         signature_file = os.path.join(log_dir, 'signature.encrypted')
+        # 백그라운드 작업자가 실행 중임을 나타내는 표시 파일입니다.
+        pending_file = os.path.join(log_dir, 'signature.pending')
 
         # 파일이 이미 존재하는지 확인하고, 존재하면 메시지를 출력하고 종료합니다.
         if os.path.exists(signature_file):
@@ -195,29 +484,50 @@ def create_signature_if_not_exists():
         
         # 파일을 쓰기 전에 log 디렉토리가 없으면 생성합니다.
         os.makedirs(log_dir, exist_ok=True)
-        
-        # 시스템 정보를 수집합니다.
-        result_data = _collect_all_system_info()
-        
-        # 1. 딕셔너리 -> JSON 문자열로 변환
-        json_string = json.dumps(result_data, indent=4, ensure_ascii=False)
-        # 2. JSON 문자열 -> UTF-8 바이트로 인코딩
-        data_bytes = json_string.encode('utf-8')
-        # 3. crypto 모듈을 사용해 바이트 데이터 암호화
-        encrypted_data = crypto.encrypt_data(data_bytes)
-        
-        # 4. 암호화 실패 시 오류 처리
-        if encrypted_data is None:
-            print("🚫 [Geolocation] 데이터 암호화에 실패했습니다.", file=sys.stderr)
+
+        if not background:
+            if not _write_signature(log_dir):
+                return False
+            # 모든 작업이 성공적으로 끝나면, 성공 메시지를 출력합니다.
+            print(f"🦊 Signature successfully created ...")
+            # print(f"✅ [INFO] 시스템 서명 '{os.path.basename(signature_file)}' 파일이 암호화되어 성공적으로 생성되었습니다.")            
+            return True
+
+        # 이전 실행에서 시작된 작업자가 아직 동작 중이면, 기다리지 않고 바로 반환합니다.
+        if _is_worker_in_progress(pending_file):
+            print(f"🦊 Signature creation in progress. Skipping ...")
             return False
 
-        # 5. 암호화된 바이트 데이터를 바이너리 쓰기('wb') 모드로 파일에 저장
-        with open(signature_file, 'wb') as f:
-            f.write(encrypted_data)
-        
-        # 모든 작업이 성공적으로 끝나면, 성공 메시지를 출력합니다.
-        print(f"🦊 Signature successfully created ...")
-        # print(f"✅ [INFO] 시스템 서명 '{os.path.basename(signature_file)}' 파일이 암호화되어 성공적으로 생성되었습니다.")            
+        # 작업자가 비정상 종료되었거나 처음 시작하는 경우입니다.
+        # 표시 파일 확인 -> 오래된 표시 파일 삭제 -> 새 표시 파일 생성은 한 번에 이루어져야 합니다.
+        # 그렇지 않으면 다른 프로세스가 방금 생성한 표시 파일을 오래된 것으로 보고 지운 뒤 작업자를 또 시작합니다.
+        # 따라서 이 과정은 signature.lock 잠금을 가진 프로세스만 수행하며, 잠금을 기다리지 않습니다.
+        # (다른 프로세스가 잠금을 가지고 있다면, 그 프로세스에게 작업을 맡깁니다)
+        with filelock.FileLock(os.path.join(log_dir, 'signature.lock'), timeout=0) as lock:
+            if not lock.acquired or os.path.exists(signature_file) or _is_worker_in_progress(pending_file):
+                print(f"🦊 Signature creation in progress. Skipping ...")
+                return False
+            try:
+                os.remove(pending_file)
+            except FileNotFoundError:
+                pass
+            try:
+                fd = os.open(pending_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                return False
+            started_at = datetime.datetime.now().timestamp()
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"pid": os.getpid(), "started_at": started_at}, f)
+
+        # 표시 파일을 차지한 뒤에만, 비정상 종료된 작업자가 남긴 임시 파일을 정리합니다.
+        _cleanup_partial_files(log_dir)
+
+        worker_pid = _launch_signature_worker(log_dir)
+        # 작업자가 이미 끝나 표시 파일을 지운 경우에는 다시 만들지 않습니다.
+        if os.path.exists(pending_file):
+            _write_json_atomic(pending_file, {"pid": worker_pid, "started_at": started_at})
+
+        print(f"🦊 Signature creation started in background ...")
         return True
 
     except Exception as e:
@@ -250,7 +560,7 @@ if __name__ == "__main__":
     except FileNotFoundError:
         print("-> 기존 테스트 파일이 없어 바로 진행합니다.")
 
-    was_created = create_signature_if_not_exists()
+    was_created = create_signature_if_not_exists(background=False)
     
     print("\n[첫 번째 실행 결과]")
     if was_created:
@@ -259,7 +569,7 @@ if __name__ == "__main__":
         print("-> 오류! 파일 생성에 실패했습니다.")
 
     print("\n[두 번째 실행 결과]")
-    was_created_again = create_signature_if_not_exists()
+    was_created_again = create_signature_if_not_exists(background=False)
     if not was_created_again:
         print("-> 예상대로 파일이 이미 존재하므로 추가 작업을 수행하지 않았습니다.")
     else:
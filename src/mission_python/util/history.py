@@ -0,0 +1,165 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Version History (v1.0)
+# ------------------------------------------------------------------------------
+# 복호화된 로그 항목들로부터 main.py의 임의 버전을 복원하는 모듈입니다. (평가자 도구 및 테스트용)
+#
+# [버전 번호]
+# 로그 항목 중 버전을 만드는 항목('initial', 'keyframe', 'changes', 'delta')에 0부터 차례로 번호를 붙입니다.
+# 버전 k는 가장 가까운 이전 스냅샷('initial'/'keyframe')부터 k까지의 diff를 적용하여 얻어집니다.
+#
+# [체크포인트 캐시]
+# 한 번 복원한 버전은 일정 간격(checkpoint_interval)마다 체크포인트로 캐시에 보관합니다.
+# 다음에 다른 버전으로 이동할 때는 그 버전 이전의 가장 가까운 체크포인트(또는 스냅샷)부터만
+# diff를 적용하므로, 복원 비용은 전체 버전 수가 아니라 '가장 가까운 체크포인트까지의 거리'에 비례합니다.
+# 캐시는 메모리 예산(memory_budget, 바이트)을 넘지 않도록 가장 오래 사용하지 않은 것부터 버립니다. (LRU)
+# ==============================================================================
+
+import bisect
+import collections
+from typing import Iterable, Iterator, List, Optional, Union
+
+from . import delta
+
+# 체크포인트를 남기는 버전 간격입니다. (복원 시 적용해야 하는 diff 수의 상한이 됩니다)
+CHECKPOINT_INTERVAL = 32
+# 체크포인트 캐시의 기본 메모리 예산(바이트)입니다.
+CHECKPOINT_MEMORY_BUDGET = 64 * 1024 * 1024
+# 줄 하나(str 객체와 리스트 슬롯)에 드는 대략적인 추가 메모리(바이트)입니다.
+_LINE_OVERHEAD = 57
+
+
+def _estimate_size(lines: List[str]) -> int:
+    """ 줄 목록이 차지하는 메모리 크기를 대략적으로 계산합니다. """
+    return sum(len(line) for line in lines) + _LINE_OVERHEAD * len(lines)
+
+
+class VersionHistory:
+    """
+    복호화된 로그 항목들로부터 임의의 버전을 복원합니다.
+    - entries: 복호화된 로그 항목 (str 또는 utf-8 bytes) 목록
+    - checkpoint_interval: 복원하면서 체크포인트를 남기는 버전 간격
+    - memory_budget: 체크포인트 캐시의 메모리 예산 (바이트)
+    - file: 여러 파일 추적 모드의 로그에서 복원할 파일 이름 (e.g., 'src/mission_python/main.py')
+      None이면 모든 항목을 하나의 파일(main.py)의 이력으로 봅니다.
+    """
+
+    def __init__(self, entries: Iterable[Union[str, bytes]],
+                 checkpoint_interval: int = CHECKPOINT_INTERVAL,
+                 memory_budget: int = CHECKPOINT_MEMORY_BUDGET,
+                 file: Optional[str] = None):
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.memory_budget = memory_budget
+        # 버전을 만드는 항목만 골라 분석해 둡니다. (레코드 하나에 여러 항목이 있으면 나누어 봅니다)
+        self._entries = []
+        for text in entries:
+            if isinstance(text, bytes):
+                text = text.decode('utf-8')
+            for entry_text in delta.split_entries(text):
+                entry = delta.parse_entry(entry_text)
+                if not entry or entry["kind"] not in ("initial", "keyframe", "changes", "delta"):
+                    continue
+                if file is None or entry["file"] == file:
+                    self._entries.append(entry)
+        # 스냅샷 항목의 버전 번호 (정렬된 목록), 스냅샷은 캐시 없이도 바로 복원할 수 있는 체크포인트입니다.
+        self._snapshots = [k for k, entry in enumerate(self._entries) if entry["kind"] in ("initial", "keyframe")]
+        # 체크포인트 캐시: {버전 번호: 줄 목록}, 사용 순서는 OrderedDict의 순서로 관리합니다.
+        self._cache = collections.OrderedDict()
+        self._cache_sizes = {}
+        self._cache_keys = []
+        self._cache_bytes = 0
+        # 마지막 get_version() 호출에서 적용한 diff 수입니다. (성능 확인용)
+        self.last_replay_count = 0
+
+    @classmethod
+    def from_log(cls, path: str, private_key, **options) -> "VersionHistory":
+        """ 암호화된 로그 파일을 복호화하여 VersionHistory를 만듭니다. """
+        from .reader import iter_log_entries
+        return cls(iter_log_entries(path, private_key), **options)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def cache_bytes(self) -> int:
+        """ 현재 체크포인트 캐시가 사용 중인 메모리(추정치, 바이트)입니다. """
+        return self._cache_bytes
+
+    def _remember(self, version: int, lines: List[str]):
+        """ 복원한 버전을 체크포인트 캐시에 넣고, 메모리 예산을 넘으면 오래된 것부터 버립니다. """
+        if version in self._cache:
+            self._cache.move_to_end(version)
+            return
+        size = _estimate_size(lines)
+        if size > self.memory_budget:
+            return
+        self._cache[version] = lines
+        self._cache_sizes[version] = size
+        bisect.insort(self._cache_keys, version)
+        self._cache_bytes += size
+        while self._cache_bytes > self.memory_budget:
+            evicted, _ = self._cache.popitem(last=False)
+            self._cache_bytes -= self._cache_sizes.pop(evicted)
+            del self._cache_keys[bisect.bisect_left(self._cache_keys, evicted)]
+
+    def _nearest_start(self, version: int) -> int:
+        """ version 이하에서 바로 복원할 수 있는 가장 가까운 버전(체크포인트 또는 스냅샷)을 찾습니다. """
+        position = bisect.bisect_right(self._snapshots, version)
+        if position == 0:
+            raise ValueError("복원을 시작할 스냅샷(initial/keyframe) 항목이 없습니다.")
+        start = self._snapshots[position - 1]
+        position = bisect.bisect_right(self._cache_keys, version)
+        if position and self._cache_keys[position - 1] > start:
+            start = self._cache_keys[position - 1]
+        return start
+
+    def get_version(self, version: int) -> List[str]:
+        """
+        version번째 버전의 줄 목록(줄바꿈 문자 없음)을 반환합니다. (음수이면 뒤에서부터, -1은 마지막 버전)
+        가장 가까운 이전 체크포인트부터 필요한 diff만 적용합니다.
+        """
+        if version < 0:
+            version += len(self._entries)
+        if not 0 <= version < len(self._entries):
+            raise IndexError(f"버전 번호가 범위를 벗어났습니다: {version} (전체 {len(self._entries)}개)")
+
+        start = self._nearest_start(version)
+        if start in self._cache:
+            self._cache.move_to_end(start)
+            lines = self._cache[start]
+        else:
+            lines = self._entries[start]["lines"]
+
+        self.last_replay_count = version - start
+        for current in range(start + 1, version + 1):
+            entry = self._entries[current]
+            if entry["kind"] in ("initial", "keyframe"):
+                lines = entry["lines"]
+            else:
+                lines = delta.apply_diff(lines, entry["lines"])
+            # 지나가는 길에 일정 간격마다 체크포인트를 남겨, 이후의 이동 비용을 줄입니다.
+            if current % self.checkpoint_interval == 0:
+                self._remember(current, lines)
+        self._remember(version, lines)
+        # 캐시에 보관된 목록이 바뀌지 않도록 복사본을 돌려줍니다.
+        return list(lines)
+
+    def iter_versions(self) -> Iterator[List[str]]:
+        """ 모든 버전의 줄 목록을 처음부터 순서대로 돌려줍니다. (버전마다 diff 하나만 적용합니다) """
+        lines: List[str] = []
+        for current, entry in enumerate(self._entries):
+            if entry["kind"] in ("initial", "keyframe"):
+                lines = entry["lines"]
+            else:
+                lines = delta.apply_diff(lines, entry["lines"])
+            if current % self.checkpoint_interval == 0:
+                self._remember(current, lines)
+            yield list(lines)
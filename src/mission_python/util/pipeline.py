@@ -0,0 +1,155 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Streaming Log Pipeline (v1.0)
+# ------------------------------------------------------------------------------
+# 큰 파일의 변경 내용을, 로그 항목 전체를 메모리에 만들지 않고 조각 단위로 로그 파일에 기록하는 모듈입니다.
+#
+#   diff 줄 (diffengine.unified_diff 제너레이터)
+#     -> 텍스트 조각을 모아 UTF-8로 인코딩 (iter_encoded)
+#     -> [압축 기록 모드이면] 조각 단위 압축 (codec.compress_stream)
+#     -> 조각 단위 암호화 (crypto.encrypt_stream)
+#     -> 로그 파일
+#
+# 기존 방식은 diff 줄 목록, 합친 문자열, 인코딩한 바이트, 암호문을 동시에 메모리에 가지고 있어
+# 파일 크기의 몇 배에 달하는 메모리를 사용했지만, 이 파이프라인은 두 버전의 줄 목록(과 diff 알고리즘이
+# 사용하는 줄 ID) 외에는 조각 크기(STREAM_CHUNK_CHARS) 정도의 메모리만 사용합니다.
+#
+# - 결과는 기존 방식(utility.make_change_entry + crypto.encrypt_data)과 같은 형식이므로 그대로 읽을 수 있습니다.
+# - 세션 모드와 컨테이너 형식은 레코드 앞에 전체 길이를 먼저 기록하고 이를 인증/검사에 사용하므로 지원하지 않습니다.
+#   (utility.use_streaming_pipeline()이 사용 여부를 결정합니다)
+# - 기록 도중 실패하면 로그 파일을 기록 전의 크기로 되돌립니다.
+# ==============================================================================
+
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from . import codec
+from . import crypto
+from . import diffengine
+
+# 한 번에 인코딩할 텍스트 조각의 크기(문자 수)입니다. 인코딩한 바이트는 이 값의 최대 4배입니다.
+STREAM_CHUNK_CHARS = 64 * 1024
+
+
+def iter_diff_text(header: str, backup_lines: List[str], current_lines: List[str],
+                   algorithm: str = diffengine.DEFAULT_ALGORITHM) -> Iterator[str]:
+    """
+    utility.make_change_entry()의 전체 문맥 diff 항목과 같은 텍스트를 조각 단위로 만듭니다.
+    diff가 비어 있으면 아무것도 돌려주지 않습니다. (헤더도 돌려주지 않습니다)
+    - header: 항목의 헤더 (e.g., "\\n\\n🦊=== Code changes at ... ===\\n")
+    """
+    diff = diffengine.unified_diff(
+        backup_lines, current_lines, fromfile='previous version', tofile='current version',
+        n=len(backup_lines) + len(current_lines), algorithm=algorithm)
+    first = next(diff, None)
+    if first is None:
+        return
+    yield header
+    yield first.rstrip('\r\n')
+    for line in diff:
+        yield '\n'
+        yield line.rstrip('\r\n')
+
+
+def iter_encoded(pieces: Iterable[str], chunk_chars: int = STREAM_CHUNK_CHARS) -> Iterator[bytes]:
+    """ 텍스트 조각들을 chunk_chars 정도의 크기로 모아 UTF-8 바이트로 인코딩합니다. """
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_chars:
+            yield "".join(buffer).encode('utf-8')
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode('utf-8')
+
+
+class ChunkReader:
+    """
+    바이트 조각을 돌려주는 제너레이터를, 요청한 크기 이하로 읽을 수 있는 파일 객체처럼 감쌉니다.
+    (crypto.encrypt_stream의 입력으로 사용합니다) 지나간 바이트 수와 문자 수를 함께 셉니다.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b'')
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b''
+            self._pending = memoryview(chunk)
+        if size < 0 or size >= len(self._pending):
+            data, self._pending = self._pending, memoryview(b'')
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        self.bytes_read += len(data)
+        return bytes(data)
+
+
+def write_change_entry(log_file: str, header: str, backup_lines: List[str], current_lines: List[str],
+                       encrypt: bool = True, algorithm: str = diffengine.DEFAULT_ALGORITHM,
+                       compression: Optional[str] = None, level: int = 6,
+                       previous_versions: Optional[Dict[str, str]] = None) -> Optional[dict]:
+    """
+    두 버전의 전체 문맥 diff 항목을 조각 단위로 만들어 로그 파일 끝에 바로 기록합니다.
+    - log_file: 기록할 로그 파일 (이미 있는 파일의 끝에 이어서 기록합니다)
+    - encrypt: True이면 기존 형식으로 암호화하여 기록하고, False이면 평문 그대로 기록합니다. (log.plain)
+    - compression: 압축 코덱('zlib' 또는 'lzma'), None이면 압축하지 않습니다. (암호화할 때만 사용)
+    - previous_versions: 압축 사전으로 사용할 {파일 이름: 직전 버전 내용}
+    - 반환값: {"changed": diff가 있었는지, "chars": 항목의 문자 수, "bytes_in": 인코딩한 바이트 수,
+               "bytes_written": 로그에 기록한 바이트 수}, 실패 시 None
+    """
+    chars = 0
+
+    def counted(pieces):
+        nonlocal chars
+        for piece in pieces:
+            chars += len(piece)
+            yield piece
+
+    pieces = iter_diff_text(header, backup_lines, current_lines, algorithm)
+    first = next(pieces, None)
+    if first is None:
+        return {"changed": False, "chars": 0, "bytes_in": 0, "bytes_written": 0}
+
+    def all_pieces():
+        yield first
+        yield from pieces
+
+    reader = ChunkReader(iter_encoded(counted(all_pieces())))
+    with open(log_file, 'r+b' if os.path.exists(log_file) else 'w+b') as f:
+        start = f.seek(0, os.SEEK_END)
+        try:
+            if not encrypt:
+                while True:
+                    data = reader.read()
+                    if not data:
+                        break
+                    f.write(data)
+                written = reader.bytes_read
+            else:
+                chunks = iter(reader.read, b'')
+                if compression:
+                    chunks = codec.compress_stream(chunks, compression, level, previous_versions)
+                written = crypto.encrypt_stream(ChunkReader(chunks), f)
+                if written is None:
+                    raise ValueError("스트리밍 암호화에 실패했습니다.")
+        except Exception as e:
+            # 기록하다 만 레코드가 남지 않도록, 로그 파일을 기록 전의 크기로 되돌립니다.
+            f.truncate(start)
+            print(f"🚫 변경사항 스트리밍 기록 중 오류 발생: {e}")
+            return None
+    return {"changed": True, "chars": chars, "bytes_in": reader.bytes_read, "bytes_written": written}
@@ -0,0 +1,145 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Encrypted Log Reader (v1.0)
+# ------------------------------------------------------------------------------
+# log.encrypted, signature.encrypted 파일을 다시 읽어 복호화하는 모듈입니다. (평가자 도구 및 테스트용)
+#
+# - 기존 형식(레코드를 이어 붙인 파일), 세션 모드 레코드, 컨테이너 형식(container 모듈)을 모두 읽을 수 있습니다.
+# - 파일 전체를 메모리에 올리지 않고, 레코드를 하나씩 읽어 복호화한 뒤 바로 돌려줍니다. (제너레이터)
+# - 기존 형식 레코드는 레코드마다 RSA 복호화가 필요하므로, 큰 로그에서는 workers 옵션으로
+#   여러 프로세스에서 나누어 복호화할 수 있습니다. 이 경우에도 결과는 기록된 순서대로 돌려줍니다.
+# - 압축된 레코드(codec 모듈)는 압축을 풀어 원래의 로그 항목으로 돌려줍니다.
+#
+# 사용 예:
+#   for entry in iter_log_entries("log/log.encrypted", private_key):
+#       print(entry.decode("utf-8"))
+# ==============================================================================
+
+import collections
+from typing import Iterator, Optional
+
+from . import codec
+from . import container
+from . import crypto
+
+# 병렬 모드에서 작업자 하나당 미리 맡겨 둘 레코드 수입니다.
+# 결과를 순서대로 돌려주기 위해 기다리는 레코드 수(메모리 사용량)가 이 값에 비례하여 제한됩니다.
+PREFETCH_PER_WORKER = 4
+
+# 작업자 프로세스 안에서 사용하는 개인키입니다. (작업자 초기화 시 한 번만 불러옵니다)
+_worker_private_key = None
+
+
+def _init_worker(private_key_pem: bytes):
+    """ 작업자 프로세스를 초기화합니다. 개인키 객체는 프로세스 간에 전달할 수 없으므로 PEM으로 받아 다시 불러옵니다. """
+    global _worker_private_key
+    from cryptography.hazmat.primitives import serialization
+    _worker_private_key = serialization.load_pem_private_key(private_key_pem, password=None)
+
+
+def _decrypt_legacy_in_worker(record: bytes) -> bytes:
+    """ 작업자 프로세스에서 기존 형식 레코드 하나를 복호화합니다. """
+    return crypto.decrypt_data(record, _worker_private_key)
+
+
+def _iter_records(path: str) -> Iterator[tuple]:
+    """
+    로그 파일의 레코드를 (종류, 레코드 바이트) 형태로 하나씩 돌려줍니다.
+    컨테이너의 프레임 하나에는 세션 헤더와 레코드가 함께 들어있을 수 있으므로, 다시 레코드 단위로 나눕니다.
+    """
+    for frame in container.iter_frames(path):
+        yield from crypto.split_records(frame["payload"])
+
+
+def _private_key_pem(private_key) -> bytes:
+    """ 작업자 프로세스에 전달하기 위해 개인키를 암호화되지 않은 PEM 바이트로 변환합니다. """
+    from cryptography.hazmat.primitives import serialization
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption())
+
+
+def iter_log_entries(path: str, private_key, workers: Optional[int] = None,
+                     decompress: bool = True) -> Iterator[bytes]:
+    """
+    암호화된 로그 파일의 레코드를 기록된 순서대로 하나씩 복호화하여 돌려줍니다.
+    - path: 읽을 로그 파일 경로 (e.g., log/log.encrypted, log/signature.encrypted)
+    - private_key: cryptography 라이브러리의 RSA 개인키 객체
+    - workers: 2 이상이면 기존 형식 레코드를 그 수만큼의 프로세스에서 병렬로 복호화합니다.
+      (None 또는 1이면 현재 프로세스에서 순서대로 복호화합니다)
+    - decompress: True이면 압축된 레코드의 압축을 풀어 돌려줍니다. (codec.RecordDecoder, 현재 프로세스에서 순서대로 처리)
+    - 반환값: 각 레코드의 원본 데이터(bytes)를 차례로 돌려주는 제너레이터
+    레코드가 잘려 있거나 복호화할 수 없으면 ValueError 등의 예외가 발생합니다.
+    """
+    entries = _iter_decrypted(path, private_key, workers)
+    if not decompress:
+        yield from entries
+        return
+    decoder = codec.RecordDecoder()
+    try:
+        for entry in entries:
+            yield decoder.decode(entry)
+    finally:
+        entries.close()
+
+
+def _iter_decrypted(path: str, private_key, workers: Optional[int]) -> Iterator[bytes]:
+    """ 레코드를 복호화만 하여 차례로 돌려줍니다. (iter_log_entries 참고) """
+    # 세션 헤더의 RSA 복호화는 세션당 한 번뿐이고, 세션 레코드는 AES-GCM만 사용하므로 항상 현재 프로세스에서 처리합니다.
+    sessions = {}
+
+    def decrypt_session(kind, record):
+        if kind == 'session_header':
+            sessions[crypto.session_id_of(record)] = crypto.unwrap_session_header(record, private_key)
+            return None
+        session_id = crypto.session_id_of(record)
+        if session_id not in sessions:
+            raise ValueError("세션 헤더가 없는 레코드입니다.")
+        return crypto.decrypt_session_record(record, sessions[session_id])
+
+    if not workers or workers < 2:
+        for kind, record in _iter_records(path):
+            if kind == 'legacy':
+                yield crypto.decrypt_data(record, private_key)
+            else:
+                entry = decrypt_session(kind, record)
+                if entry is not None:
+                    yield entry
+        return
+
+    # 병렬 모드: 기존 형식 레코드는 작업자에게 맡기고(Future), 세션 레코드는 바로 복호화한 결과를
+    # 같은 대기열에 순서대로 넣습니다. 대기열의 맨 앞부터 꺼내므로 결과의 순서가 유지됩니다.
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    pending = collections.deque()
+    max_pending = workers * PREFETCH_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(_private_key_pem(private_key),)) as executor:
+        try:
+            for kind, record in _iter_records(path):
+                if kind == 'legacy':
+                    pending.append(executor.submit(_decrypt_legacy_in_worker, record))
+                else:
+                    entry = decrypt_session(kind, record)
+                    if entry is not None:
+                        pending.append(entry)
+                while len(pending) >= max_pending:
+                    item = pending.popleft()
+                    yield item.result() if isinstance(item, Future) else item
+            while pending:
+                item = pending.popleft()
+                yield item.result() if isinstance(item, Future) else item
+        finally:
+            # 제너레이터를 중간에 멈춘 경우, 아직 시작되지 않은 작업은 취소합니다.
+            for item in pending:
+                if isinstance(item, Future):
+                    item.cancel()
@@ -0,0 +1,265 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Append-only Baseline Store (v1.0)
+# ------------------------------------------------------------------------------
+# 다음 비교에 사용할 직전 버전(baseline)을 log.temp 대신 추가 전용(append-only) 파일에 저장하는 모듈입니다.
+#
+# [기존 방식의 문제]
+# 커밋마다 log.encrypted에 항목을 추가한 뒤 log.temp 전체를 다시 쓰므로 쓰기 양이 두 배가 되고,
+# 두 쓰기 사이에 프로그램이 멈추면 두 파일이 서로 맞지 않게 되어 다음 diff가 잘못된 기준으로 만들어집니다.
+#
+# [저장소 파일 형식] log.store
+#   [파일 헤더 (8)]   : STORE_MAGIC (4) + 버전 (1) + 예약 (3)
+#   [레코드] ...      : 길이 (4) + CRC32 (4) + JSON 내용
+#       JSON 내용     : {"log_size": 기록 후 로그 파일 크기,
+#                        "files": {파일 이름: {"snapshot": 전체 내용} 또는 {"ops": 변경 목록}, "sha256": 해시}}
+#
+# - 커밋마다 바뀐 부분(ops)만 담은 작은 레코드 하나를 끝에 추가하고, 누적 크기가 커지면
+#   전체 내용(snapshot) 하나로 압축한 새 파일로 교체(temp + rename)합니다.
+# - 레코드의 log_size는 '이 기준 버전에 해당하는 로그 파일의 크기'입니다. 레코드 추가가 커밋의 완료 시점이 됩니다.
+# - 저장소를 열 때 복구 검사(recovery scan)를 수행합니다.
+#     1. CRC가 맞지 않거나 잘린 마지막 레코드는 잘라냅니다.
+#     2. 로그가 마지막 log_size보다 길면(항목 추가 후 기준 버전 기록 전에 멈춤), 로그의 남은 부분을 잘라냅니다.
+#        잘라낸 변경은 기준 버전이 그대로이므로 다음 실행에서 다시 감지되어 기록됩니다.
+#     3. 로그가 더 짧거나, 복원한 내용의 해시가 맞지 않으면 기준 버전을 버립니다.
+#        (다음 커밋은 전체 버전을 기록하여 로그를 다시 맞춥니다)
+#
+# [fsync 정책]
+#   'every'   : 커밋마다 로그와 저장소를 디스크에 강제로 기록합니다. (가장 안전, 가장 느림)
+#   'batched' : 프로세스당 FSYNC_BATCH_INTERVAL초에 최대 한 번만 강제로 기록합니다. (watch 모드 등)
+#   'os'      : 운영체제에 맡깁니다. (기본값, 멈춤 후에는 위의 복구 검사로 일관성을 맞춥니다)
+# ==============================================================================
+
+import os
+import json
+import time
+import zlib
+import struct
+from typing import Dict, List, Optional
+
+from . import diffengine
+
+STORE_MAGIC = b'\xfeMPB'
+STORE_VERSION = 1
+FILE_HEADER = struct.Struct('>4sB3x')
+RECORD_HEADER = struct.Struct('>II')
+
+FSYNC_POLICIES = ('every', 'batched', 'os')
+# 'batched' 정책에서 강제 기록 사이의 최소 간격(초)입니다.
+FSYNC_BATCH_INTERVAL = 5.0
+# 저장소 크기가 이 값(바이트)을 넘고, 전체 내용 크기의 COMPACT_RATIO배를 넘으면 압축합니다.
+COMPACT_MIN_BYTES = 64 * 1024
+COMPACT_RATIO = 4
+
+# 'batched' 정책에서 마지막으로 강제 기록한 시각입니다. (time.monotonic() 기준)
+_last_sync = None
+
+
+def should_sync(policy: str) -> bool:
+    """ fsync 정책에 따라 이번 쓰기를 디스크에 강제로 기록해야 하는지 결정합니다. """
+    global _last_sync
+    if policy == 'every':
+        return True
+    if policy == 'batched':
+        now = time.monotonic()
+        if _last_sync is None or now - _last_sync >= FSYNC_BATCH_INTERVAL:
+            _last_sync = now
+            return True
+    return False
+
+
+def sync_path(path: str):
+    """ 파일의 내용을 디스크에 강제로 기록합니다. (fsync) """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _digest(content: str) -> str:
+    import hashlib
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def make_ops(old_content: str, new_content: str) -> List[list]:
+    """
+    이전 내용을 새 내용으로 바꾸는 변경 목록을 만듭니다. 줄바꿈 문자까지 그대로 보존됩니다.
+    - 반환값: [이전 내용의 시작 줄, 끝 줄, [새로 들어갈 줄들]] 목록
+    """
+    old_lines = old_content.splitlines(keepends=True)
+    new_lines = new_content.splitlines(keepends=True)
+    return [[i1, i2, new_lines[j1:j2]]
+            for tag, i1, i2, j1, j2 in diffengine.opcodes(old_lines, new_lines) if tag != 'equal']
+
+
+def apply_ops(old_content: str, ops: List[list]) -> str:
+    """ make_ops()로 만든 변경 목록을 이전 내용에 적용합니다. """
+    old_lines = old_content.splitlines(keepends=True)
+    result = []
+    cursor = 0
+    for start, end, lines in ops:
+        if start < cursor or end > len(old_lines):
+            raise ValueError("변경 목록을 적용할 수 없습니다.")
+        result.extend(old_lines[cursor:start])
+        result.extend(lines)
+        cursor = end
+    result.extend(old_lines[cursor:])
+    return ''.join(result)
+
+
+class BaselineStore:
+    """
+    파일별 직전 버전(baseline)을 보관하는 추가 전용 저장소입니다.
+    - path: 저장소 파일 경로 (e.g., log/log.store)
+    - log_file: 이 저장소와 짝을 이루는 로그 파일 경로 (복구 검사에 사용)
+    - fsync_policy: 'every', 'batched', 'os' 중 하나
+    사용 전에 open()을 호출해야 합니다.
+    """
+
+    def __init__(self, path: str, log_file: str, fsync_policy: str = 'os'):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"알 수 없는 fsync 정책입니다: {fsync_policy}")
+        self.path = path
+        self.log_file = log_file
+        self.fsync_policy = fsync_policy
+        self.files: Dict[str, str] = {}
+        # 마지막 레코드에 기록된 로그 파일 크기입니다. (레코드가 없으면 None)
+        self.log_size: Optional[int] = None
+        # 복구 검사 결과: 잘라낸 저장소/로그 바이트 수, 버린 기준 버전 이름 목록
+        self.recovery = {"store_bytes": 0, "log_bytes": 0, "dropped": []}
+        self._size = 0
+
+    def _read_records(self) -> List[dict]:
+        """ 저장소 파일의 레코드를 모두 읽습니다. 손상되거나 잘린 마지막 부분은 잘라냅니다. """
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        if len(data) < FILE_HEADER.size or FILE_HEADER.unpack_from(data, 0)[0] != STORE_MAGIC:
+            # 헤더조차 없는 파일은 사용할 수 없으므로 새로 시작합니다.
+            self.recovery["store_bytes"] = len(data)
+            os.remove(self.path)
+            return []
+
+        records = []
+        offset = FILE_HEADER.size
+        while offset + RECORD_HEADER.size <= len(data):
+            length, checksum = RECORD_HEADER.unpack_from(data, offset)
+            payload = data[offset + RECORD_HEADER.size:offset + RECORD_HEADER.size + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+            try:
+                records.append(json.loads(payload.decode('utf-8')))
+            except ValueError:
+                break
+            offset += RECORD_HEADER.size + length
+
+        if offset < len(data):
+            self.recovery["store_bytes"] = len(data) - offset
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+        self._size = offset
+        return records
+
+    def open(self) -> "BaselineStore":
+        """ 저장소를 읽어 파일별 직전 버전을 복원하고, 로그 파일과 맞지 않는 부분을 복구합니다. """
+        for record in self._read_records():
+            for name, update in record.get("files", {}).items():
+                try:
+                    if "snapshot" in update:
+                        content = update["snapshot"]
+                    elif name in self.files:
+                        content = apply_ops(self.files[name], update["ops"])
+                    else:
+                        raise ValueError(name)
+                except (KeyError, ValueError, TypeError):
+                    content = None
+                # 복원한 내용의 해시가 기록된 해시와 다르면, 그 파일의 기준 버전은 믿을 수 없으므로 버립니다.
+                if content is None or _digest(content) != update.get("sha256"):
+                    self.files.pop(name, None)
+                    self.recovery["dropped"].append(name)
+                else:
+                    self.files[name] = content
+            self.log_size = record.get("log_size")
+
+        if self.log_size is not None:
+            current_log_size = os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0
+            if current_log_size > self.log_size:
+                # 로그에 항목을 추가한 뒤 기준 버전을 기록하기 전에 멈춘 경우입니다. 확정되지 않은 항목을 잘라냅니다.
+                with open(self.log_file, 'r+b') as f:
+                    f.truncate(self.log_size)
+                self.recovery["log_bytes"] = current_log_size - self.log_size
+            elif current_log_size < self.log_size:
+                # 로그가 잘렸거나 교체된 경우, 기준 버전이 로그와 맞지 않으므로 모두 버립니다.
+                self.recovery["dropped"].extend(self.files)
+                self.files = {}
+        return self
+
+    def get(self, name: str) -> Optional[str]:
+        """ 파일의 직전 버전 내용을 반환합니다. 없으면 None입니다. """
+        return self.files.get(name)
+
+    def _encode(self, record: dict) -> bytes:
+        payload = json.dumps(record, ensure_ascii=False).encode('utf-8')
+        return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def commit(self, contents: Dict[str, str], log_size: int, sync: bool = False):
+        """
+        파일별 새 기준 버전을 하나의 레코드로 저장소 끝에 추가합니다. 이 레코드가 기록되면 커밋이 완료됩니다.
+        - contents: {파일 이름: 새 내용}
+        - log_size: 이번 커밋의 로그 항목을 추가한 뒤의 로그 파일 크기
+        - sync: True이면 레코드를 디스크에 강제로 기록합니다. (fsync)
+          로그 파일과 같은 결정을 따라야 하므로, 호출하는 쪽에서 커밋마다 한 번 should_sync()로 정해 넘깁니다.
+        """
+        files = {}
+        for name, content in contents.items():
+            update = {"sha256": _digest(content)}
+            if name in self.files:
+                update["ops"] = make_ops(self.files[name], content)
+            else:
+                update["snapshot"] = content
+            files[name] = update
+        self.files.update(contents)
+        self.log_size = log_size
+
+        total_content = sum(len(content) for content in self.files.values())
+        record = self._encode({"log_size": log_size, "files": files})
+        if self._size + len(record) > max(COMPACT_MIN_BYTES, COMPACT_RATIO * total_content):
+            self.compact()
+            return
+
+        is_new = not os.path.exists(self.path)
+        with open(self.path, 'ab') as f:
+            if is_new:
+                f.write(FILE_HEADER.pack(STORE_MAGIC, STORE_VERSION))
+            f.write(record)
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+        self._size = os.path.getsize(self.path)
+
+    def compact(self):
+        """ 현재 기준 버전들을 전체 내용(snapshot) 레코드 하나로 압축한 새 저장소 파일로 교체합니다. """
+        record = self._encode({
+            "log_size": self.log_size,
+            "files": {name: {"snapshot": content, "sha256": _digest(content)}
+                      for name, content in self.files.items()},
+        })
+        temp_file = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(FILE_HEADER.pack(STORE_MAGIC, STORE_VERSION) + record)
+            f.flush()
+            if self.fsync_policy != 'os':
+                os.fsync(f.fileno())
+        os.replace(temp_file, self.path)
+        self._size = FILE_HEADER.size + len(record)
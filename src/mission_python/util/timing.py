@@ -0,0 +1,170 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Per-phase Timing (v1.0)
+# ------------------------------------------------------------------------------
+# "main.py 실행이 느리다"는 문의가 왔을 때, 어느 단계(파일 읽기, 줄 나누기, diff, 암호화, 로그 쓰기,
+# 네트워크 조회, psutil 등)가 느린지 확인하기 위한 단계별 시간 측정 모듈입니다.
+#
+# [켜는 방법] 환경 변수 MISSION_PYTHON_TIMING
+#   MISSION_PYTHON_TIMING=1                  : 프로젝트의 log/timing.jsonl에 기록합니다.
+#   MISSION_PYTHON_TIMING=/tmp/timing.jsonl  : 지정한 파일에 기록합니다.
+# 환경 변수는 자식 프로세스에 전달되므로, 백그라운드 서명 작업자의 측정값도 같은 파일에 기록됩니다.
+#
+# [기록 형식] JSON Lines (한 줄에 하나의 이벤트)
+#   {"event": "log_code_changes", "ts": 시각, "pid": PID, "total_ms": 전체 시간,
+#    "phases": {"read": ms, "diff": ms, ...}, "bytes_read": 바이트 수, ...}
+#
+# [사용 방법]
+#   @timing.timed("encrypt_data")   : 함수 호출 하나를 이벤트 하나로 기록합니다.
+#   timing.mark("read")             : 직전 mark 이후의 시간을 현재 이벤트의 'read' 단계로 기록합니다.
+#   timing.note(bytes_read=n)       : 현재 이벤트에 값을 추가합니다.
+#   timing.emit("probe", ...)       : 이미 측정한 값을 이벤트 하나로 바로 기록합니다.
+# 꺼져 있을 때는 mark()/note()가 전역 변수 하나만 확인하고 바로 반환하므로, 비용이 거의 없습니다.
+# ==============================================================================
+
+import os
+import json
+import time
+import threading
+from functools import wraps
+from typing import Optional
+
+# 단계별 시간 측정을 켜는 환경 변수입니다. 값이 '1'이면 기본 파일, 그 밖의 값은 기록할 파일 경로입니다.
+TIMING_ENV = "MISSION_PYTHON_TIMING"
+# 환경 변수 값이 '1'일 때 기록할 기본 파일입니다. (프로젝트의 log 폴더)
+DEFAULT_TIMING_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   'log', 'timing.jsonl')
+
+# 측정값을 기록할 파일 경로입니다. (None이면 꺼짐)
+output_file: Optional[str] = None
+# 측정이 켜져 있는지 여부입니다. mark()/note()/timed()가 가장 먼저 확인합니다.
+enabled = False
+
+# 스레드별로 현재 측정 중인 이벤트입니다. (서명 수집의 조회들은 각자의 스레드에서 실행됩니다)
+_local = threading.local()
+# 여러 스레드가 한 파일에 기록할 때 줄이 섞이지 않도록 합니다.
+_write_lock = threading.Lock()
+
+
+def configure(path: Optional[str]):
+    """ 측정값을 기록할 파일을 지정합니다. None이면 측정을 끕니다. """
+    global output_file, enabled
+    output_file = path
+    enabled = path is not None
+
+
+def configure_from_env():
+    """ 환경 변수 MISSION_PYTHON_TIMING의 값으로 측정 여부와 기록할 파일을 정합니다. """
+    value = os.environ.get(TIMING_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "off"):
+        configure(None)
+    elif value.lower() in ("1", "true", "on"):
+        configure(DEFAULT_TIMING_FILE)
+    else:
+        configure(value)
+
+
+def emit(event: str, **fields):
+    """ 이벤트 하나를 JSON 한 줄로 기록합니다. 기록에 실패해도 측정 대상 작업에는 영향을 주지 않습니다. """
+    if not enabled:
+        return
+    record = {"event": event, "ts": round(time.time(), 6), "pid": os.getpid(), **fields}
+    line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+    try:
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with _write_lock:
+            # 한 번의 write()로 줄 전체를 추가하므로, 여러 프로세스가 같은 파일에 기록해도 줄이 섞이지 않습니다.
+            with open(output_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+    except OSError:
+        pass
+
+
+class _Span:
+    """ 측정 중인 이벤트 하나입니다. 단계(phase)별 시간과 추가 값을 모읍니다. """
+
+    def __init__(self, event: str):
+        self.event = event
+        self.fields = {}
+        self.phases = {}
+        self.started = self.last = time.perf_counter()
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        # 같은 이름의 단계가 여러 번 나오면(e.g., 여러 파일) 시간을 더합니다.
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self.last) * 1000
+        self.last = now
+
+    def finish(self, error: Optional[BaseException] = None):
+        total_ms = (time.perf_counter() - self.started) * 1000
+        fields = dict(self.fields)
+        if error is not None:
+            fields["error"] = type(error).__name__
+        emit(self.event, total_ms=round(total_ms, 3),
+             phases={name: round(ms, 3) for name, ms in self.phases.items()}, **fields)
+
+
+def mark(phase: str):
+    """ 직전 mark 이후(또는 이벤트 시작 이후)의 시간을 현재 이벤트의 phase 단계로 기록합니다. """
+    if not enabled:
+        return
+    span = getattr(_local, "span", None)
+    if span is not None:
+        span.mark(phase)
+
+
+def note(**fields):
+    """ 현재 이벤트에 값(e.g., 바이트 수, 결과)을 추가합니다. 숫자 값은 같은 이름끼리 더합니다. """
+    if not enabled:
+        return
+    span = getattr(_local, "span", None)
+    if span is None:
+        return
+    for key, value in fields.items():
+        previous = span.fields.get(key)
+        if isinstance(previous, (int, float)) and isinstance(value, (int, float)) and not isinstance(value, bool):
+            span.fields[key] = previous + value
+        else:
+            span.fields[key] = value
+
+
+def timed(event: str):
+    """
+    함수 호출 하나를 이벤트 하나로 기록하는 데코레이터입니다.
+    측정 중인 다른 이벤트 안에서 호출되면, 끝난 뒤 바깥 이벤트의 측정을 이어갑니다.
+    (바깥 이벤트에는 직전 mark 이후부터 이 함수가 끝날 때까지의 시간이 event 이름의 단계로 기록됩니다)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            outer = getattr(_local, "span", None)
+            span = _local.span = _Span(event)
+            error = None
+            try:
+                return func(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                span.finish(error)
+                _local.span = outer
+                if outer is not None:
+                    outer.mark(event)
+        return wrapper
+    return decorator
+
+
+# 모듈을 불러올 때 환경 변수를 한 번 확인합니다.
+configure_from_env()
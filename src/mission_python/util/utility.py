@@ -9,7 +9,8 @@
 
 import os
 import sys
-import difflib
+import json
+import time
 from datetime import datetime
 from typing import List, Optional, Union
 from functools import wraps
@@ -17,8 +18,98 @@ from functools import wraps
 # 개발 중 평문 로그 확인을 위한 플래그 (True: log.plain 생성, False: log.encrypted 생성)
 flag_plain_log_enabled = False
 
+# 압축 로그 모드 플래그 (True: 변경된 부분(hunk)만 기록, False: 파일 전체를 문맥으로 포함한 diff 기록)
+# 압축 모드에서는 로그 크기가 파일 크기가 아닌 수정한 양에 비례하여 늘어나며,
+# 복원 시간을 일정하게 유지하기 위해 주기적으로 전체 버전(keyframe)을 함께 기록합니다.
+flag_compact_log_enabled = False
+# 마지막 keyframe 이후 이 개수만큼 delta가 쌓이면, 다음 변경은 keyframe으로 기록합니다.
+KEYFRAME_INTERVAL = 50
+# 마지막 keyframe 이후 delta의 누적 크기(바이트)가 이 값을 넘으면, 다음 변경은 keyframe으로 기록합니다.
+KEYFRAME_MAX_DELTA_BYTES = 256 * 1024
+
+# 세션 암호화 모드 플래그 (True: 프로세스당 RSA 1회 + 레코드별 AES-GCM, False: 레코드마다 RSA + AES-CBC)
+# 세션 모드는 한 번의 실행에서 여러 레코드를 기록할 때(e.g., 여러 파일, watch 모드) 레코드당 크기와
+# CPU 사용량을 크게 줄여줍니다. 두 형식이 섞인 로그도 crypto.decrypt_records()로 모두 읽을 수 있습니다.
+flag_session_crypto_enabled = False
+
+# 변경 없음 빠른 확인 플래그 (True: log.meta에 기록된 크기/수정 시각으로 변경 여부를 먼저 확인)
+# 대부분의 실행은 main.py가 바뀌지 않으므로, stat() 한 번으로 확인이 끝나면 파일을 읽지 않습니다.
+flag_stat_fast_path_enabled = True
+# 파일 시스템의 시각 해상도 때문에, 기록 시점과 이 시간(나노초) 이내에 수정된 파일은
+# 같은 수정 시각을 가진 채 내용이 바뀌었을 수 있습니다. 이런 경우에는 내용의 해시로 다시 확인합니다.
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# 여러 파일 추적 설정을 읽을 pyproject.toml의 섹션 이름입니다.
+# [tool.mission-python] 섹션에 track = ["src/mission_python/*.py", "assets/*.csv", "tests/*.py"] 처럼
+# glob 패턴 목록을 적으면, main.py 대신 패턴에 맞는 모든 파일을 추적하여 한 번의 실행에 하나의 레코드로 기록합니다.
+# (설정이 없으면 기존처럼 main.py 하나만 추적합니다)
+TRACK_CONFIG_SECTION = "mission-python"
+# pyproject.toml을 찾기 위해 project_root에서부터 올라가 볼 최대 폴더 수입니다.
+TRACK_CONFIG_SEARCH_DEPTH = 3
+# 여러 파일의 내용을 동시에 읽고 해시를 계산할 때 사용할 최대 스레드 수입니다.
+TRACK_HASH_WORKERS = 8
+
+# 컨테이너 로그 모드 플래그 (True: 프레임 헤더와 인덱스 파일(log.encrypted.idx)을 함께 기록, False: 레코드를 그대로 이어 붙임)
+# 컨테이너 형식에서는 N번째(또는 마지막) 기록을 처음부터 복호화하지 않고 바로 찾아갈 수 있습니다.
+# 이미 기존 형식으로 기록 중인 로그에는 적용되지 않으며, 두 형식 모두 container.iter_frames()로 읽을 수 있습니다.
+flag_container_log_enabled = False
+
+# 추가 전용 저장소 모드 플래그 (True: 직전 버전을 log.store에 변경분만 추가, False: 커밋마다 log.temp 전체를 다시 씀)
+# 저장소 레코드의 추가가 커밋의 완료 시점이 되며, 저장소를 열 때 로그와 맞지 않는 부분을 복구합니다. (store 모듈 참고)
+# 처음 켤 때는 기존 log.temp를 기준 버전으로 이어받습니다. 켠 뒤에는 log.temp가 갱신되지 않으므로 다시 끄지 않아야 합니다.
+flag_append_store_enabled = False
+# 로그와 저장소를 디스크에 강제로 기록(fsync)하는 정책입니다: 'every'(커밋마다), 'batched'(일정 간격마다), 'os'(운영체제에 맡김)
+STORE_FSYNC_POLICY = 'os'
+
+# 변경 내용(diff)을 만들 때 사용할 알고리즘입니다: 'histogram'(기본값), 'patience', 'myers', 'difflib'(기존 방식)
+# 줄을 정수 ID로 바꾼 뒤 비교하므로, 큰 파일이나 반복이 많은 파일에서도 빠르며 출력 형식은 difflib과 같습니다. (diffengine 모듈 참고)
+DIFF_ALGORITHM = 'histogram'
+
+# 압축 기록 플래그 (True: 로그 항목을 암호화하기 전에 압축, False: 압축하지 않음)
+# 압축된 레코드에는 코덱 정보가 함께 기록되므로, 압축된 레코드와 기존 레코드가 섞인 로그도 그대로 읽을 수 있습니다. (codec 모듈 참고)
+flag_compression_enabled = False
+# 압축 코덱('zlib' 또는 'lzma')과 압축 수준(0~9)입니다.
+COMPRESSION_CODEC = 'zlib'
+COMPRESSION_LEVEL = 6
+# 직전 버전을 압축 사전으로 사용하는 플래그입니다. (zlib에서만 사용되며, 읽을 때 직전 버전을 복원해야 합니다)
+flag_compression_dictionary_enabled = True
+
+# 스트리밍 기록 플래그 (True: 큰 파일의 변경 내용을 조각 단위로 diff -> 인코딩 -> 압축 -> 암호화하여 로그에 바로 기록)
+# 로그 항목 전체를 메모리에 만들지 않으므로, 큰 파일에서도 두 버전 외에 추가로 사용하는 메모리가 일정합니다. (pipeline 모듈 참고)
+# 기록 형식은 기존과 같으며, 전체 문맥 diff를 기존 형식(세션 모드/컨테이너 형식이 아닌)으로 기록할 때만 사용됩니다.
+flag_streaming_log_enabled = True
+# 이 크기(바이트) 이상인 파일만 스트리밍으로 기록합니다. 작은 파일은 한 번에 처리하는 편이 더 빠릅니다.
+STREAMING_MIN_FILE_SIZE = 1024 * 1024
+
+# 기록 잠금 플래그 (True: 여러 프로세스가 동시에 기록하지 않도록 log/log.lock 파일로 잠금)
+# 변경이 없는 일반적인 실행(stat 빠른 확인 경로)에서는 잠금을 전혀 사용하지 않습니다.
+flag_commit_lock_enabled = True
+# 다른 프로세스의 기록이 끝나기를 기다리는 최대 시간(초)입니다. 시간이 지나면 이번 기록은 건너뜁니다.
+COMMIT_LOCK_TIMEOUT = 10.0
+
+# 한 프로세스 트리에서 자동 기록을 한 번만 실행하기 위한 환경 변수입니다. 값은 처음 기록을 실행한 프로세스의 PID입니다.
+# 환경 변수는 자식 프로세스에 그대로 전달되므로, multiprocessing(spawn/forkserver)이나 ProcessPoolExecutor의
+# 작업자가 mission_python을 다시 import 하더라도 자동 기록과 서명 수집을 다시 실행하지 않습니다.
+TRACKING_ROOT_ENV = "MISSION_PYTHON_TRACKING_ROOT"
+
 # '.crypto'는 현재 패키지 내의 crypto 모듈을 가져오는 상대 경로 임포트 방식입니다.
 from . import crypto
+# delta 모듈은 변경된 부분만 담은 압축 diff를 만들고 적용하는 기능을 제공합니다.
+from . import delta
+# container 모듈은 프레임 단위로 기록하고 인덱스로 바로 찾아갈 수 있는 로그 형식을 제공합니다.
+from . import container
+# store 모듈은 직전 버전을 추가 전용 파일에 보관하는 저장소를 제공합니다.
+from . import store
+# filelock 모듈은 여러 프로세스 사이의 기록 순서를 조정하는 파일 잠금을 제공합니다.
+from . import filelock
+# diffengine 모듈은 줄을 정수 ID로 바꾸어 비교하는 diff 알고리즘들을 제공합니다.
+from . import diffengine
+# codec 모듈은 로그 항목을 암호화하기 전에 압축하는 기능을 제공합니다.
+from . import codec
+# pipeline 모듈은 큰 파일의 변경 내용을 조각 단위로 로그에 기록하는 기능을 제공합니다.
+from . import pipeline
+# timing 모듈은 환경 변수 MISSION_PYTHON_TIMING으로 켜는 단계별 시간 측정 기능을 제공합니다.
+from . import timing
 
 def safe_file_operation(func):
     """
@@ -79,10 +170,281 @@ def write_file_content(file_path: str, content: Union[str, bytes], mode: str = '
     with open(file_path, mode, encoding=encoding) as f:
         f.write(content)
 
+def read_log_meta(meta_file: str) -> dict:
+    """
+    로그 상태 정보를 담은 메타데이터 파일(log.meta, JSON)을 읽습니다.
+    파일이 없거나 손상되었으면 빈 딕셔너리를 반환합니다.
+    """
+    try:
+        with open(meta_file, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return meta if isinstance(meta, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def write_log_meta(meta_file: str, meta: dict):
+    """
+    로그 메타데이터 파일을 임시 파일에 먼저 쓴 뒤 이름을 바꾸는 방식(temp + rename)으로 저장합니다.
+    쓰는 도중 중단되더라도 이전 내용이 깨지지 않습니다.
+    """
+    temp_file = f"{meta_file}.{os.getpid()}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(temp_file, meta_file)
+
+def encrypt_log_entry(log_entry_text: str, log_file: str, new_file: bool = False,
+                      previous_versions: Optional[dict] = None) -> Optional[bytes]:
+    """
+    로그 항목(문자열)을 설정된 방식(기존 하이브리드 암호화 또는 세션 모드)으로 암호화합니다.
+    - log_entry_text: 암호화할 로그 항목
+    - log_file: 암호화 결과가 기록될 로그 파일 경로 (세션 헤더 기록 여부 판단에 사용)
+    - new_file: 로그 파일을 새로 쓰는 경우 True
+    - previous_versions: {파일 이름: 직전 버전 내용}, 압축 기록 모드에서 압축 사전으로 사용합니다.
+    - 반환값: 암호화된 바이트, 실패 시 None
+    """
+    # 로그 내용을 암호화하기 전에 반드시 바이트(bytes) 형태로 인코딩해야 합니다.
+    data = log_entry_text.encode('utf-8')
+    if flag_compression_enabled:
+        data = codec.compress(data, COMPRESSION_CODEC, COMPRESSION_LEVEL,
+                              previous_versions if flag_compression_dictionary_enabled else None)
+        timing.note(bytes_compressed=len(data))
+        timing.mark("compress")
+    if flag_session_crypto_enabled:
+        return crypto.encrypt_session_record(data, log_file, new_file=new_file)
+    return crypto.encrypt_data(data)
+
+def use_streaming_pipeline(file_size: int) -> bool:
+    """
+    이번 변경을 스트리밍 파이프라인(pipeline 모듈)으로 기록할지 결정합니다.
+    전체 문맥 diff를 레코드 길이를 미리 알 필요가 없는 형식(기존 형식 또는 평문 로그)으로 기록하는 큰 파일에만 사용합니다.
+    """
+    return (flag_streaming_log_enabled and file_size >= STREAMING_MIN_FILE_SIZE
+            and not flag_compact_log_enabled and not flag_session_crypto_enabled
+            and not flag_container_log_enabled)
+
+def append_log_record(log_file: str, encrypted_entry: bytes, new_file: bool = False):
+    """
+    암호화된 로그 레코드를 로그 파일에 기록합니다.
+    - new_file: True이면 기존 로그를 덮어쓰고 새로 시작합니다. (최초 커밋)
+    컨테이너 로그 모드이면서 로그가 새 파일이거나 이미 컨테이너 형식이면 프레임으로 추가하고,
+    그 외에는 기존 방식대로 레코드를 그대로 이어 붙입니다.
+    """
+    if flag_container_log_enabled:
+        if new_file or not os.path.exists(log_file) or os.path.getsize(log_file) == 0:
+            container.create(log_file)
+        if container.is_container(log_file):
+            container.append_frame(log_file, encrypted_entry)
+            return
+    write_file_content(log_file, encrypted_entry, 'wb' if new_file else 'ab')
+
+def save_baseline(baseline_store: Optional["store.BaselineStore"], backup_file: str, log_file: str,
+                  contents: dict):
+    """
+    다음 비교에 사용할 직전 버전을 저장합니다.
+    - baseline_store: 추가 전용 저장소 (None이면 기존 방식대로 backup_file 전체를 다시 씁니다)
+    - backup_file: 기존 방식의 백업 파일 경로 (여러 파일이면 사용하지 않음)
+    - log_file: 이번 커밋의 항목이 기록된 로그 파일 경로
+    - contents: {파일 이름: 새 내용}
+    """
+    if baseline_store is None:
+        for content in contents.values():
+            write_file_content(backup_file, content, 'w')
+        return
+    # 로그 항목이 먼저 디스크에 기록된 뒤에 저장소 레코드(커밋 완료 표시)가 기록되도록 순서를 지킵니다.
+    # 강제 기록 여부는 커밋마다 한 번만 정하여 두 파일에 똑같이 적용합니다.
+    # ('batched' 정책에서 should_sync()를 두 번 부르면 두 번째는 항상 False가 되어 저장소 레코드가 기록되지 않습니다)
+    sync = store.should_sync(STORE_FSYNC_POLICY)
+    if sync:
+        store.sync_path(log_file)
+    baseline_store.commit(contents, os.path.getsize(log_file), sync)
+
+def open_baseline_store(log_dir: str, log_file: str) -> Optional["store.BaselineStore"]:
+    """ 추가 전용 저장소 모드이면 log.store를 열어(복구 검사 포함) 반환하고, 아니면 None을 반환합니다. """
+    if not flag_append_store_enabled:
+        return None
+    return store.BaselineStore(os.path.join(log_dir, 'log.store'), log_file, STORE_FSYNC_POLICY).open()
+
+def content_digest(content: str) -> str:
+    """ 파일 내용(str)의 SHA-256 해시를 16진수 문자열로 반환합니다. """
+    # hashlib은 실제로 해시가 필요할 때만 불러옵니다. (변경 없음 빠른 확인 경로에서는 필요 없음)
+    import hashlib
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def make_file_record(file_stat: os.stat_result, digest: str) -> dict:
+    """ 마지막으로 기록된 파일 버전의 크기, 수정 시각, 해시를 log.meta에 저장할 형태로 만듭니다. """
+    return {
+        "size": file_stat.st_size,
+        "mtime_ns": file_stat.st_mtime_ns,
+        "sha256": digest,
+        "recorded_ns": time.time_ns(),
+    }
+
+def is_unchanged_by_stat(record: Optional[dict], file_stat: os.stat_result) -> Optional[bool]:
+    """
+    log.meta에 기록된 정보와 현재 파일의 stat 결과를 비교합니다.
+    - 반환값: True(변경 없음이 확실함), False(변경되었음), None(수정 시각을 믿을 수 없어 해시 확인이 필요함)
+    """
+    if not record:
+        return False
+    if record.get("size") != file_stat.st_size or record.get("mtime_ns") != file_stat.st_mtime_ns:
+        return False
+    # 기록 직전(시각 해상도 이내)에 수정된 파일은, 같은 수정 시각으로 다시 수정되었을 수 있습니다.
+    if file_stat.st_mtime_ns + RACY_MTIME_WINDOW_NS >= record.get("recorded_ns", 0):
+        return None
+    return True
+
+def find_track_config(project_root: str) -> Optional[tuple]:
+    """
+    project_root에서부터 상위 폴더로 올라가며 pyproject.toml을 찾아, 여러 파일 추적 설정을 읽습니다.
+    - 반환값: (pyproject.toml이 있는 폴더, glob 패턴 목록) 튜플, 설정이 없으면 None
+    """
+    directory = os.path.abspath(project_root)
+    for _ in range(TRACK_CONFIG_SEARCH_DEPTH):
+        config_file = os.path.join(directory, 'pyproject.toml')
+        if os.path.isfile(config_file):
+            with open(config_file, 'rb') as f:
+                raw_config = f.read()
+            # 대부분의 프로젝트에는 추적 설정이 없으므로, 섹션 이름이 보일 때만 tomllib을 불러와 분석합니다.
+            if f"[tool.{TRACK_CONFIG_SECTION}]".encode('utf-8') not in raw_config:
+                return None
+            import tomllib
+            config = tomllib.loads(raw_config.decode('utf-8'))
+            patterns = config.get("tool", {}).get(TRACK_CONFIG_SECTION, {}).get("track")
+            if not patterns:
+                return None
+            if isinstance(patterns, str):
+                patterns = [patterns]
+            return directory, list(patterns)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    return None
+
+def expand_tracked_files(base_dir: str, patterns: List[str], exclude_dir: Optional[str] = None) -> List[str]:
+    """
+    glob 패턴 목록을 실제 파일 경로 목록(정렬, 중복 제거)으로 바꿉니다. ('**' 패턴을 지원합니다)
+    - exclude_dir: 이 폴더 아래의 파일은 제외합니다. (로그 폴더 자신을 추적하지 않기 위함)
+    """
+    import glob
+    exclude_prefix = os.path.abspath(exclude_dir) + os.sep if exclude_dir else None
+    files = set()
+    for pattern in patterns:
+        for match in glob.glob(pattern, root_dir=base_dir, recursive=True):
+            path = os.path.abspath(os.path.join(base_dir, match))
+            if not os.path.isfile(path):
+                continue
+            if exclude_prefix and path.startswith(exclude_prefix):
+                continue
+            files.add(path)
+    return sorted(files)
+
+def _read_and_digest(path: str) -> tuple:
+    """ 파일 내용을 읽고 해시를 계산합니다. (여러 파일을 동시에 처리할 때 작업 단위) """
+    content = read_file_content(path)
+    if content is None:
+        return None, None
+    return content, content_digest(content)
+
+def read_and_digest_files(paths: List[str]) -> List[tuple]:
+    """
+    여러 파일의 내용과 해시를 스레드를 사용해 동시에 구합니다. (파일 읽기와 해시 계산은 GIL을 놓고 수행됩니다)
+    - 반환값: paths와 같은 순서의 (내용, 해시) 튜플 목록, 읽기에 실패한 파일은 (None, None)
+    """
+    if len(paths) <= 1:
+        return [_read_and_digest(path) for path in paths]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(TRACK_HASH_WORKERS, len(paths))) as executor:
+        return list(executor.map(_read_and_digest, paths))
+
+def make_change_entry(backup_lines: List[str], current_lines: List[str], current_content_str: str,
+                      timestamp: str, file_name: str, keyframe_state: dict,
+                      name_in_header: bool = False) -> tuple:
+    """
+    이전 버전과 현재 버전의 차이를 설정된 방식(압축 로그 모드 또는 전체 문맥 diff)의 로그 항목으로 만듭니다.
+    - backup_lines, current_lines: splitlines(keepends=True)로 나눈 이전/현재 버전의 줄 목록
+    - current_content_str: 현재 버전의 전체 내용 (keyframe 기록에 사용)
+    - file_name: 로그에 표시할 파일 이름
+    - keyframe_state: 'deltas_since_keyframe', 'delta_bytes_since_keyframe' 값을 담은 딕셔너리 (이 함수가 갱신합니다)
+    - name_in_header: True이면 diff 항목의 헤더에도 파일 이름을 적습니다. (여러 파일 추적 모드)
+    - 반환값: (로그 항목 문자열, diff 줄 목록) 튜플, diff가 비어 있으면 기록할 변경이 없다는 의미입니다.
+    """
+    location = f" in {file_name}" if name_in_header else ""
+    if flag_compact_log_enabled:
+        # [압축 로그 모드]
+        # 변경된 부분(hunk)만 기록하되, 마지막 keyframe 이후 delta가 충분히 쌓였다면
+        # 이번 변경은 파일 전체를 담은 keyframe으로 기록하여 복원 시간이 길어지지 않도록 합니다.
+        deltas_since_keyframe = keyframe_state.get("deltas_since_keyframe", 0)
+        delta_bytes_since_keyframe = keyframe_state.get("delta_bytes_since_keyframe", 0)
+        is_keyframe = (deltas_since_keyframe >= KEYFRAME_INTERVAL
+                       or delta_bytes_since_keyframe >= KEYFRAME_MAX_DELTA_BYTES)
+
+        if is_keyframe:
+            log_entry_text = (
+                f"\n\n🦊=== Keyframe{location} at {timestamp} ===\n"
+                f"🦊=== Full version of {file_name} ===\n\n"
+                f"{current_content_str}"
+            )
+            # keyframe은 diff 대신 파일 전체를 기록하므로, 항목 자체를 기록 대상으로 둡니다.
+            # (파일이 빈 파일이 되었더라도 keyframe은 반드시 기록되어야 합니다.)
+            diff = [log_entry_text]
+            keyframe_state.update(deltas_since_keyframe=0, delta_bytes_since_keyframe=0)
+        else:
+            diff = delta.make_delta(backup_lines, current_lines, algorithm=DIFF_ALGORITHM)
+            diff_content = "\n".join(diff)
+            log_entry_text = (
+                f"\n\n🦊=== Code delta{location} at {timestamp} ===\n"
+                f"{diff_content}"
+            )
+            keyframe_state.update(
+                deltas_since_keyframe=deltas_since_keyframe + 1,
+                delta_bytes_since_keyframe=delta_bytes_since_keyframe + len(log_entry_text.encode('utf-8')),
+            )
+    else:
+        # diff 비교 시 컨텍스트 라인 수를 최대로 설정하여 파일 전체의 차이점을 정확하게 파악합니다.
+        context_lines = len(backup_lines) + len(current_lines)
+
+        # 설정한 알고리즘(DIFF_ALGORITHM)으로 두 파일 버전 간의 차이점을 생성합니다.
+        # 이 결과는 difflib.unified_diff와 같은, git diff와 유사한 형식의 문자열 리스트로 반환됩니다.
+        diff = list(diffengine.unified_diff(
+            backup_lines,    # 이전 버전
+            current_lines,   # 현재 버전
+            fromfile='previous version',
+            tofile='current version',
+            n=context_lines,
+            algorithm=DIFF_ALGORITHM
+        ))
+
+        # [안정성 강화]
+        # diff 리스트의 각 항목(라인)에서 혹시 모를 기존 줄바꿈 문자를 모두 제거한 후,
+        # 파이썬의 표준 줄바꿈(\n)으로 다시 합쳐서 한 줄로 붙는 현상을 원천 차단합니다.
+        diff_content = "\n".join(line.rstrip('\r\n') for line in diff)
+
+        # 변경사항(diff)을 포함한 로그 엔트리를 구성합니다.
+        log_entry_text = (
+            f"\n\n🦊=== Code changes{location} at {timestamp} ===\n"
+            f"{diff_content}"
+        )
+    
+    return log_entry_text, diff
+
+def claim_tracking_root() -> bool:
+    """
+    이 프로세스가 프로세스 트리에서 자동 기록을 실행할 프로세스인지 확인하고, 그렇다면 표시를 남깁니다.
+    - 반환값: 부모 프로세스가 이미 자동 기록을 실행했으면(환경 변수가 다른 PID로 설정됨) False, 그 외에는 True
+    """
+    root_pid = os.environ.get(TRACKING_ROOT_ENV)
+    if root_pid and root_pid != str(os.getpid()):
+        return False
+    os.environ[TRACKING_ROOT_ENV] = str(os.getpid())
+    return True
+
+@timing.timed("commit_changes")
 def commit_changes():
     """
     main.py 파일의 변경사항을 추적하여 암호화된 로그로 기록하는 메인 함수입니다.
     이 함수가 호출되면 전체 변경 추적 프로세스가 시작됩니다.
+    pyproject.toml의 [tool.mission-python] 섹션에 track 패턴이 있으면, 패턴에 맞는 모든 파일을 추적합니다.
     """
     try:
         # '__file__'은 현재 이 스크립트(utility.py) 파일의 절대 경로를 나타내는 내장 변수입니다.
@@ -96,6 +458,20 @@ def commit_changes():
         # /path/to/project/mission_python -> /path/to/project
         project_root = os.path.dirname(util_dir) 
 
+        # pyproject.toml에 추적할 파일 목록(glob 패턴)이 설정되어 있으면, 여러 파일 추적 모드로 기록합니다.
+        track_config = find_track_config(project_root)
+        timing.mark("track_config")
+        if track_config is not None:
+            base_dir, patterns = track_config
+            tracked_files = expand_tracked_files(base_dir, patterns, exclude_dir=os.path.join(project_root, 'log'))
+            timing.note(mode="tracked", files=len(tracked_files))
+            timing.mark("expand")
+            if not log_tracked_changes(tracked_files, project_root, base_dir):
+                raise RuntimeError("코드 변경사항 암호화 기록에 실패했습니다.")
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            print(f"\n🦊 Code changes successfully logged at {timestamp} ...")
+            return
+
         # 프로젝트 루트 폴더를 기준으로 main.py 파일의 전체 경로를 만듭니다.
         main_py_file = os.path.join(project_root, 'main.py')
         
@@ -103,6 +479,7 @@ def commit_changes():
         if not os.path.exists(main_py_file):
             raise FileNotFoundError(f"main.py를 찾을 수 없습니다: {main_py_file}")
             
+        timing.note(mode="single")
         # 실제 로깅 작업을 수행하는 log_code_changes 함수를 호출합니다.
         # 이 함수가 False를 반환하면 로깅에 실패했다는 의미입니다.
         if not log_code_changes(main_py_file, project_root):
@@ -119,12 +496,83 @@ def commit_changes():
         print(f"🚫 심각한 오류 발생: {str(e)}", file=sys.stderr)
         print(f"🚫 담당 교수에게 문의하세요.")
 
+def commit_with_lock(log_dir: str, func, *args) -> bool:
+    """
+    다른 프로세스와 동시에 기록하지 않도록 log/log.lock 잠금을 얻은 뒤 func(*args)를 실행합니다.
+    잠금을 기다리는 동안 다른 프로세스가 같은 변경을 이미 기록했다면, func 안의 확인 과정에서 건너뛰게 됩니다.
+    - 반환값: func의 반환값, 시간 안에 잠금을 얻지 못하면 이번 기록을 건너뛰고 True
+    """
+    if not flag_commit_lock_enabled:
+        return func(*args)
+    os.makedirs(log_dir, exist_ok=True)
+    lock = filelock.FileLock(os.path.join(log_dir, 'log.lock'), timeout=COMMIT_LOCK_TIMEOUT)
+    acquired = lock.acquire()
+    timing.mark("lock")
+    if not acquired:
+        timing.note(lock_timeout=True)
+        print(f"⏳ 다른 프로세스가 변경 이력을 기록 중이어서 이번 기록은 건너뜁니다. (다음 실행에서 기록됩니다)")
+        return True
+    try:
+        return func(*args)
+    finally:
+        lock.release()
+
+def _is_unchanged_without_lock(log_dir: str, targets: List[tuple]) -> bool:
+    """
+    잠금 없이 stat()만으로 모든 대상 파일이 마지막 기록 이후 바뀌지 않았는지 확인합니다.
+    - targets: (log.meta의 파일 이름, 파일 경로) 튜플 목록
+    """
+    if not flag_stat_fast_path_enabled:
+        return False
+    files_meta = read_log_meta(os.path.join(log_dir, 'log.meta')).get("files", {})
+    try:
+        return all(is_unchanged_by_stat(files_meta.get(file_key), os.stat(path)) is True
+                   for file_key, path in targets)
+    except OSError:
+        return False
+
+@timing.timed("log_code_changes")
 def log_code_changes(target_file: str, project_root: str) -> bool:
     """
     파일의 변경사항을 이전 버전과 비교(diff)하여, 그 차이점을 암호화하고 로그 파일에 기록합니다.
     - target_file: 변경을 추적할 대상 파일 경로 (e.g., 'main.py')
     - project_root: 프로젝트의 최상위 폴더 경로
     - 반환값: 성공 시 True, 실패 시 False
+    변경이 없으면 잠금 없이 바로 반환하고, 변경이 있을 때만 잠금을 얻어 기록합니다.
+    """
+    log_dir = os.path.join(project_root, 'log')
+    unchanged = _is_unchanged_without_lock(log_dir, [(os.path.basename(target_file), target_file)])
+    timing.mark("stat_check")
+    if unchanged:
+        timing.note(unchanged=True)
+        return True
+    return commit_with_lock(log_dir, _log_code_changes, target_file, project_root)
+
+@timing.timed("log_tracked_changes")
+def log_tracked_changes(target_files: List[str], project_root: str, base_dir: str) -> bool:
+    """
+    여러 파일의 변경사항을 한 번에 확인하여, 바뀐 파일들의 항목을 하나의 암호화된 레코드로 기록합니다.
+    - target_files: 추적할 파일 경로 목록
+    - project_root: 로그 폴더('log')가 위치한 폴더 경로
+    - base_dir: 로그에 기록할 파일 이름의 기준 폴더 (pyproject.toml이 있는 폴더)
+    - 반환값: 성공 시 True, 실패 시 False
+    변경이 없으면 잠금 없이 바로 반환하고, 변경이 있을 때만 잠금을 얻어 기록합니다.
+    """
+    log_dir = os.path.join(project_root, 'log')
+    targets = [(os.path.relpath(path, base_dir).replace(os.sep, '/'), path) for path in target_files]
+    unchanged = _is_unchanged_without_lock(log_dir, targets)
+    timing.mark("stat_check")
+    if unchanged:
+        timing.note(unchanged=True)
+        return True
+    return commit_with_lock(log_dir, _log_tracked_changes, target_files, project_root, base_dir)
+
+def _log_code_changes(target_file: str, project_root: str) -> bool:
+    """
+    [기록 잠금 안에서 실행] 파일의 변경사항을 이전 버전과 비교(diff)하여, 그 차이점을 암호화하고 로그 파일에 기록합니다.
+    - target_file: 변경을 추적할 대상 파일 경로 (e.g., 'main.py')
+    - project_root: 프로젝트의 최상위 폴더 경로
+    - 반환값: 성공 시 True, 실패 시 False
     """
     try:
         # 로그 파일과 백업 파일을 저장할 'log' 디렉토리의 경로를 설정합니다.
@@ -135,6 +583,23 @@ def log_code_changes(target_file: str, project_root: str) -> bool:
         plain_log_file = os.path.join(log_dir, 'log.plain')
         # 현재 버전의 main.py와 비교하기 위한 직전 버전의 원본(평문)을 저장하는 임시 파일입니다.
         backup_file = os.path.join(log_dir, 'log.temp') 
+        # keyframe 주기, 마지막 기록 버전의 크기/수정 시각/해시 등 로그 상태 정보를 저장하는 메타데이터 파일입니다.
+        meta_file = os.path.join(log_dir, 'log.meta')
+        log_meta = read_log_meta(meta_file)
+        file_key = os.path.basename(target_file)
+        # 추가 전용 저장소 모드에서 직전 버전을 보관하는 파일입니다. (log.temp 대신 사용)
+        store_file = os.path.join(log_dir, 'log.store')
+        # 이번 커밋의 항목이 기록될 로그 파일입니다.
+        active_log_file = plain_log_file if flag_plain_log_enabled else encrypted_log_file
+
+        # [변경 없음 빠른 확인]
+        # 파일을 읽기 전에 stat()으로 크기와 수정 시각만 확인합니다. 마지막 기록 때와 같다면
+        # main.py와 log.temp를 전혀 읽지 않고 바로 성공(True)을 반환합니다.
+        # stat은 파일을 읽기 '전에' 구해야, 그 사이에 파일이 바뀌더라도 다음 실행에서 놓치지 않습니다.
+        target_stat = os.stat(target_file)
+        if flag_stat_fast_path_enabled:
+            if is_unchanged_by_stat(log_meta.get("files", {}).get(file_key), target_stat) is True:
+                return True
         
         # 'log' 디렉토리가 없으면 생성합니다. exist_ok=True 옵션은 폴더가 이미 있어도 오류를 내지 않습니다.
         os.makedirs(log_dir, exist_ok=True)
@@ -144,20 +609,44 @@ def log_code_changes(target_file: str, project_root: str) -> bool:
         
         # 추적 대상 파일(main.py)의 현재 내용을 읽어옵니다. 파일 읽기 실패 시 None이 반환됩니다.
         current_content_str = read_file_content(target_file)
+        timing.mark("read")
         # 안전장치: 파일 읽기에 실패했다면, 즉시 False를 반환하여 로깅을 중단합니다.
         if current_content_str is None: return False
         
         # [수정 사항] Pylance에게 이 변수가 str임을 명확히 알려줍니다.
         # 또한, 만약의 경우 bytes가 들어오면 즉시 오류를 발생시키는 안전장치 역할도 합니다.
         assert isinstance(current_content_str, str)
+
+        # 현재 내용의 해시입니다. 수정 시각을 믿을 수 없거나 수정 시각만 바뀐 경우(e.g., touch)에는
+        # 백업 파일을 읽지 않고 해시만으로 변경 여부를 확인합니다.
+        current_digest = content_digest(current_content_str)
+        timing.note(bytes_read=target_stat.st_size)
+        timing.mark("digest")
+        files_meta = log_meta.setdefault("files", {})
+        has_baseline = os.path.exists(store_file if flag_append_store_enabled else backup_file)
+        if (flag_stat_fast_path_enabled and has_baseline
+                and files_meta.get(file_key, {}).get("sha256") == current_digest):
+            files_meta[file_key] = make_file_record(target_stat, current_digest)
+            write_log_meta(meta_file, log_meta)
+            return True
         
         # 파일 내용을 줄바꿈 단위로 나누어 리스트로 만듭니다.
         # keepends=True 옵션은 각 줄의 끝에 있는 줄바꿈 문자(\n)를 그대로 유지해줍니다.
-        # 이는 difflib이 변경사항을 정확하게 비교하는 데 매우 중요합니다.
+        # 이는 diff가 변경사항을 정확하게 비교하는 데 매우 중요합니다.
         current_content_lines = current_content_str.splitlines(keepends=True)
+        timing.mark("splitlines")
 
         # 백업 파일이 존재하지 않는다면, 이번이 첫 번째 커밋(기록)이라는 의미입니다.
         is_first_commit = not os.path.exists(backup_file)
+        # 추가 전용 저장소 모드에서는 저장소에서 직전 버전을 꺼냅니다. (저장소를 열면서 복구 검사를 수행합니다)
+        baseline_store = open_baseline_store(log_dir, active_log_file)
+        if baseline_store is not None:
+            backup_content_str = baseline_store.get(file_key)
+            # 저장소를 처음 사용하는 경우에는, 기존 log.temp를 직전 버전으로 이어받습니다.
+            if backup_content_str is None and baseline_store.log_size is None and os.path.exists(backup_file):
+                backup_content_str = read_file_content(backup_file)
+            is_first_commit = backup_content_str is None
+        timing.mark("baseline_open")
 
         if is_first_commit:
             # 첫 커밋이므로, 변경사항(diff)이 아닌 파일 전체 내용을 로그에 기록합니다.
@@ -167,79 +656,237 @@ def log_code_changes(target_file: str, project_root: str) -> bool:
                 f"{current_content_str}"
             )
 
+            # 추가 전용 저장소 모드에서 직전 버전을 잃은 경우(복구 검사에서 버려짐)에는 기존 로그를 지우지 않고,
+            # 전체 버전을 이어서 기록하여 로그를 다시 맞춥니다.
+            new_log = (baseline_store is None or not os.path.exists(active_log_file)
+                       or os.path.getsize(active_log_file) == 0)
+            if not new_log:
+                log_entry_text = "\n\n" + log_entry_text
+
             if flag_plain_log_enabled:
                 # 평문 로그 플래그가 True이면, 암호화하지 않고 log.plain 파일에 텍스트 쓰기('w') 모드로 저장합니다.
-                write_file_content(plain_log_file, log_entry_text, 'w')
+                write_file_content(plain_log_file, log_entry_text, 'w' if new_log else 'a')
             else:
                 # 평문 로그 플래그가 False이면, 기존 방식대로 암호화하여 로그를 기록합니다.
-                # 로그 내용을 암호화하기 전에 반드시 바이트(bytes) 형태로 인코딩해야 합니다.
-                encrypted_entry = crypto.encrypt_data(log_entry_text.encode('utf-8'))
+                encrypted_entry = encrypt_log_entry(log_entry_text, encrypted_log_file, new_file=new_log)
+                timing.mark("encrypt")
                 # 암호화 실패 시, 로깅을 중단합니다.
                 if encrypted_entry is None: return False
                 
-                # 암호화된 내용을 로그 파일에 바이너리 쓰기('wb') 모드로 저장합니다.
-                write_file_content(encrypted_log_file, encrypted_entry, 'wb')
+                # 암호화된 내용을 로그 파일에 새로 씁니다. (기존 형식이면 바이너리 쓰기('wb') 모드)
+                append_log_record(encrypted_log_file, encrypted_entry, new_file=new_log)
+                timing.note(bytes_written=len(encrypted_entry))
+            timing.mark("write")
 
-            # 다음 비교를 위해 현재 파일 내용을 백업 파일에 원본 그대로 저장합니다.
-            write_file_content(backup_file, current_content_str, 'w')
+            # 다음 비교를 위해 현재 파일 내용을 백업 파일(또는 저장소)에 원본 그대로 저장합니다.
+            save_baseline(baseline_store, backup_file, active_log_file, {file_key: current_content_str})
+            timing.mark("baseline_write")
+            # 최초 버전은 그 자체로 완전한 스냅샷이므로, keyframe 이후 누적치를 0으로 시작합니다.
+            log_meta.update(deltas_since_keyframe=0, delta_bytes_since_keyframe=0)
+            files_meta[file_key] = make_file_record(target_stat, current_digest)
+            write_log_meta(meta_file, log_meta)
+            timing.note(kind="initial", entry_chars=len(log_entry_text))
+            timing.mark("meta")
         else: # 첫 커밋이 아닌 경우 (백업 파일이 존재하는 경우)
-            # 이전 버전의 내용이 담긴 백업 파일을 읽어옵니다.
-            backup_content_str = read_file_content(backup_file)
+            # 이전 버전의 내용이 담긴 백업 파일을 읽어옵니다. (저장소 모드에서는 이미 꺼내 두었습니다)
+            if baseline_store is None:
+                backup_content_str = read_file_content(backup_file)
             if backup_content_str is None: return False
 
             # [수정 사항] backup_content_str에 대해서도 동일하게 처리합니다.
             assert isinstance(backup_content_str, str)
             
             backup_content_lines = backup_content_str.splitlines(keepends=True)
+            timing.mark("baseline_read")
             
             # 최적화: 만약 이전 버전과 현재 버전의 내용이 완전히 같다면, 아무 작업도 하지 않고 성공(True)을 반환합니다.
+            # 이때 현재 파일의 stat 정보를 기록해 두어, 다음 실행부터는 빠른 확인 경로를 탈 수 있게 합니다.
             if backup_content_lines == current_content_lines:
+                files_meta[file_key] = make_file_record(target_stat, current_digest)
+                write_log_meta(meta_file, log_meta)
                 return True
                 
-            # diff 비교 시 컨텍스트 라인 수를 최대로 설정하여 파일 전체의 차이점을 정확하게 파악합니다.
-            context_lines = len(backup_content_lines) + len(current_content_lines)
-            
-            # difflib.unified_diff를 사용하여 두 파일 버전 간의 차이점을 생성합니다.
-            # 이 결과는 git diff와 유사한 형식의 문자열 리스트로 반환됩니다.
-            diff = list(difflib.unified_diff(
-                backup_content_lines,    # 이전 버전
-                current_content_lines,   # 현재 버전
-                fromfile='previous version',
-                tofile='current version',
-                n=context_lines  
-            ))
+            streamed = use_streaming_pipeline(target_stat.st_size)
+            if streamed:
+                # 큰 파일은 로그 항목을 메모리에 만들지 않고, diff 줄을 만들어지는 대로 로그 파일에 기록합니다.
+                result = pipeline.write_change_entry(
+                    plain_log_file if flag_plain_log_enabled else encrypted_log_file,
+                    f"\n\n🦊=== Code changes at {timestamp} ===\n",
+                    backup_content_lines, current_content_lines,
+                    encrypt=not flag_plain_log_enabled, algorithm=DIFF_ALGORITHM,
+                    compression=COMPRESSION_CODEC if flag_compression_enabled else None, level=COMPRESSION_LEVEL,
+                    previous_versions={file_key: backup_content_str} if flag_compression_dictionary_enabled else None)
+                if result is None: return False
+                diff = result["changed"]
+                timing.note(kind="change", streamed=True, entry_chars=result["chars"],
+                            bytes_written=result["bytes_written"])
+                timing.mark("write")
+            else:
+                # 변경 내용을 설정된 방식(압축 로그 모드 또는 전체 문맥 diff)으로 로그 항목으로 만듭니다.
+                log_entry_text, diff = make_change_entry(
+                    backup_content_lines, current_content_lines, current_content_str,
+                    timestamp, os.path.basename(target_file), log_meta)
+                timing.note(kind="change", entry_chars=len(log_entry_text))
+                timing.mark("diff")
             
             # 변경사항이 실제로 존재할 경우에만 로그를 기록합니다.
             if diff:
-                # [안정성 강화]
-                # diff 리스트의 각 항목(라인)에서 혹시 모를 기존 줄바꿈 문자를 모두 제거한 후,
-                # 파이썬의 표준 줄바꿈(\n)으로 다시 합쳐서 한 줄로 붙는 현상을 원천 차단합니다.
-                diff_content = "\n".join(line.rstrip('\r\n') for line in diff)
-
-                # 변경사항(diff)을 포함한 로그 엔트리를 구성합니다.
-                log_entry_text = (
-                    f"\n\n🦊=== Code changes at {timestamp} ===\n"
-                    f"{diff_content}"
-                )
-                
-                if flag_plain_log_enabled:
-                    # 평문 로그 플래그가 True이면, 암호화하지 않고 log.plain 파일에 텍스트 추가('a') 모드를 사용합니다.
-                    write_file_content(plain_log_file, log_entry_text, 'a')
-                else:
-                    # 평문 로그 플래그가 False이면, 기존 방식대로 암호화하여 로그를 기록합니다.
-                    # 암호화를 위해 인코딩 후 암호화 함수를 호출합니다.
-                    encrypted_entry = crypto.encrypt_data(log_entry_text.encode('utf-8'))
-                    if encrypted_entry is None: return False
+                # 스트리밍 기록은 이미 로그 파일에 기록되었습니다.
+                if not streamed:
+                    if flag_plain_log_enabled:
+                        # 평문 로그 플래그가 True이면, 암호화하지 않고 log.plain 파일에 텍스트 추가('a') 모드를 사용합니다.
+                        write_file_content(plain_log_file, log_entry_text, 'a')
+                    else:
+                        # 평문 로그 플래그가 False이면, 기존 방식대로 암호화하여 로그를 기록합니다.
+                        # 암호화를 위해 인코딩 후 암호화 함수를 호출합니다.
+                        encrypted_entry = encrypt_log_entry(log_entry_text, encrypted_log_file,
+                                                            previous_versions={file_key: backup_content_str})
+                        timing.mark("encrypt")
+                        if encrypted_entry is None: return False
                     
-                    # 기존 로그 파일에 이어서 새로운 내용을 추가하기 위해 바이너리 추가('ab') 모드를 사용합니다.
-                    write_file_content(encrypted_log_file, encrypted_entry, 'ab')
+                        # 기존 로그 파일에 이어서 새로운 내용을 추가합니다. (기존 형식이면 바이너리 추가('ab') 모드)
+                        append_log_record(encrypted_log_file, encrypted_entry)
+                        timing.note(bytes_written=len(encrypted_entry))
+                    timing.mark("write")
 
                 # 다음 커밋을 위해, 백업 파일을 현재 파일 내용으로 덮어쓰기('w')하여 업데이트합니다.
-                write_file_content(backup_file, current_content_str, 'w')
+                # (저장소 모드에서는 바뀐 부분만 저장소 끝에 추가합니다)
+                save_baseline(baseline_store, backup_file, active_log_file, {file_key: current_content_str})
+                timing.mark("baseline_write")
+                # 마지막 기록 버전의 정보와 (압축 로그 모드의) keyframe 누적치를 갱신합니다.
+                files_meta[file_key] = make_file_record(target_stat, current_digest)
+                write_log_meta(meta_file, log_meta)
+                timing.mark("meta")
                 
         # 모든 과정이 성공적으로 완료되면 True를 반환합니다.
         return True
     # 로깅 과정에서 예상치 못한 오류가 발생할 경우를 대비한 최종 예외 처리입니다.
     except Exception as e:
         print(f"🚫 변경사항 기록 중 예상치 못한 오류 발생: {e}")
-        return False
\ No newline at end of file
+        return False
+
+def _log_tracked_changes(target_files: List[str], project_root: str, base_dir: str) -> bool:
+    """
+    [기록 잠금 안에서 실행] 여러 파일의 변경사항을 한 번에 확인하여, 바뀐 파일들의 항목을 하나의 암호화된 레코드로 기록합니다.
+    - target_files: 추적할 파일 경로 목록
+    - project_root: 로그 폴더('log')가 위치한 폴더 경로
+    - base_dir: 로그에 기록할 파일 이름의 기준 폴더 (pyproject.toml이 있는 폴더)
+    - 반환값: 성공 시 True, 실패 시 False
+    각 파일의 직전 버전은 'log/tracked/' 아래에 같은 상대 경로로 저장되며,
+    stat()으로 바뀌지 않은 것이 확실한 파일은 읽지 않고, 나머지 파일만 동시에 읽어 해시로 비교합니다.
+    """
+    try:
+        log_dir = os.path.join(project_root, 'log')
+        encrypted_log_file = os.path.join(log_dir, 'log.encrypted')
+        plain_log_file = os.path.join(log_dir, 'log.plain')
+        # 파일별 직전 버전(평문)을 저장하는 폴더입니다.
+        backup_dir = os.path.join(log_dir, 'tracked')
+        meta_file = os.path.join(log_dir, 'log.meta')
+        log_meta = read_log_meta(meta_file)
+        files_meta = log_meta.setdefault("files", {})
+        # 압축 로그 모드의 keyframe 누적치는 파일마다 따로 관리합니다.
+        keyframes_meta = log_meta.setdefault("keyframes", {})
+
+        # [변경 없음 빠른 확인] stat()만으로 바뀌지 않은 것이 확실한 파일은 건너뜁니다.
+        candidates = []
+        for path in target_files:
+            file_key = os.path.relpath(path, base_dir).replace(os.sep, '/')
+            target_stat = os.stat(path)
+            if flag_stat_fast_path_enabled and is_unchanged_by_stat(files_meta.get(file_key), target_stat) is True:
+                continue
+            candidates.append((file_key, path, target_stat))
+        timing.mark("stat")
+        if not candidates:
+            return True
+
+        os.makedirs(log_dir, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        active_log_file = plain_log_file if flag_plain_log_enabled else encrypted_log_file
+        # 추가 전용 저장소 모드이면, 파일별 직전 버전을 'log/tracked/' 대신 저장소에서 꺼냅니다.
+        baseline_store = open_baseline_store(log_dir, active_log_file)
+        log_exists = os.path.exists(active_log_file)
+        timing.mark("baseline_open")
+        contents = read_and_digest_files([path for _, path, _ in candidates])
+        timing.note(files_read=len(candidates), bytes_read=sum(file_stat.st_size for _, _, file_stat in candidates))
+        timing.mark("read")
+
+        # 남은 파일들은 동시에 읽어 해시를 구한 뒤, 해시가 달라진 파일만 diff를 만듭니다.
+        entries = []
+        changed = []
+        # 바뀐 파일들의 직전 버전입니다. (압축 기록 모드에서 압축 사전으로 사용합니다)
+        previous_versions = {}
+        for (file_key, path, target_stat), (current_content_str, current_digest) in zip(
+                candidates, contents):
+            if current_content_str is None: return False
+            backup_file = os.path.join(backup_dir, *file_key.split('/'))
+            if baseline_store is not None:
+                backup_content_str = baseline_store.get(file_key)
+                has_backup = backup_content_str is not None
+            else:
+                has_backup = os.path.exists(backup_file)
+            if has_backup and files_meta.get(file_key, {}).get("sha256") == current_digest:
+                files_meta[file_key] = make_file_record(target_stat, current_digest)
+                continue
+
+            # 레코드 안의 항목들은 빈 줄 두 개로 구분됩니다. (로그의 맨 처음 항목만 구분자 없이 시작합니다)
+            separator = "\n\n" if (entries or log_exists) else ""
+            current_content_lines = current_content_str.splitlines(keepends=True)
+            if not has_backup:
+                log_entry_text = (
+                    f"{separator}🦊=== Code Change Tracking Started at {timestamp} ===\n"
+                    f"🦊=== Initial version of {file_key} ===\n\n"
+                    f"{current_content_str}"
+                )
+                keyframes_meta[file_key] = {"deltas_since_keyframe": 0, "delta_bytes_since_keyframe": 0}
+            else:
+                if baseline_store is None:
+                    backup_content_str = read_file_content(backup_file)
+                if backup_content_str is None: return False
+                backup_content_lines = backup_content_str.splitlines(keepends=True)
+                if backup_content_lines == current_content_lines:
+                    files_meta[file_key] = make_file_record(target_stat, current_digest)
+                    continue
+                log_entry_text, diff = make_change_entry(
+                    backup_content_lines, current_content_lines, current_content_str,
+                    timestamp, file_key, keyframes_meta.setdefault(file_key, {}), name_in_header=True)
+                if not diff:
+                    continue
+                log_entry_text = separator + log_entry_text[2:]
+                previous_versions[file_key] = backup_content_str
+
+            entries.append(log_entry_text)
+            changed.append((file_key, backup_file, current_content_str, target_stat, current_digest))
+
+        timing.mark("diff")
+        # 바뀐 모든 파일의 항목을 하나의 레코드로 기록합니다. (암호화도 한 번만 수행됩니다)
+        if entries:
+            batch_text = "".join(entries)
+            timing.note(files_changed=len(changed), entry_chars=len(batch_text))
+            if flag_plain_log_enabled:
+                write_file_content(plain_log_file, batch_text, 'a')
+            else:
+                encrypted_entry = encrypt_log_entry(batch_text, encrypted_log_file, new_file=not log_exists,
+                                                    previous_versions=previous_versions)
+                timing.mark("encrypt")
+                if encrypted_entry is None: return False
+                append_log_record(encrypted_log_file, encrypted_entry, new_file=not log_exists)
+                timing.note(bytes_written=len(encrypted_entry))
+            timing.mark("write")
+
+            if baseline_store is not None:
+                # 바뀐 모든 파일의 직전 버전을 저장소 레코드 하나로 함께 기록합니다.
+                save_baseline(baseline_store, "", active_log_file,
+                              {file_key: content for file_key, _, content, _, _ in changed})
+            for file_key, backup_file, current_content_str, target_stat, current_digest in changed:
+                if baseline_store is None:
+                    os.makedirs(os.path.dirname(backup_file), exist_ok=True)
+                    write_file_content(backup_file, current_content_str, 'w')
+                files_meta[file_key] = make_file_record(target_stat, current_digest)
+            timing.mark("baseline_write")
+
+        write_log_meta(meta_file, log_meta)
+        timing.mark("meta")
+        return True
+    except Exception as e:
+        print(f"🚫 변경사항 기록 중 예상치 못한 오류 발생: {e}")
+        return False
@@ -0,0 +1,238 @@
+# =================================================================================
+#   수정 금지 안내 (Do NOT modify)
+# ---------------------------------------------------------------------------------
+# - 이 파일을 절대로 수정하지 마세요.
+#   수정 시, 개발 과정에 대한 평가 점수가 0점 처리됩니다.
+# - Do NOT modify this file.
+#   If modified, you will receive a ZERO for the development process evaluation.
+# =================================================================================
+
+# ==============================================================================
+# Watch Mode (v1.0)
+# ------------------------------------------------------------------------------
+# 추적 대상 파일(main.py, 또는 pyproject.toml에 설정된 파일들)을 저장할 때마다 변경 이력을 기록하는 모듈입니다.
+#
+# 평소에는 mission_python.util이 import 될 때만 변경이 기록되므로, 실행과 실행 사이의 여러 수정이
+# 하나의 diff로 합쳐집니다. watch 모드를 켜 두면 저장할 때마다 기록되어 더 세밀한 이력이 남고,
+# 실행할 때는 이미 기록된 상태이므로 빠른 확인 경로(stat)만 거치게 됩니다.
+#
+# [동작 방식] 표준 라이브러리만 사용하는 폴링(polling) 방식
+# - 일정 간격으로 파일의 stat 정보(크기, 수정 시각)만 확인합니다. (파일 내용은 읽지 않습니다)
+# - debounce: 연속된 저장(e.g., 편집기의 자동 저장)이 멈춘 뒤 이 시간이 지나면 한 번만 기록합니다.
+# - max_delay: 저장이 계속 이어지더라도, 첫 변경 후 이 시간이 지나면 모아서 한 번 기록합니다. (coalesce)
+# - 한동안 변경이 없으면 확인 간격을 점점 늘려(최대 max_interval), 유휴 상태의 CPU 사용량을 줄입니다.
+#   사용한 CPU 시간과 확인 횟수는 stats로 측정할 수 있으며, 종료 시 출력됩니다.
+#
+# 실행 방법 (프로젝트 root 폴더에서):
+#   poetry run python -m mission_python.util.watch
+#   poetry run mission-python-watch
+# ==============================================================================
+
+import os
+import sys
+import time
+import argparse
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from . import utility
+
+# 기본 확인 간격(초)입니다.
+WATCH_POLL_INTERVAL = 0.5
+# 변경이 없을 때 늘어나는 확인 간격의 최댓값(초)입니다.
+WATCH_MAX_POLL_INTERVAL = 2.0
+# 마지막 저장 후 이 시간(초) 동안 추가 저장이 없으면 기록합니다.
+WATCH_DEBOUNCE = 1.0
+# 첫 변경 후 이 시간(초)이 지나면, 저장이 계속되더라도 기록합니다.
+WATCH_MAX_DELAY = 10.0
+# 추적 대상 파일 목록(glob 패턴)을 다시 확인하는 간격(초)입니다. (새로 만든 파일을 찾기 위함)
+WATCH_RESCAN_INTERVAL = 5.0
+# 이 횟수만큼 연속으로 변경이 없으면 확인 간격을 두 배로 늘립니다.
+WATCH_IDLE_POLLS_BEFORE_BACKOFF = 10
+
+
+class Watcher:
+    """
+    추적 대상 파일의 stat 정보를 주기적으로 확인하여, 변경이 멈추면 기록 함수를 호출합니다.
+    - list_targets: 추적할 파일 경로 목록을 반환하는 함수
+    - commit: 변경을 기록하는 함수 (성공 시 True)
+    나머지 인자는 모듈 상단의 WATCH_* 설정값과 같은 의미입니다.
+    """
+
+    def __init__(self, list_targets: Callable[[], List[str]], commit: Callable[[], bool],
+                 poll_interval: float = WATCH_POLL_INTERVAL,
+                 max_interval: float = WATCH_MAX_POLL_INTERVAL,
+                 debounce: float = WATCH_DEBOUNCE,
+                 max_delay: float = WATCH_MAX_DELAY,
+                 rescan_interval: float = WATCH_RESCAN_INTERVAL):
+        self.list_targets = list_targets
+        self.commit = commit
+        self.poll_interval = poll_interval
+        self.max_interval = max(max_interval, poll_interval)
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.rescan_interval = rescan_interval
+
+        self._targets: List[str] = []
+        self._last_scan = None
+        self._snapshot: Dict[str, Optional[tuple]] = {}
+        # 기록을 기다리고 있는 변경의 첫 시각과 마지막 시각입니다. (없으면 None)
+        self._first_change = None
+        self._last_change = None
+        self._idle_polls = 0
+        self.interval = poll_interval
+        # 측정값: 확인 횟수, stat 호출 수, 감지한 변경 수, 기록 횟수, 사용한 CPU 시간 등
+        self.stats = {"polls": 0, "stat_calls": 0, "changes": 0, "commits": 0,
+                      "failed_commits": 0, "cpu_seconds": 0.0, "wall_seconds": 0.0}
+
+    def _stat_all(self) -> Dict[str, Optional[tuple]]:
+        """ 모든 추적 대상 파일의 (크기, 수정 시각)을 구합니다. 파일이 없으면 None입니다. """
+        snapshot = {}
+        for path in self._targets:
+            try:
+                file_stat = os.stat(path)
+                snapshot[path] = (file_stat.st_size, file_stat.st_mtime_ns)
+            except OSError:
+                snapshot[path] = None
+        self.stats["stat_calls"] += len(self._targets)
+        return snapshot
+
+    def poll_once(self, now: Optional[float] = None) -> bool:
+        """
+        추적 대상 파일을 한 번 확인하고, 기록할 때가 되었으면 기록합니다.
+        - now: 현재 시각 (time.monotonic() 기준, 테스트에서 시각을 지정할 때 사용)
+        - 반환값: 이번 확인에서 기록했으면 True
+        """
+        now = time.monotonic() if now is None else now
+        self.stats["polls"] += 1
+        if self._last_scan is None or now - self._last_scan >= self.rescan_interval:
+            self._targets = self.list_targets()
+            self._last_scan = now
+
+        snapshot = self._stat_all()
+        if snapshot != self._snapshot:
+            # 처음 확인할 때의 상태는 기준으로만 삼습니다. (시작 직후의 기록은 import 시 이미 수행됨)
+            if self._snapshot:
+                self.stats["changes"] += 1
+                if self._first_change is None:
+                    self._first_change = now
+                self._last_change = now
+            self._snapshot = snapshot
+            self._idle_polls = 0
+            self.interval = self.poll_interval
+        elif self._first_change is None:
+            # 변경이 없는 상태가 이어지면 확인 간격을 점점 늘립니다.
+            self._idle_polls += 1
+            if self._idle_polls >= WATCH_IDLE_POLLS_BEFORE_BACKOFF:
+                self._idle_polls = 0
+                self.interval = min(self.interval * 2, self.max_interval)
+
+        if self._first_change is None:
+            return False
+        if now - self._last_change < self.debounce and now - self._first_change < self.max_delay:
+            return False
+
+        self._first_change = self._last_change = None
+        if self.commit():
+            self.stats["commits"] += 1
+        else:
+            self.stats["failed_commits"] += 1
+        return True
+
+    def run(self, stop_event: Optional[threading.Event] = None, duration: Optional[float] = None):
+        """
+        stop_event가 설정되거나 duration(초)이 지날 때까지 확인을 반복합니다.
+        사용한 CPU 시간과 경과 시간은 stats에 누적됩니다.
+        """
+        stop_event = stop_event or threading.Event()
+        started = time.monotonic()
+        cpu_started = time.process_time()
+        try:
+            while not stop_event.is_set():
+                self.poll_once()
+                if duration is not None and time.monotonic() - started >= duration:
+                    break
+                # 기록을 기다리는 변경이 있으면, debounce 시간을 놓치지 않도록 기본 간격으로 확인합니다.
+                wait = self.poll_interval if self._first_change is not None else self.interval
+                stop_event.wait(wait)
+        finally:
+            # 종료하기 전에 아직 기록하지 않은 변경이 있으면 마저 기록합니다.
+            if self._first_change is not None:
+                self._first_change = self._last_change = None
+                if self.commit():
+                    self.stats["commits"] += 1
+                else:
+                    self.stats["failed_commits"] += 1
+            self.stats["wall_seconds"] += time.monotonic() - started
+            self.stats["cpu_seconds"] += time.process_time() - cpu_started
+
+    def cpu_percent(self) -> float:
+        """ 실행 시간 대비 사용한 CPU 시간의 비율(%)입니다. """
+        if not self.stats["wall_seconds"]:
+            return 0.0
+        return 100.0 * self.stats["cpu_seconds"] / self.stats["wall_seconds"]
+
+
+def _default_project_root() -> str:
+    """ commit_changes()와 같은 방식으로 프로젝트 폴더(main.py가 있는 폴더)를 구합니다. """
+    return os.path.dirname(os.path.dirname(os.path.abspath(utility.__file__)))
+
+
+def make_project_watcher(project_root: Optional[str] = None, **options) -> Watcher:
+    """
+    commit_changes()와 같은 추적 대상(main.py 또는 pyproject.toml에 설정된 파일들)을 감시하는 Watcher를 만듭니다.
+    """
+    project_root = project_root or _default_project_root()
+    log_dir = os.path.join(project_root, 'log')
+    main_py_file = os.path.join(project_root, 'main.py')
+
+    def list_targets() -> List[str]:
+        track_config = utility.find_track_config(project_root)
+        if track_config is None:
+            return [main_py_file]
+        base_dir, patterns = track_config
+        return utility.expand_tracked_files(base_dir, patterns, exclude_dir=log_dir)
+
+    def commit() -> bool:
+        track_config = utility.find_track_config(project_root)
+        if track_config is None:
+            succeeded = utility.log_code_changes(main_py_file, project_root)
+        else:
+            base_dir, patterns = track_config
+            files = utility.expand_tracked_files(base_dir, patterns, exclude_dir=log_dir)
+            succeeded = utility.log_tracked_changes(files, project_root, base_dir)
+        if succeeded:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            print(f"🦊 Code changes successfully logged at {timestamp} ...")
+        else:
+            print(f"🚫 코드 변경사항 기록에 실패했습니다.", file=sys.stderr)
+        return succeeded
+
+    return Watcher(list_targets, commit, **options)
+
+
+def main(argv: Optional[List[str]] = None):
+    """ watch 모드의 명령행 진입점입니다. Ctrl+C로 종료하면 측정값을 출력합니다. """
+    parser = argparse.ArgumentParser(description="저장할 때마다 코드 변경 이력을 기록합니다.")
+    parser.add_argument("--interval", type=float, default=WATCH_POLL_INTERVAL, help="확인 간격(초)")
+    parser.add_argument("--max-interval", type=float, default=WATCH_MAX_POLL_INTERVAL, help="유휴 시 최대 확인 간격(초)")
+    parser.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE, help="저장이 멈춘 뒤 기록까지 기다릴 시간(초)")
+    parser.add_argument("--max-delay", type=float, default=WATCH_MAX_DELAY, help="첫 변경 후 최대 대기 시간(초)")
+    parser.add_argument("--duration", type=float, default=None, help="이 시간(초)이 지나면 종료 (측정용)")
+    args = parser.parse_args(argv)
+
+    watcher = make_project_watcher(poll_interval=args.interval, max_interval=args.max_interval,
+                                   debounce=args.debounce, max_delay=args.max_delay)
+    print(f"🦊 Watching for changes ... (Ctrl+C로 종료)")
+    try:
+        watcher.run(duration=args.duration)
+    except KeyboardInterrupt:
+        pass
+    stats = watcher.stats
+    print(f"\n🦊 Watch finished: {stats['commits']} commits, {stats['polls']} polls, "
+          f"CPU {stats['cpu_seconds']:.3f}s / {stats['wall_seconds']:.1f}s ({watcher.cpu_percent():.2f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# ==============================================================================
+# 여러 테스트 파일에서 함께 사용하는 pytest fixture 모음입니다.
+# ==============================================================================
+
+import pytest
+
+from mission_python.util import crypto
+
+
+@pytest.fixture(scope="session")
+def _generated_private_key():
+    """ 테스트 전용 RSA 키 쌍을 한 번만 생성합니다. (생성에 시간이 조금 걸리기 때문입니다) """
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def private_key(_generated_private_key, monkeypatch):
+    """
+    crypto 모듈이 교수님의 공개키 대신 테스트용 공개키를 사용하도록 바꾸고, 대응되는 개인키를 반환합니다.
+    공개키/세션 캐시도 비워서 이전 테스트의 상태가 남지 않도록 합니다.
+    """
+    from cryptography.hazmat.primitives import serialization
+
+    public_pem = _generated_private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo).decode("utf-8")
+    monkeypatch.setattr(crypto, "PROFESSOR_PUBLIC_KEY", public_pem)
+    monkeypatch.setattr(crypto, "_public_key_cache", None)
+    monkeypatch.setattr(crypto, "_session_cache", None)
+    return _generated_private_key
@@ -0,0 +1,159 @@
+# ==============================================================================
+# aggregate 모듈의 한 번 읽기(single-pass) 집계가 정확한 통계와 같은 결과를 내는지 검증하는 테스트입니다.
+#
+# assets/sample.csv의 학과별/학년별 평균, 분산, 최솟값/최댓값, 등급 히스토그램을 statistics 모듈로 구한 값과 비교하고,
+# 분위수 스케치의 상대 오차, 나누어 집계한 결과의 병합(merge), 행 수와 관계없는 메모리 사용량을 확인합니다.
+#
+# 실행 방법: poetry run pytest tests/test_aggregate.py
+# ==============================================================================
+
+import io
+import json
+import math
+import random
+import statistics
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from mission_python.util import aggregate, csvstream
+
+HEADER = "순번,학과,학년,학번,성명,결석(일),출석점수(10점),기말고사(100점),중간고사(100점),총점,등급"
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[math.floor(q * (len(ordered) - 1))]
+
+
+def test_sample_csv_matches_exact_statistics():
+    aggregator = aggregate.GradeAggregator(group_sets=[("학과",), ("학년",), ()])
+    assert aggregator.consume("assets/sample.csv") == 60
+    summary = aggregator.summary(percentiles=(0.1, 0.5, 0.9))
+    records = list(csvstream.iter_records("assets/sample.csv"))
+
+    for names, groups in summary.items():
+        for key, stats in groups.items():
+            members = [r for r in records if tuple(r[name] for name in names) == key]
+            assert stats["count"] == len(members)
+            assert stats["등급"] == dict(sorted(Counter(r["등급"] for r in members).items()))
+            for column in aggregate.DEFAULT_VALUE_COLUMNS:
+                values = [float(r[column]) for r in members]
+                result = stats[column]
+                assert result["mean"] == pytest.approx(statistics.fmean(values))
+                assert result["variance"] == pytest.approx(statistics.pvariance(values), abs=1e-9)
+                assert (result["min"], result["max"]) == (min(values), max(values))
+                for q in (0.1, 0.5, 0.9):
+                    exact = exact_quantile(values, q)
+                    assert abs(result[f"p{q * 100:g}"] - exact) <= 0.01 * abs(exact) + 1e-9
+    assert set(summary[("학과",)]) >= {("컴퓨터공학부",), ("전자공학과",), ("소프트웨어융합학과",)}
+    assert summary[()][()]["count"] == 60
+
+
+def test_quantile_sketch_accuracy_and_bounds():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(0, 2) for _ in range(20_000)] + [0.0] * 50 + [-rng.random() for _ in range(500)]
+    one_by_one, batched = aggregate.QuantileSketch(), aggregate.QuantileSketch()
+    for value in values:
+        one_by_one.add(value)
+    batched.add_many(values)
+    assert one_by_one.to_dict() == batched.to_dict()
+    for q in (0, 0.01, 0.02, 0.025, 0.1, 0.5, 0.9, 0.99, 1):
+        exact = exact_quantile(values, q)
+        assert abs(batched.quantile(q) - exact) <= 0.01 * abs(exact) + 1e-12
+
+    # 구간 수를 제한하면 가장 작은 값들의 구간만 합쳐지므로, 큰 값 쪽의 분위수는 정확도가 그대로입니다.
+    small = aggregate.QuantileSketch(max_buckets=400)
+    small.add_many(values)
+    assert len(small.positive) == 400 < len(batched.positive) and small.count == len(values)
+    for q in (0.5, 0.9, 0.99):
+        assert small.quantile(q) == pytest.approx(exact_quantile(values, q), rel=0.01)
+    with pytest.raises(ValueError):
+        small.merge(aggregate.QuantileSketch(relative_accuracy=0.05))
+
+
+def test_partial_results_merge_to_single_pass():
+    lines = Path("assets/sample.csv").read_text(encoding="utf-8-sig").splitlines()
+    header, rows = lines[0], lines[1:]
+    parts = [rows[:7], rows[7:40], rows[40:]]
+
+    whole = aggregate.GradeAggregator()
+    whole.consume("assets/sample.csv")
+    merged = aggregate.GradeAggregator()
+    for part in parts:
+        partial = aggregate.GradeAggregator()
+        partial.consume(io.StringIO("\n".join([header] + part) + "\n"))
+        # JSON으로 저장했다가 되돌린 부분 결과도 그대로 합칠 수 있습니다.
+        merged.merge(aggregate.GradeAggregator.from_dict(json.loads(json.dumps(partial.to_dict()))))
+
+    assert merged.rows == whole.rows == 60
+    for names, groups in whole.groups.items():
+        assert set(merged.groups[names]) == set(groups)
+        for key, group in groups.items():
+            other = merged.groups[names][key]
+            assert other.count == group.count and other.grades == group.grades
+            for column, summary in group.columns.items():
+                assert other.columns[column].sketch.to_dict() == summary.sketch.to_dict()
+                assert other.columns[column].stats.mean == pytest.approx(summary.stats.mean)
+                assert other.columns[column].stats.m2 == pytest.approx(summary.stats.m2)
+    with pytest.raises(ValueError):
+        merged.merge(aggregate.GradeAggregator(group_sets=[("학과",)]))
+
+
+def test_files_records_and_bad_values(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"part{index}.csv"
+        path.write_text(f"{HEADER}\n{index},A학과,{index + 1},1,n,0,10.0,{index * 10},,{index * 10 + 0.5},B0\n",
+                        encoding="utf-8")
+        paths.append(str(path))
+    combined = aggregate.aggregate_files(paths, workers=2, group_sets=[()])
+    stats = combined.summary()[()][()]
+    assert stats["count"] == 3 and stats["총점"]["mean"] == pytest.approx(10.5)
+    assert stats["중간고사(100점)"]["missing"] == 3 and stats["중간고사(100점)"]["mean"] is None
+    assert stats["등급"] == {"B0": 3}
+    assert aggregate.aggregate_files(paths, group_sets=[()]).to_dict() == combined.to_dict()
+
+    one = aggregate.GradeAggregator()
+    one.add(dict(zip(HEADER.split(","), "1,A,2,1,n,0,10.0,50,60,70.5,A0".split(","))))
+    assert one.summary()[("학년",)][("2",)]["총점"]["p50"] == 70.5
+    with pytest.raises(KeyError):
+        one.add({"학과": "A"})
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text(f"{HEADER}\n1,A,2,1,n,0,10.0,50,60,70.5,A0\n2,A,2,1,n,0,10.0,x,60,70.5,A0\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="2번째 데이터 행"):
+        aggregate.GradeAggregator().consume(str(bad))
+    # float()가 받아들이는 nan/inf도 행 번호와 함께 잘못된 값으로 처리합니다.
+    for text in ("nan", "-inf", "Infinity"):
+        bad.write_text(f"{HEADER}\n1,A,2,1,n,0,10.0,50,60,70.5,A0\n2,A,2,1,n,0,10.0,50,{text},70.5,A0\n",
+                       encoding="utf-8")
+        with pytest.raises(ValueError, match=f"'중간고사\\(100점\\)' 열의 값 '{text}'.*2번째 데이터 행"):
+            aggregate.GradeAggregator().consume(str(bad))
+
+
+def test_memory_depends_on_groups_not_rows(tmp_path):
+    retained = []
+    for row_count in (10_000, 100_000):
+        path = tmp_path / f"rows_{row_count}.csv"
+        rng = random.Random(row_count)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(HEADER + "\n")
+            for i in range(row_count):
+                score = rng.uniform(0, 100)
+                f.write(f"{i},학과{i % 5},{i % 4 + 1},{i},n,0,10.0,{rng.randrange(101)},{rng.randrange(101)},"
+                        f"{score:.2f},{'ABCDF'[i % 5]}0\n")
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            aggregator = aggregate.GradeAggregator()
+            assert aggregator.consume(str(path)) == row_count
+            retained.append(tracemalloc.get_traced_memory()[0] - base)
+        finally:
+            tracemalloc.stop()
+        assert len(aggregator.groups[("학과",)]) == 5 and len(aggregator.groups[("학년",)]) == 4
+    # 행이 10배 많아져도 남아 있는 메모리는 (그룹 수 x 구간 수) 정도로 거의 같습니다.
+    assert retained[1] < retained[0] * 1.5 + 64 * 1024
+    assert retained[1] < 2 * 1024 * 1024
@@ -0,0 +1,105 @@
+# ==============================================================================
+# codec 모듈의 압축 기록(암호화 전 압축) 동작을 검증하는 테스트입니다.
+#
+# tests/conftest.py의 private_key fixture로 실제 암호화된 로그를 만든 뒤,
+# reader/crypto로 다시 읽어 압축이 풀린 항목이 원래 버전으로 복원되는지 확인합니다.
+#
+# 실행 방법: poetry run pytest tests/test_codec.py
+# ==============================================================================
+
+import pytest
+
+from mission_python.util import codec, crypto, delta, reader, utility
+
+
+def make_versions(line_count=2000, edits=5):
+    """ 큰 파일의 이전 버전과, 몇 줄만 고친 현재 버전을 만듭니다. """
+    old = "".join(f"value_{i} = compute({i}, 'padding text {i * 7}')\n" for i in range(line_count))
+    lines = old.splitlines(keepends=True)
+    for k in range(edits):
+        lines[k * line_count // edits] = f"edited_{k} = True\n"
+    return old, "".join(lines)
+
+
+@pytest.mark.parametrize("codec_name", ["zlib", "lzma"])
+@pytest.mark.parametrize("level", [1, 9])
+def test_round_trip(codec_name, level):
+    old, new = make_versions()
+    data = new.encode("utf-8")
+    packed = codec.compress(data, codec_name, level, {"main.py": old})
+    assert codec.is_compressed(packed) and len(packed) < len(data)
+    envelope = codec.read_envelope(packed)
+    assert (envelope["codec"], envelope["level"]) == (codec_name, level)
+    # lzma는 사전을 지원하지 않으므로 사전 없이 압축됩니다.
+    assert envelope["names"] == (["main.py"] if codec_name == "zlib" else None)
+    assert codec.decompress(packed, {"main.py": old}) == data
+
+
+def test_small_or_incompressible_data_is_kept_as_is():
+    assert codec.compress(b"x = 1") == b"x = 1"
+    assert codec.decompress(b"x = 1") == b"x = 1"
+
+
+def test_previous_version_dictionary_shrinks_records():
+    # zlib의 창 크기(32KB)보다 작은, 일반적인 크기의 파일입니다.
+    old, new = make_versions(300)
+    entry, _ = utility.make_change_entry(old.splitlines(keepends=True), new.splitlines(keepends=True),
+                                         new, "t1", "main.py", {})
+    data = entry.encode("utf-8")
+    plain = codec.compress(data, "zlib", 6)
+    with_dictionary = codec.compress(data, "zlib", 6, {"main.py": old})
+    assert len(with_dictionary) * 3 < len(plain) < len(data)
+
+
+def test_wrong_dictionary_is_detected():
+    old, new = make_versions()
+    packed = codec.compress(new.encode("utf-8"), "zlib", 6, {"main.py": old})
+    with pytest.raises(ValueError):
+        codec.decompress(packed, {"main.py": "extra\n" + old})
+    with pytest.raises(ValueError):
+        codec.decompress(packed, {})
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("codec_name", ["zlib", "lzma"])
+def test_compressed_log_replays(tmp_path, monkeypatch, private_key, compact, codec_name):
+    monkeypatch.setattr(utility, "flag_compression_enabled", True)
+    monkeypatch.setattr(utility, "COMPRESSION_CODEC", codec_name)
+    monkeypatch.setattr(utility, "flag_compact_log_enabled", compact)
+    target = tmp_path / "main.py"
+    old, new = make_versions(500)
+    # 줄바꿈 문자가 섞여 있어도 읽는 쪽에서 같은 사전을 만들 수 있어야 합니다.
+    versions = [old, new.replace("\n", "\r\n", 3), new + "tail = 1\n"]
+    for content in versions:
+        target.write_bytes(content.encode("utf-8"))
+        assert utility.log_code_changes(str(target), str(tmp_path)) is True
+
+    log_file = tmp_path / "log" / "log.encrypted"
+    entries = [entry.decode("utf-8") for entry in reader.iter_log_entries(str(log_file), private_key)]
+    assert len(entries) == 3
+    assert delta.replay(entries) == delta.to_log_lines(versions[-1])
+    records = crypto.decrypt_records(log_file.read_bytes(), private_key)
+    assert [record.decode("utf-8") for record in records] == entries
+
+
+def test_tracked_files_share_one_dictionary(tmp_path, monkeypatch, private_key):
+    monkeypatch.setattr(utility, "flag_compression_enabled", True)
+    monkeypatch.setattr(utility, "flag_session_crypto_enabled", True)
+    package = tmp_path / "pkg"
+    package.mkdir()
+    paths = [package / f"module_{i}.py" for i in range(3)]
+    for i, path in enumerate(paths):
+        path.write_text(make_versions(300)[0].replace("value", f"m{i}"), encoding="utf-8")
+    files = [str(path) for path in paths]
+    assert utility.log_tracked_changes(files, str(package), str(tmp_path)) is True
+    for path in paths[:2]:
+        path.write_text(path.read_text(encoding="utf-8") + "added = 1\n", encoding="utf-8")
+    assert utility.log_tracked_changes(files, str(package), str(tmp_path)) is True
+
+    log_file = package / "log" / "log.encrypted"
+    raw = list(reader.iter_log_entries(str(log_file), private_key, decompress=False))
+    assert codec.read_envelope(raw[1])["names"] == ["pkg/module_0.py", "pkg/module_1.py"]
+    entries = [entry.decode("utf-8") for entry in reader.iter_log_entries(str(log_file), private_key)]
+    versions = delta.replay_files(entries)
+    assert versions["pkg/module_1.py"][-1] == "added = 1"
+    assert versions["pkg/module_2.py"] == delta.to_log_lines(paths[2].read_text(encoding="utf-8"))
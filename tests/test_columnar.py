@@ -0,0 +1,116 @@
+# ==============================================================================
+# columnar 모듈의 열 단위 로더(load_columns)가 타입에 맞는 버퍼로 값을 저장하는지 검증하는 테스트입니다.
+#
+# assets/sample.csv의 스키마 추정, 사전 인코딩, 큰 정수/빈 값 처리, 오류 메시지를 확인하고,
+# tracemalloc으로 문자열 목록(list of str)에 비해 행당 메모리가 10분의 1 정도로 줄어드는지 측정합니다.
+#
+# 실행 방법: poetry run pytest tests/test_columnar.py
+# ==============================================================================
+
+import math
+import tracemalloc
+
+import pytest
+
+from mission_python.util import columnar, csvstream
+
+HEADER = "순번,학과,학년,학번,성명,결석(일),출석점수(10점),기말고사(100점),중간고사(100점),총점,등급"
+
+
+def write_csv(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_sample_csv_schema_and_values():
+    table = columnar.load_columns("assets/sample.csv", backend="array")
+    assert table.schema == columnar.GRADE_SCHEMA
+    assert len(table) == 60
+    assert table["학번"].typecode == "i" and table["총점"].typecode == "d"
+    assert table["학과"].codes.typecode == "B"
+    assert table.row(0) == {
+        "순번": 1, "학과": "컴퓨터공학부", "학년": 3, "학번": 2023000003, "성명": "Anthony Sanchez", "결석(일)": 0,
+        "출석점수(10점)": 10.0, "기말고사(100점)": 39, "중간고사(100점)": 42, "총점": 46.3, "등급": "B+"}
+    rows = list(csvstream.iter_rows("assets/sample.csv"))
+    assert list(table["성명"]) == [row[4] for row in rows]
+    assert list(table["등급"]) == [row[10] for row in rows]
+    assert sum(table["학과"].counts().values()) == 60
+
+
+def test_schema_fields_and_column_growth(tmp_path):
+    lines = ["id,dept,score,name"]
+    lines += [f'{i},"dept, {i % 300}",{"" if i == 5 else i / 2},"name {i}"' for i in range(600)]
+    lines.append(f"{2 ** 40},dept,1.5,last")
+    path = write_csv(tmp_path / "wide.csv", "\n".join(lines) + "\n")
+
+    table = columnar.load_columns(path, schema={"dept": columnar.CATEGORY}, backend="array")
+    assert table.schema == {"id": "int", "dept": "category", "score": "float", "name": "str"}
+    assert table["id"].typecode == "q" and table["id"][-1] == 2 ** 40 and table["id"][599] == 599
+    assert math.isnan(table["score"][5]) and table["score"][6] == 3.0
+    assert table["dept"].codes.typecode == "H" and table["dept"][299] == "dept, 299"
+    assert table["dept"].code_of("dept") == 300
+    assert table["name"][-1] == "last" and table["name"][0] == "name 0"
+
+    projected = columnar.load_columns(path, fields=["name", "id"], schema={"id": columnar.STR}, backend="array")
+    assert projected.names == ["name", "id"] and projected.row(1) == {"name": "name 1", "id": "1"}
+
+
+def test_blank_after_inferred_rows_promotes_int_to_float(tmp_path):
+    # 추정에 쓰인 행들 뒤에 빈 점수가 있어도, 앞쪽에 있을 때와 같이 float 열(빈 값은 nan)로 읽어야 합니다.
+    blank_row = columnar.INFER_ROWS + columnar.LOAD_BATCH_ROWS + 500
+    lines = ["a,b"] + [f"{i},{'' if i == blank_row else i % 100}" for i in range(blank_row + 10)]
+    path = write_csv(tmp_path / "late_blank.csv", "\n".join(lines) + "\n")
+
+    table = columnar.load_columns(path, backend="array")
+    assert table.schema == {"a": "int", "b": "float"} and table["b"].typecode == "d"
+    assert len(table) == blank_row + 10 and math.isnan(table["b"][blank_row])
+    assert table["b"][blank_row - 1] == (blank_row - 1) % 100 and table["b"][-1] == (blank_row + 9) % 100
+
+    # 스키마에 직접 int로 지정한 열은 바꾸지 않습니다.
+    with pytest.raises(ValueError, match=f"{blank_row + 1}번째 데이터 행"):
+        columnar.load_columns(path, schema={"b": columnar.INT}, backend="array")
+
+
+def test_errors(tmp_path):
+    path = write_csv(tmp_path / "bad.csv", "id,score\n1,2.5\n2,x\n")
+    with pytest.raises(ValueError, match="2번째 데이터 행"):
+        columnar.load_columns(path, schema={"score": columnar.FLOAT}, backend="array")
+    with pytest.raises(ValueError, match="지원하지 않는 열 타입"):
+        columnar.load_columns(path, schema={"score": "decimal"})
+    with pytest.raises(csvstream.CsvFormatError):
+        columnar.load_columns(write_csv(tmp_path / "short.csv", "a,b\n1,2\n3\n"), backend="array")
+    with pytest.raises(KeyError):
+        columnar.load_columns(path, fields=["등급"])
+
+
+def test_numpy_backend():
+    numpy = pytest.importorskip("numpy")
+    table = columnar.load_columns("assets/sample.csv", backend="numpy")
+    assert isinstance(table["총점"], numpy.ndarray) and table["학번"].dtype == numpy.int32
+    assert table.row(0)["학번"] == 2023000003 and table["학과"][0] == "컴퓨터공학부"
+
+
+def test_memory_per_row_is_an_order_of_magnitude_smaller(tmp_path):
+    path = tmp_path / "grades.csv"
+    row_count = 20_000
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(HEADER + "\n")
+        for i in range(row_count):
+            f.write(f'{i + 1},{["컴퓨터공학부", "전자공학과", "소프트웨어융합학과"][i % 3]},{i % 4 + 1},'
+                    f'{2023000000 + i},"Student, {i}",{i % 5},10.0,{i % 101},{i * 7 % 101},{i % 97 + 0.25},'
+                    f'{["A+", "B0", "C+", "F"][i % 4]}\n')
+
+    def retained(function):
+        tracemalloc.start()
+        try:
+            result = function()
+            return result, tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    rows, list_bytes = retained(lambda: list(csvstream.iter_rows(str(path))))
+    table, table_bytes = retained(lambda: columnar.load_columns(str(path), backend="array"))
+    assert len(table) == len(rows) == row_count
+    assert table.schema == columnar.GRADE_SCHEMA
+    # 행당 약 700바이트(문자열 목록) -> 약 65바이트(열 버퍼)
+    assert table_bytes * 8 < list_bytes
@@ -0,0 +1,82 @@
+# ==============================================================================
+# container 모듈의 로그 컨테이너 형식(프레임 + 인덱스)을 검증하는 테스트입니다.
+#
+# 프레임 자체의 동작은 암호화와 무관하므로 임의의 바이트를 payload로 사용하고,
+# 기존 형식과의 호환 여부는 tests/conftest.py의 private_key fixture로 실제 복호화하여 확인합니다.
+#
+# 실행 방법: poetry run pytest tests/test_container.py
+# ==============================================================================
+
+import os
+
+import pytest
+
+from mission_python.util import container, crypto, utility
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """ 임의의 payload 200개가 기록된 컨테이너 로그 파일 경로를 반환합니다. """
+    path = str(tmp_path / "log.encrypted")
+    for i in range(200):
+        container.append_frame(path, f"payload {i}".encode() * (i % 7 + 1), timestamp_ms=1000 + i)
+    return path
+
+
+def test_read_any_frame_through_index(log_file):
+    assert container.frame_count(log_file) == 200
+    frame = container.read_frame(log_file, 123)
+    assert frame["seq"] == 123
+    assert frame["timestamp_ms"] == 1123
+    assert frame["payload"] == b"payload 123" * (123 % 7 + 1)
+    assert container.read_frame(log_file, -1)["payload"] == b"payload 199" * (199 % 7 + 1)
+    with pytest.raises(IndexError):
+        container.read_frame(log_file, 200)
+
+
+def test_missing_or_stale_index_is_rebuilt(log_file):
+    os.remove(container.index_path(log_file))
+    assert container.read_frame(log_file, 50)["payload"] == b"payload 50" * (50 % 7 + 1)
+
+    # 인덱스의 뒷부분이 잘려 있어도, 다음 추가 전에 로그와 맞춰 다시 만들어집니다.
+    with open(container.index_path(log_file), "r+b") as f:
+        f.truncate(os.path.getsize(container.index_path(log_file)) - container.INDEX_ENTRY.size * 10)
+    assert container.append_frame(log_file, b"next") == 200
+    assert container.read_frame(log_file, -1)["payload"] == b"next"
+    assert [frame["seq"] for frame in container.iter_frames(log_file)] == list(range(201))
+
+
+def test_truncated_tail_frame_is_ignored(log_file):
+    with open(log_file, "r+b") as f:
+        f.truncate(os.path.getsize(log_file) - 3)
+    assert len(list(container.iter_frames(log_file))) == 199
+    assert container.frame_count(log_file) == 199
+    assert container.append_frame(log_file, b"after crash") == 199
+    assert container.read_frame(log_file, -1)["payload"] == b"after crash"
+
+
+def test_legacy_log_is_readable(tmp_path, private_key):
+    path = tmp_path / "log.encrypted"
+    path.write_bytes(b"".join(crypto.encrypt_data(f"entry {i}".encode()) for i in range(3)))
+
+    frames = list(container.iter_frames(str(path)))
+    assert [crypto.decrypt_data(frame["payload"], private_key) for frame in frames] == [
+        b"entry 0", b"entry 1", b"entry 2"]
+    assert container.read_frame(str(path), -1)["seq"] == 2
+
+
+def test_session_frames_are_decryptable_on_their_own(tmp_path, monkeypatch, private_key):
+    monkeypatch.setattr(utility, "flag_container_log_enabled", True)
+    monkeypatch.setattr(utility, "flag_session_crypto_enabled", True)
+    target = tmp_path / "main.py"
+    for content in ("a = 1\n", "a = 2\n", "a = 3\n"):
+        target.write_text(content, encoding="utf-8")
+        assert utility.log_code_changes(str(target), str(tmp_path)) is True
+
+    log_file = str(tmp_path / "log" / "log.encrypted")
+    assert container.is_container(log_file)
+    assert container.frame_count(log_file) == 3
+
+    # 마지막 프레임만 읽어도, 같은 세션의 헤더가 붙어 있어 바로 복호화할 수 있습니다.
+    last = container.read_frame(log_file, -1)["payload"]
+    assert crypto.decrypt_records(last, private_key)[0].decode("utf-8").find("+a = 3") != -1
@@ -0,0 +1,130 @@
+# ==============================================================================
+# crypto 모듈의 암호화 형식(기존 하이브리드 방식, 세션 모드)을 검증하는 테스트입니다.
+#
+# tests/conftest.py의 private_key fixture가 테스트용 RSA 키 쌍을 만들어,
+# 암호화한 결과를 실제로 복호화해 볼 수 있게 해줍니다.
+#
+# 실행 방법: poetry run pytest tests/test_crypto.py
+# ==============================================================================
+
+import io
+import os
+import tracemalloc
+
+import pytest
+
+from mission_python.util import crypto
+
+
+def test_legacy_record_roundtrip(private_key):
+    blob = crypto.encrypt_data(b"hello legacy")
+    assert crypto.decrypt_records(blob, private_key) == [b"hello legacy"]
+
+
+def test_session_records_share_one_rsa_header(private_key, tmp_path):
+    log_file = str(tmp_path / "log.encrypted")
+    payloads = [f"entry {i}".encode() for i in range(5)]
+
+    for payload in payloads:
+        record = crypto.encrypt_session_record(payload, log_file)
+        with open(log_file, "ab") as f:
+            f.write(record)
+
+    data = open(log_file, "rb").read()
+    assert data.count(crypto.SESSION_MAGIC + b"H") == 1
+    # 헤더 한 번 이후에는 레코드당 (헤더 25바이트 + 태그 16바이트)의 오버헤드만 붙습니다.
+    assert len(data) == crypto.SESSION_HEADER_SIZE + sum(len(p) + 41 for p in payloads)
+    assert crypto.decrypt_records(data, private_key) == payloads
+
+
+def test_mixed_legacy_and_session_log_is_readable(private_key, tmp_path):
+    log_file = str(tmp_path / "log.encrypted")
+    with open(log_file, "wb") as f:
+        f.write(crypto.encrypt_data(b"old format"))
+    record = crypto.encrypt_session_record(b"new format", log_file)
+    with open(log_file, "ab") as f:
+        f.write(record)
+        f.write(crypto.encrypt_data(b"old again"))
+
+    data = open(log_file, "rb").read()
+    assert crypto.decrypt_records(data, private_key) == [b"old format", b"new format", b"old again"]
+
+
+def test_tampered_session_metadata_is_rejected(private_key, tmp_path):
+    log_file = str(tmp_path / "log.encrypted")
+    data = bytearray(crypto.encrypt_session_record(b"payload", log_file))
+    # 레코드 헤더의 일련번호를 바꾸면, 인증 태그 검증에 실패해야 합니다.
+    sequence_offset = crypto.SESSION_HEADER_SIZE + len(crypto.SESSION_MAGIC) + 1 + crypto.SESSION_ID_SIZE
+    data[sequence_offset + 7] ^= 1
+    with pytest.raises(Exception):
+        crypto.decrypt_records(bytes(data), private_key)
+
+
+def test_encrypt_stream_matches_legacy_format(private_key, tmp_path):
+    payload = bytes(range(256)) * 1000 + b"tail"
+
+    for source in (payload, memoryview(payload), io.BytesIO(payload)):
+        out = io.BytesIO()
+        written = crypto.encrypt_stream(source, out, chunk_size=4096)
+        assert written == len(out.getvalue())
+        assert crypto.decrypt_data(out.getvalue(), private_key) == payload
+
+
+def test_encrypt_stream_unknown_size_patches_length(private_key, tmp_path):
+
+    class Pipe(io.RawIOBase):
+        """ 크기를 알 수 없고 seek도 할 수 없는 입력(파이프)을 흉내 냅니다. """
+        def __init__(self, data):
+            self._source = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def readinto(self, buffer):
+            return self._source.readinto(buffer)
+
+    payload = b"x" * 100_003
+    out_path = tmp_path / "stream.encrypted"
+    with open(out_path, "wb") as out:
+        assert crypto.encrypt_stream(Pipe(payload), out, chunk_size=1024) is not None
+    assert crypto.decrypt_data(out_path.read_bytes(), private_key) == payload
+
+
+@pytest.mark.parametrize("change", [b"grown", None])
+def test_encrypt_stream_size_change_leaves_no_partial_record(private_key, tmp_path, change):
+    source_path = tmp_path / "source.txt"
+    source_path.write_bytes(b"x" * 10_000)
+
+    class ChangingFile(io.FileIO):
+        """ 첫 조각을 읽은 뒤 다른 프로세스가 파일을 늘리거나 줄인 것처럼 흉내 냅니다. """
+        def readinto(self, buffer):
+            count = super().readinto(buffer)
+            if self.tell() == count:
+                with open(source_path, "r+b") as f:
+                    if change:
+                        f.seek(0, os.SEEK_END)
+                        f.write(change)
+                    else:
+                        f.truncate(count)
+            return count
+
+    out_path = tmp_path / "log.encrypted"
+    out_path.write_bytes(b"previous records")
+    with ChangingFile(source_path) as source, open(out_path, "r+b") as out:
+        out.seek(0, os.SEEK_END)
+        assert crypto.encrypt_stream(source, out, chunk_size=1024) is None
+        assert out.tell() == len(b"previous records")
+    assert out_path.read_bytes() == b"previous records"
+
+
+def test_encrypt_stream_memory_stays_flat(private_key, tmp_path):
+    payload = memoryview(bytearray(os.urandom(1024)) * (16 * 1024))  # 16 MiB
+    crypto.get_public_key()
+
+    with open(tmp_path / "big.encrypted", "wb") as out:
+        tracemalloc.start()
+        crypto.encrypt_stream(payload, out)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assert peak < 1024 * 1024
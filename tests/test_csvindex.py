@@ -0,0 +1,129 @@
+# ==============================================================================
+# csvindex 모듈의 학번 인덱스(build_index, index_status, RowIndex) 동작을 검증하는 테스트입니다.
+#
+# assets/sample.csv를 임시 폴더(tmp_path)에 복사하여 인덱스를 만들고, 따옴표 안의 줄바꿈, 같은 학번,
+# 줄바꿈 없이 끝나는 마지막 행, 행 추가(증분 갱신), 수정 시각/내용 변경(오래된 인덱스 감지)을 확인합니다.
+#
+# 실행 방법: poetry run pytest tests/test_csvindex.py
+# ==============================================================================
+
+import os
+import random
+import shutil
+from pathlib import Path
+
+import pytest
+
+from mission_python.util import csvindex, csvstream
+
+HEADER = "순번,학과,학년,학번,성명,결석(일),출석점수(10점),기말고사(100점),중간고사(100점),총점,등급"
+
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    path = tmp_path / "sample.csv"
+    shutil.copy("assets/sample.csv", path)
+    return str(path)
+
+
+def row_text(number, student_id, name="n"):
+    return f"{number},컴퓨터공학부,1,{student_id},{name},0,10.0,1,2,3.00,F"
+
+
+def test_lookups_match_sample_rows(sample_csv):
+    records = list(csvstream.iter_records(sample_csv))
+    with csvindex.RowIndex(sample_csv) as index:
+        assert index.last_status == csvindex.MISSING and len(index) == len(records) == 60
+        assert index.header == HEADER.split(",")
+        for record in records:
+            assert index.get(record["학번"]) == record
+        assert index.get(1) is None and index.get_all(1) == []
+        keys = [records[5]["학번"], 1, int(records[0]["학번"]), records[5]["학번"]]
+        result = index.get_many(keys)
+        assert list(result) == [records[5]["학번"], 1, int(records[0]["학번"])]
+        assert result[1] is None and result[int(records[0]["학번"])] == records[0]
+    assert os.path.getsize(sample_csv + ".idx") == csvindex.INDEX_HEADER.size + 60 * csvindex.INDEX_ENTRY.size
+    assert csvindex.index_status(sample_csv) == csvindex.FRESH
+
+
+def test_quoted_newlines_duplicates_and_incremental_append(tmp_path):
+    path = tmp_path / "grades.csv"
+    path.write_text(f'{HEADER}\r\n{row_text(1, 30)}\r\n2,"컴퓨터공학부\r\n야간",1,10,"Kim, A",0,10.0,1,2,3.00,F\r\n'
+                    f'{row_text(3, 30, "second")}\r\n{row_text(4, 20, "tail")}', encoding="utf-8")
+    with csvindex.RowIndex(str(path)) as index:
+        assert index.get(10)["학과"] == "컴퓨터공학부\r\n야간" and index.get(10)["성명"] == "Kim, A"
+        assert [row["성명"] for row in index.get_all(30)] == ["n", "second"]
+        assert index.get_many([30, 10], all_matches=True)[30][1]["순번"] == "3"
+
+        # 줄바꿈 없이 끝났던 마지막 행이 이어서 완성되고, 새 행이 추가됩니다.
+        with open(path, "a", encoding="utf-8", newline="") as f:
+            f.write("9\r\n" + row_text(5, 5) + "\r\n")
+        assert index.get(20)["순번"] == "4" and index.get(20)["등급"] == "F9"
+        assert index.last_status == csvindex.APPENDED
+        assert len(index) == 5 and index.get(5)["순번"] == "5"
+        assert index.offsets(20) == index.offsets("20") and len(index.offsets(20)) == 1
+
+    fresh_index = tmp_path / "rebuilt.idx"
+    assert csvindex.build_index(str(path), str(fresh_index)) == csvindex.MISSING
+    assert fresh_index.read_bytes()[csvindex.INDEX_HEADER.size:] == \
+        (tmp_path / "grades.csv.idx").read_bytes()[csvindex.INDEX_HEADER.size:]
+
+
+def test_quoted_field_spanning_many_lines(tmp_path):
+    # 따옴표가 없는 가운데 줄이 있어도 필드가 끝날 때까지 하나의 행으로 합쳐야 합니다.
+    path = tmp_path / "notes.csv"
+    path.write_text(f'{HEADER}\n1,"line1\nline2\n\nline4",1,10,A,0,10.0,1,2,3.00,F\n{row_text(2, 20)}\n',
+                    encoding="utf-8")
+    with csvindex.RowIndex(str(path)) as index:
+        assert len(index) == 2
+        assert index.get(10)["학과"] == "line1\nline2\n\nline4" and index.get(10)["성명"] == "A"
+        assert index.get(20)["순번"] == "2"
+
+
+def test_stale_index_detection(sample_csv):
+    assert csvindex.build_index(sample_csv) == csvindex.MISSING
+    assert csvindex.build_index(sample_csv) == csvindex.FRESH
+
+    stat = os.stat(sample_csv)
+    os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert csvindex.build_index(sample_csv) == csvindex.TOUCHED
+    assert csvindex.index_status(sample_csv) == csvindex.FRESH
+
+    # 크기와 수정 시각을 그대로 둔 채 학번 하나를 바꾸면 verify=True일 때만 찾아냅니다.
+    data = Path(sample_csv).read_bytes().replace(b"2023000003", b"2023999999")
+    stat = os.stat(sample_csv)
+    with open(sample_csv, "wb") as f:
+        f.write(data)
+    os.utime(sample_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert csvindex.index_status(sample_csv) == csvindex.FRESH
+    assert csvindex.index_status(sample_csv, verify=True) == csvindex.STALE
+    with csvindex.RowIndex(sample_csv, verify=True) as index:
+        assert index.last_status == csvindex.STALE
+        assert index.get(2023000003) is None and index.get(2023999999)["성명"] == "Anthony Sanchez"
+
+    with open(sample_csv + ".idx", "r+b") as f:
+        f.write(b"XXXX")
+    assert csvindex.index_status(sample_csv) == csvindex.MISSING
+    assert csvindex.index_status(sample_csv, key_column="순번") == csvindex.MISSING
+    with csvindex.RowIndex(sample_csv, key_column="순번", index_file=sample_csv + ".no.idx") as index:
+        assert index.get(60)["순번"] == "60"
+    with pytest.raises(KeyError):
+        csvindex.build_index(sample_csv, key_column="없는열")
+
+
+def test_batch_lookup_on_larger_file(tmp_path):
+    path = tmp_path / "large.csv"
+    rng = random.Random(3)
+    ids = rng.sample(range(2000000000, 2100000000), 20_000)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(HEADER + "\n")
+        for number, student_id in enumerate(ids):
+            f.write(row_text(number, student_id, f'"Student, {number}"') + "\n")
+    wanted = rng.sample(ids, 2_000) + [1, 2]
+    numbers = {student_id: number for number, student_id in enumerate(ids)}
+    with csvindex.RowIndex(str(path)) as index:
+        result = index.get_many(wanted)
+    assert result[1] is None and result[2] is None
+    for student_id in wanted[:-2]:
+        assert result[student_id]["학번"] == str(student_id)
+        assert result[student_id]["성명"] == f"Student, {numbers[student_id]}"
@@ -0,0 +1,104 @@
+# ==============================================================================
+# csvstream 모듈의 CSV 행 스트림(open_rows, iter_rows, iter_records) 동작을 검증하는 테스트입니다.
+#
+# 따옴표 안의 쉼표/줄바꿈 같은 경우를 담은 CSV 파일을 임시 폴더(tmp_path)에 만들어 읽어 보고,
+# tracemalloc으로 큰 파일을 끝까지 읽는 동안의 메모리 사용량이 파일 크기와 관계없이 일정한지 확인합니다.
+#
+# 실행 방법: poetry run pytest tests/test_csvstream.py
+# ==============================================================================
+
+import csv
+import tracemalloc
+
+import pytest
+
+from mission_python import main
+from mission_python.util import csvstream
+
+HEADER = "순번,학과,학년,학번,성명,결석(일),출석점수(10점),기말고사(100점),중간고사(100점),총점,등급"
+
+
+def write_csv(path, text, bom=True):
+    path.write_bytes(("\ufeff" if bom else "").encode("utf-8") + text.encode("utf-8"))
+    return str(path)
+
+
+def test_sample_csv_header_and_rows():
+    with csvstream.open_rows("assets/sample.csv") as rows:
+        assert rows.header == HEADER.split(",")
+        first = next(rows)
+        assert first[rows.index("성명")] == "Anthony Sanchez"
+        remaining = list(rows)
+    assert first == main.get_assets_sample_csv_without_header()
+    assert len(remaining) + 1 == 60
+
+
+@pytest.mark.parametrize("chunk_size", [16, csvstream.DEFAULT_CHUNK_SIZE])
+def test_quoting_and_line_endings(tmp_path, chunk_size):
+    text = ('a,b,c\r\n'
+            '1,"Seoul, Korea","say ""hi"""\r\n'
+            '\r\n'
+            '2,"two\nlines",x\n'
+            '3,,"",\n')
+    path = write_csv(tmp_path / "quoted.csv", text)
+    with csvstream.open_rows(path, chunk_size=chunk_size) as rows:
+        assert rows.header == ["a", "b", "c"]
+        assert list(rows) == [["1", "Seoul, Korea", 'say "hi"'], ["2", "two\nlines", "x"], ["3", "", "", ""]]
+        assert rows.line_num == 6
+
+
+def test_records_and_field_mapping(tmp_path):
+    path = write_csv(tmp_path / "grades.csv", "학번,성명,총점\n1,Kim,90.5\n2,Lee\n")
+    assert list(csvstream.iter_records(path, ["총점", "학번"])) == [
+        {"총점": "90.5", "학번": "1"}, {"총점": None, "학번": "2"}]
+    assert next(csvstream.iter_records(path)) == {"학번": "1", "성명": "Kim", "총점": "90.5"}
+    with pytest.raises(KeyError):
+        next(csvstream.iter_records(path, ["등급"]))
+    with pytest.raises(csvstream.CsvFormatError, match="3번째 줄"):
+        list(csvstream.iter_rows(path, strict=True))
+    assert list(csvstream.iter_rows(path, has_header=False))[0] == ["학번", "성명", "총점"]
+
+
+def test_format_errors(tmp_path):
+    with pytest.raises(csvstream.CsvFormatError):
+        csvstream.open_rows(write_csv(tmp_path / "duplicate.csv", "a,b,a\n1,2,3\n"))
+    with pytest.raises(csv.Error):
+        list(csvstream.iter_rows(write_csv(tmp_path / "unclosed.csv", 'a,b\n1,"open\n')))
+
+
+def test_wrapper_handles_quotes_and_empty_files(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "assets").mkdir()
+    write_csv(tmp_path / "assets" / "sample.csv", f'{HEADER}\n1,"컴퓨터공학부, 소프트웨어",3,2023000003,"Sanchez, Anthony",0,10.0,39,42,46.30,B+\n')
+    assert main.get_assets_sample_csv_without_header()[1:5] == [
+        "컴퓨터공학부, 소프트웨어", "3", "2023000003", "Sanchez, Anthony"]
+
+    write_csv(tmp_path / "assets" / "sample.csv", f"{HEADER}\n\n")
+    assert main.get_assets_sample_csv_without_header() == []
+    write_csv(tmp_path / "assets" / "sample.csv", "", bom=False)
+    assert main.get_assets_sample_csv_without_header() == []
+    assert "비어 있습니다" in capsys.readouterr().out
+
+
+def test_memory_does_not_grow_with_file_size(tmp_path):
+    def peak_while_reading(path):
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in csvstream.iter_records(path, ["학번", "총점"]))
+            return count, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peaks = []
+    for row_count in (10_000, 100_000):
+        path = tmp_path / f"rows_{row_count}.csv"
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(HEADER + "\n")
+            for i in range(row_count):
+                f.write(f'{i},"컴퓨터공학부, 소프트웨어",3,{2023000000 + i},Student {i},0,10.0,39,42,46.30,B+\n')
+        count, peak = peak_while_reading(str(path))
+        assert count == row_count
+        peaks.append(peak)
+    # 파일이 10배(약 0.9MB -> 9MB) 커져도 최대 메모리 사용량은 버퍼 크기 정도로 거의 같습니다.
+    assert peaks[1] < 2 * csvstream.DEFAULT_CHUNK_SIZE + 256 * 1024
+    assert peaks[1] < peaks[0] + 64 * 1024
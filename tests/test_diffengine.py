@@ -0,0 +1,115 @@
+# ==============================================================================
+# diffengine 모듈의 diff 알고리즘(histogram, patience, myers)을 검증하는 테스트입니다.
+#
+# 무작위로 만든 두 버전에 대해, 만들어진 diff를 delta.apply_diff()로 적용하면 새 버전이 되는지,
+# 그리고 일치 구간이 같을 때 difflib.unified_diff와 출력이 완전히 같은지 확인합니다.
+#
+# 실행 방법: poetry run pytest tests/test_diffengine.py
+# ==============================================================================
+
+import difflib
+import random
+import time
+
+import pytest
+
+from mission_python.util import delta, diffengine
+
+ENGINES = ["histogram", "patience", "myers"]
+
+
+def random_versions(rng):
+    """ 적은 종류의 줄로 이루어진(반복이 많은) 이전 버전과, 그것을 조금 고친 새 버전을 만듭니다. """
+    alphabet = rng.randint(1, 6)
+    old = [f"line {rng.randrange(alphabet)}\n" for _ in range(rng.randrange(0, 30))]
+    new = list(old)
+    for _ in range(rng.randrange(0, 8)):
+        action = rng.randrange(3)
+        if action == 0 and new:
+            del new[rng.randrange(len(new))]
+        elif action == 1:
+            new.insert(rng.randrange(len(new) + 1), f"line {rng.randrange(alphabet + 2)}\n")
+        elif new:
+            new[rng.randrange(len(new))] = f"line {rng.randrange(alphabet + 2)}\n"
+    return old, new
+
+
+def lcs_length(a, b):
+    """ 가장 긴 공통 부분열의 길이를 동적 계획법으로 구합니다. (최소 diff 확인용) """
+    row = [0] * (len(b) + 1)
+    for x in reversed(a):
+        previous = 0
+        for j in range(len(b) - 1, -1, -1):
+            current = row[j]
+            row[j] = previous + 1 if x == b[j] else max(row[j], row[j + 1])
+            previous = current
+    return row[0]
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_diff_applies_back(algorithm):
+    rng = random.Random(algorithm)
+    for _ in range(500):
+        old, new = random_versions(rng)
+        base = delta.to_log_lines("".join(old))
+        for context in (0, 3, len(old) + len(new)):
+            diff = [line.rstrip("\n") for line in diffengine.unified_diff(
+                old, new, "previous version", "current version", n=context, algorithm=algorithm)]
+            if old == new:
+                assert diff == []
+            else:
+                assert delta.apply_diff(base, diff) == delta.to_log_lines("".join(new))
+
+
+def test_myers_is_minimal():
+    rng = random.Random(0)
+    for _ in range(500):
+        a = [rng.randrange(3) for _ in range(rng.randrange(0, 20))]
+        b = [rng.randrange(3) for _ in range(rng.randrange(0, 20))]
+        blocks = diffengine.matching_blocks(a, b, "myers")
+        assert sum(size for _, _, size in blocks) == lcs_length(a, b)
+        assert blocks[-1] == (len(a), len(b), 0)
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_output_identical_to_difflib(algorithm):
+    old = [f"value_{i} = {i}\n" for i in range(300)]
+    new = list(old)
+    new[10] = "value_10 = 'edited'\n"
+    new.insert(150, "inserted = True\n")
+    del new[250]
+    new.append("last = 1\n")
+    for context in (0, 3, len(old) + len(new)):
+        expected = list(difflib.unified_diff(old, new, "previous version", "current version", n=context))
+        assert list(diffengine.unified_diff(
+            old, new, "previous version", "current version", n=context, algorithm=algorithm)) == expected
+
+
+def test_repetitive_file_gets_minimal_diff():
+    # 같은 줄이 많이 반복되는 표에서 difflib은 autojunk 때문에 바뀌지 않은 줄까지 다시 기록합니다.
+    rng = random.Random(7)
+    old = [f"    [{rng.randrange(4)}, {rng.randrange(4)}],\n" for _ in range(2000)]
+    new = list(old)
+    for _ in range(5):
+        new.insert(rng.randrange(len(new)), "    [9, 9],\n")
+    diff = list(diffengine.unified_diff(old, new, n=0))
+    assert sum(line.startswith("+") and not line.startswith("+++") for line in diff) == 5
+    assert sum(line.startswith("-") and not line.startswith("---") for line in diff) == 0
+    assert len(diff) < len(list(difflib.unified_diff(old, new, n=0)))
+
+
+@pytest.mark.parametrize("algorithm", ENGINES)
+def test_unrelated_repetitive_files_stay_fast(algorithm):
+    # 적은 종류의 줄이 뒤섞인 서로 다른 두 파일은 편집 비용이 커서, Myers 대신 difflib로 비교해야 빨리 끝납니다.
+    rng = random.Random(11)
+    old = [f"v{rng.randrange(4)}\n" for _ in range(10_000)]
+    new = [f"v{rng.randrange(4)}\n" for _ in range(10_000)]
+    started = time.perf_counter()
+    diff = [line.rstrip("\n") for line in diffengine.unified_diff(old, new, n=3, algorithm=algorithm)]
+    assert time.perf_counter() - started < 2.0
+    assert delta.apply_diff(delta.to_log_lines("".join(old)), diff) == delta.to_log_lines("".join(new))
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        diffengine.matching_blocks([1], [2], "unknown")
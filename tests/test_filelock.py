@@ -0,0 +1,80 @@
+# ==============================================================================
+# 여러 프로세스가 동시에 변경 이력을 기록할 때의 잠금(filelock) 동작을 검증하는 테스트입니다.
+#
+# 실제로 여러 파이썬 프로세스를 동시에 실행하여, 로그에 레코드가 섞이거나 중복되지 않는지 확인합니다.
+#
+# 실행 방법: poetry run pytest tests/test_filelock.py
+# ==============================================================================
+
+import os
+import subprocess
+import sys
+import time
+
+from mission_python.util import crypto, filelock, geolocation, utility
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# 동시에 기록을 시도할 프로세스 수입니다.
+IMPORTERS = 16
+
+# 각 프로세스는 정해진 시각까지 기다렸다가 동시에 기록을 시작합니다.
+IMPORTER_CODE = (
+    "import sys, time\n"
+    "from mission_python.util import utility\n"
+    "time.sleep(max(0.0, float(sys.argv[3]) - time.time()))\n"
+    "sys.exit(0 if utility.log_code_changes(sys.argv[1], sys.argv[2]) else 1)\n"
+)
+
+
+def run_importers(count, target, project_root):
+    env = dict(os.environ)
+    # 자동 실행(실제 프로젝트의 main.py 기록, 서명 수집)은 건너뛰고, 지정한 임시 프로젝트만 기록하게 합니다.
+    env[geolocation.SIGNATURE_WORKER_ENV] = "1"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    start_at = str(time.time() + 2.0)
+    processes = [
+        subprocess.Popen([sys.executable, "-c", IMPORTER_CODE, str(target), str(project_root), start_at], env=env)
+        for _ in range(count)
+    ]
+    assert [process.wait(timeout=120) for process in processes] == [0] * count
+
+
+def test_lock_is_exclusive_and_times_out(tmp_path):
+    path = str(tmp_path / "log.lock")
+    with filelock.FileLock(path) as holder:
+        assert holder.acquired
+        other = filelock.FileLock(path, timeout=0.1)
+        assert other.acquire() is False
+        assert other.waited >= 0.1
+    with filelock.FileLock(path, timeout=0) as again:
+        assert again.acquired
+
+
+def test_unchanged_path_does_not_take_the_lock(tmp_path, monkeypatch):
+    monkeypatch.setattr(utility.crypto, "encrypt_data", lambda data: data)
+    target = tmp_path / "main.py"
+    target.write_text("x = 1\n", encoding="utf-8")
+    assert utility.log_code_changes(str(target), str(tmp_path)) is True
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    assert utility.log_code_changes(str(target), str(tmp_path)) is True
+
+    def no_lock(*args, **kwargs):
+        raise AssertionError("변경이 없는데 잠금을 사용했습니다.")
+    monkeypatch.setattr(utility.filelock, "FileLock", no_lock)
+    assert utility.log_code_changes(str(target), str(tmp_path)) is True
+
+
+def test_concurrent_importers_commit_each_change_once(tmp_path):
+    target = tmp_path / "main.py"
+    target.write_text("print('first')\n", encoding="utf-8")
+    run_importers(IMPORTERS, target, tmp_path)
+
+    target.write_text("print('second')\n", encoding="utf-8")
+    run_importers(IMPORTERS, target, tmp_path)
+
+    data = (tmp_path / "log" / "log.encrypted").read_bytes()
+    records = list(crypto.split_records(data))
+    assert [kind for kind, _ in records] == ["legacy", "legacy"]
+    assert sum(len(record) for _, record in records) == len(data)
+    assert (tmp_path / "log" / "log.temp").read_text(encoding="utf-8") == "print('second')\n"
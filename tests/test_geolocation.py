@@ -0,0 +1,137 @@
+# ==============================================================================
+# geolocation 모듈의 백그라운드 서명 작업자(Worker) 동작을 검증하는 테스트입니다.
+#
+# 실제 네트워크 조회나 프로세스 생성 없이 동작을 확인할 수 있도록,
+# pytest의 monkeypatch fixture로 정보 수집/암호화/작업자 실행 함수를 대체합니다.
+#
+# 실행 방법: poetry run pytest tests/test_geolocation.py
+# ==============================================================================
+
+import json
+import os
+import time
+
+import pytest
+
+from mission_python.util import geolocation
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    """ 서명 파일들이 임시 폴더에 저장되도록 log 폴더 경로를 바꿔줍니다. """
+    directory = tmp_path / "log"
+    directory.mkdir()
+    monkeypatch.setattr(geolocation, "_get_log_dir", lambda: str(directory))
+    monkeypatch.setattr(geolocation, "_collect_all_system_info", lambda: {"hostname": "test"})
+    monkeypatch.setattr(geolocation.crypto, "encrypt_data", lambda data: b"encrypted:" + data)
+    return directory
+
+
+@pytest.fixture
+def launched(monkeypatch):
+    """ 작업자 프로세스를 실제로 띄우는 대신, 호출 기록만 남깁니다. """
+    calls = []
+
+    def fake_launch(directory):
+        calls.append(directory)
+        return os.getpid()
+
+    monkeypatch.setattr(geolocation, "_launch_signature_worker", fake_launch)
+    return calls
+
+
+def test_background_mode_launches_worker_and_returns_immediately(log_dir, launched):
+    assert geolocation.create_signature_if_not_exists(background=True) is True
+    assert launched == [str(log_dir)]
+    marker = json.loads((log_dir / "signature.pending").read_text(encoding="utf-8"))
+    assert marker["pid"] == os.getpid()
+    assert not (log_dir / "signature.encrypted").exists()
+
+
+def test_running_worker_is_not_started_twice(log_dir, launched):
+    (log_dir / "signature.pending").write_text(
+        json.dumps({"pid": os.getpid(), "started_at": time.time()}), encoding="utf-8")
+    assert geolocation.create_signature_if_not_exists(background=True) is False
+    assert launched == []
+
+
+def test_stale_worker_is_detected_and_retried(log_dir, launched):
+    # 시간 제한을 넘긴 표시 파일과, 작업자가 남긴 임시 파일은 비정상 종료의 흔적입니다.
+    (log_dir / "signature.pending").write_text(
+        json.dumps({"pid": os.getpid(), "started_at": time.time() - geolocation.SIGNATURE_WORKER_TIMEOUT - 1}),
+        encoding="utf-8")
+    (log_dir / "signature.encrypted.12345.tmp").write_bytes(b"half")
+
+    assert geolocation.create_signature_if_not_exists(background=True) is True
+    assert launched == [str(log_dir)]
+    assert not (log_dir / "signature.encrypted.12345.tmp").exists()
+
+
+def test_stale_marker_is_left_alone_while_another_process_claims_it(log_dir, launched):
+    # 다른 프로세스가 표시 파일을 차지하는 중(signature.lock 잠금을 가진 상태)이면, 아무것도 지우지 않고 물러납니다.
+    stale = json.dumps({"pid": os.getpid(), "started_at": time.time() - geolocation.SIGNATURE_WORKER_TIMEOUT - 1})
+    (log_dir / "signature.pending").write_text(stale, encoding="utf-8")
+    (log_dir / "signature.encrypted.12345.tmp").write_bytes(b"half")
+
+    with geolocation.filelock.FileLock(str(log_dir / "signature.lock"), timeout=0) as lock:
+        assert lock.acquired
+        assert geolocation.create_signature_if_not_exists(background=True) is False
+    assert launched == []
+    assert (log_dir / "signature.pending").read_text(encoding="utf-8") == stale
+    assert (log_dir / "signature.encrypted.12345.tmp").exists()
+
+    assert geolocation.create_signature_if_not_exists(background=True) is True
+    assert launched == [str(log_dir)]
+
+
+def test_worker_publishes_signature_and_completion_marker(log_dir):
+    (log_dir / "signature.pending").write_text("{}", encoding="utf-8")
+
+    geolocation._run_signature_worker(str(log_dir))
+
+    assert (log_dir / "signature.encrypted").read_bytes().startswith(b"encrypted:")
+    assert (log_dir / "signature.done").exists()
+    assert not (log_dir / "signature.pending").exists()
+    assert [p.name for p in log_dir.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_existing_signature_is_skipped(log_dir, launched):
+    (log_dir / "signature.encrypted").write_bytes(b"done")
+    assert geolocation.create_signature_if_not_exists(background=True) is False
+    assert launched == []
+
+
+def test_collection_time_is_bounded_by_one_deadline(monkeypatch):
+    # 느린 조회가 여러 개 있어도, 전체 수집은 마감 시간 한 번 안에 끝나야 합니다.
+    def slow(*args):
+        time.sleep(5)
+        return "late"
+
+    for name in ("get_public_ip_address", "get_hostname", "get_os_info", "get_all_mac_addresses"):
+        monkeypatch.setattr(geolocation, name, slow)
+
+    started = time.perf_counter()
+    result = geolocation._collect_all_system_info(deadline=0.3)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 2
+    assert result["probe_stats"]["hostname"]["status"] == "timeout"
+    assert result["probe_stats"]["user_id"]["status"] == "ok"
+    assert result["hostname"].startswith("확인 불가")
+
+
+def test_public_ip_uses_first_answer(monkeypatch):
+    import io
+    import urllib.request
+
+    delays = {"https://api.ipify.org": 3, "https://ifconfig.me/ip": 0.05, "https://icanhazip.com": 3}
+
+    def fake_urlopen(url, timeout=None):
+        time.sleep(delays[url])
+        return io.BytesIO(b"203.0.113.7\n")
+
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+
+    started = time.perf_counter()
+    assert geolocation.get_public_ip_address(timeout=2) == "203.0.113.7"
+    assert time.perf_counter() - started < 1
@@ -0,0 +1,67 @@
+# ==============================================================================
+# history 모듈의 버전 복원(VersionHistory) 동작을 검증하는 테스트입니다.
+#
+# log_code_changes()가 기록하는 것과 같은 형식의 로그 항목을 직접 만들어 사용합니다.
+#
+# 실행 방법: poetry run pytest tests/test_history.py
+# ==============================================================================
+
+import random
+
+import pytest
+
+from mission_python.util import delta, history
+
+
+def build_log(version_count, keyframe_every=None):
+    """ 무작위로 수정되는 파일의 모든 버전과, 그 변경 이력을 담은 로그 항목 목록을 만듭니다. """
+    rng = random.Random(7)
+    lines = [f"line {i}\n" for i in range(50)]
+    versions = [[line.rstrip("\n") for line in lines]]
+    entries = [f"🦊=== Code Change Tracking Started at t0 ===\n🦊=== Initial version of main.py ===\n\n{''.join(lines)}"]
+    for k in range(1, version_count):
+        previous = list(lines)
+        position = rng.randrange(len(lines))
+        if rng.random() < 0.5:
+            lines[position] = f"edited {k}\n"
+        else:
+            lines.insert(position, f"inserted {k}\n")
+        if keyframe_every and k % keyframe_every == 0:
+            entries.append(f"\n\n🦊=== Keyframe at t{k} ===\n🦊=== Full version of main.py ===\n\n{''.join(lines)}")
+        else:
+            entries.append(f"\n\n🦊=== Code delta at t{k} ===\n" + "\n".join(delta.make_delta(previous, lines)))
+        versions.append([line.rstrip("\n") for line in lines])
+    return entries, versions
+
+
+def test_random_access_matches_sequential_versions():
+    entries, versions = build_log(300, keyframe_every=70)
+    log = history.VersionHistory(entries, checkpoint_interval=16)
+    assert len(log) == 300
+    for k in (0, 250, 251, 40, 299, 139, 140, -1):
+        assert log.get_version(k) == versions[k]
+    assert list(log.iter_versions()) == versions
+    with pytest.raises(IndexError):
+        log.get_version(300)
+
+
+def test_jump_cost_is_bounded_by_checkpoint_distance():
+    entries, versions = build_log(500)
+    log = history.VersionHistory(entries, checkpoint_interval=20)
+
+    assert log.get_version(480) == versions[480]
+    assert log.last_replay_count == 480
+    # 처음 복원하면서 남긴 체크포인트 덕분에, 이후의 이동은 체크포인트 간격 이내의 diff만 적용합니다.
+    for k in (15, 333, 101, 479, 250):
+        assert log.get_version(k) == versions[k]
+        assert log.last_replay_count < 20
+
+
+def test_cache_respects_memory_budget():
+    entries, _ = build_log(200)
+    budget = 4 * history._estimate_size(delta.to_log_lines("".join(f"line {i}\n" for i in range(60))))
+    log = history.VersionHistory(entries, checkpoint_interval=5, memory_budget=budget)
+    for _ in log.iter_versions():
+        assert log.cache_bytes <= budget
+    log.get_version(199)
+    assert 0 < log.cache_bytes <= budget
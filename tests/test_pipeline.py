@@ -0,0 +1,120 @@
+# ==============================================================================
+# pipeline 모듈의 스트리밍 기록(diff -> 인코딩 -> 압축 -> 암호화 -> 파일) 동작을 검증하는 테스트입니다.
+#
+# 몇 MB 크기의 파일로 기존 방식과 같은 레코드가 만들어지는지 확인하고, tracemalloc으로
+# 기록 중 최대 메모리 사용량이 파일 크기와 관계없이 diff 계산에 필요한 만큼으로 제한되는지 측정합니다.
+#
+# 실행 방법: poetry run pytest tests/test_pipeline.py
+# ==============================================================================
+
+import tracemalloc
+
+import pytest
+
+from mission_python.util import codec, crypto, delta, diffengine, pipeline, reader, utility
+
+HEADER = "\n\n🦊=== Code changes at t1 ===\n"
+
+
+def make_versions(line_count):
+    """ 큰 파일의 이전 버전과, 100줄마다 한 줄씩 고친 현재 버전의 줄 목록을 만듭니다. """
+    old = [f"value_{i} = compute({i}, 'padding text {i * 7}')\n" for i in range(line_count)]
+    new = list(old)
+    for index in range(0, line_count, 100):
+        new[index] = f"edited_{index} = '한글 {index}'\r\n"
+    return old, new
+
+
+def expected_entry(old, new):
+    """ 기존 방식(make_change_entry)으로 만든 같은 항목입니다. """
+    text, _ = utility.make_change_entry(old, new, "".join(new), "t1", "main.py", {})
+    return text
+
+
+def measure_peak(function):
+    """ function을 실행하는 동안 새로 할당된 메모리의 최댓값(바이트)을 반환합니다. """
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        function()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def test_streamed_record_matches_in_memory_record(tmp_path, private_key):
+    old, new = make_versions(40_000)
+    log_file = tmp_path / "log.encrypted"
+    log_file.write_bytes(crypto.encrypt_data(b"first record"))
+
+    result = pipeline.write_change_entry(str(log_file), HEADER, old, new)
+    assert result["changed"] and result["chars"] == len(expected_entry(old, new))
+    entries = list(reader.iter_log_entries(str(log_file), private_key))
+    assert entries == [b"first record", expected_entry(old, new).encode("utf-8")]
+    assert result["bytes_written"] == log_file.stat().st_size - len(crypto.encrypt_data(b"first record"))
+
+
+@pytest.mark.parametrize("codec_name", ["zlib", "lzma"])
+def test_streamed_record_can_be_compressed(tmp_path, private_key, codec_name):
+    old, new = make_versions(20_000)
+    log_file = tmp_path / "log.encrypted"
+    result = pipeline.write_change_entry(str(log_file), HEADER, old, new, compression=codec_name,
+                                         previous_versions={"main.py": "".join(old)})
+    assert result["bytes_written"] < result["bytes_in"] // 4
+    raw = crypto.decrypt_data(log_file.read_bytes(), private_key)
+    assert codec.is_compressed(raw)
+    assert codec.decompress(raw, {"main.py": "".join(old)}) == expected_entry(old, new).encode("utf-8")
+
+
+def test_plain_mode_and_unchanged_files(tmp_path):
+    old, new = make_versions(1_000)
+    log_file = tmp_path / "log.plain"
+    assert pipeline.write_change_entry(str(log_file), HEADER, old, old, encrypt=False)["changed"] is False
+    assert not log_file.exists() or log_file.read_bytes() == b""
+    pipeline.write_change_entry(str(log_file), HEADER, old, new, encrypt=False)
+    assert log_file.read_text(encoding="utf-8") == expected_entry(old, new)
+
+
+def test_failed_write_leaves_log_untouched(tmp_path, private_key, monkeypatch):
+    old, new = make_versions(5_000)
+    log_file = tmp_path / "log.encrypted"
+    log_file.write_bytes(crypto.encrypt_data(b"first record"))
+    before = log_file.read_bytes()
+    monkeypatch.setattr(pipeline.crypto, "encrypt_stream", lambda src, dst: dst.write(b"partial") and None)
+    assert pipeline.write_change_entry(str(log_file), HEADER, old, new) is None
+    assert log_file.read_bytes() == before
+
+
+def test_peak_memory_is_bounded(tmp_path, private_key):
+    extra = {}
+    for line_count in (25_000, 75_000):
+        old, new = make_versions(line_count)
+        size = sum(len(line) for line in new)
+        diff_peak = measure_peak(lambda: diffengine.opcodes(old, new))
+        stream_peak = measure_peak(lambda: pipeline.write_change_entry(
+            str(tmp_path / f"stream_{line_count}"), HEADER, old, new))
+        memory_peak = measure_peak(lambda: crypto.encrypt_data(expected_entry(old, new).encode("utf-8")))
+        # 기존 방식은 diff 목록, 합친 문자열, 바이트, 암호문을 함께 가지고 있어 파일 크기의 몇 배를 더 사용합니다.
+        assert memory_peak > stream_peak + 2 * size
+        extra[line_count] = stream_peak - diff_peak
+    # diff 계산 외에 스트리밍 단계가 추가로 사용하는 메모리는 파일 크기(약 1.3MB -> 4MB)와 관계없이 일정합니다.
+    assert max(extra.values()) < 1024 * 1024
+    assert extra[75_000] < extra[25_000] + 256 * 1024
+
+
+def test_large_file_is_logged_through_pipeline(tmp_path, private_key, monkeypatch):
+    monkeypatch.setattr(utility, "STREAMING_MIN_FILE_SIZE", 100_000)
+    calls = []
+    original = pipeline.write_change_entry
+    monkeypatch.setattr(utility.pipeline, "write_change_entry",
+                        lambda *args, **kwargs: calls.append(args[0]) or original(*args, **kwargs))
+    target = tmp_path / "main.py"
+    old, new = make_versions(5_000)
+    for lines in (old, new, old[:10] + new):
+        target.write_bytes("".join(lines).encode("utf-8"))
+        assert utility.log_code_changes(str(target), str(tmp_path)) is True
+
+    assert len(calls) == 2
+    entries = [entry.decode("utf-8") for entry in
+               reader.iter_log_entries(str(tmp_path / "log" / "log.encrypted"), private_key)]
+    assert delta.replay(entries) == delta.to_log_lines("".join(old[:10] + new))
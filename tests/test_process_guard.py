@@ -0,0 +1,37 @@
+# ==============================================================================
+# 자동 기록(commit)과 서명 수집이 프로세스 트리당 한 번만 실행되는지 검증하는 테스트입니다.
+#
+# 실행 방법: poetry run pytest tests/test_process_guard.py
+# ==============================================================================
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import mission_python.util
+from mission_python.util import utility
+
+
+def _worker_state():
+    """ 작업자 프로세스에서 자동 실행 여부와 PID를 확인합니다. """
+    return mission_python.util._is_tracking_root, os.getpid()
+
+
+def test_claim_tracking_root(monkeypatch):
+    monkeypatch.delenv(utility.TRACKING_ROOT_ENV, raising=False)
+    assert utility.claim_tracking_root() is True
+    assert os.environ[utility.TRACKING_ROOT_ENV] == str(os.getpid())
+    # 같은 프로세스에서 다시 확인해도 그대로 자동 실행 대상입니다.
+    assert utility.claim_tracking_root() is True
+
+    monkeypatch.setenv(utility.TRACKING_ROOT_ENV, str(os.getpid() + 1))
+    assert utility.claim_tracking_root() is False
+
+
+def test_spawned_workers_skip_the_hooks(monkeypatch):
+    monkeypatch.setenv(utility.TRACKING_ROOT_ENV, str(os.getpid()))
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=3, mp_context=context) as executor:
+        results = [executor.submit(_worker_state).result() for _ in range(6)]
+    assert all(is_root is False for is_root, _ in results)
+    assert all(pid != os.getpid() for _, pid in results)
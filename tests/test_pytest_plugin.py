@@ -0,0 +1,68 @@
+# ==============================================================================
+# pytest 플러그인(mission_python.pytest_plugin)이 자동 기록을 세션당 한 번만 실행하는지 검증하는 테스트입니다.
+#
+# 별도의 pytest 프로세스를 실행하므로, 다른 테스트보다 조금 느립니다.
+# 실행 방법: poetry run pytest tests/test_pytest_plugin.py
+# ==============================================================================
+
+import os
+import subprocess
+import sys
+import textwrap
+from types import SimpleNamespace
+
+from mission_python import pytest_plugin
+from mission_python.util import utility
+
+
+def run_pytest(tmp_path, env_updates, test_source):
+    """ tmp_path에 테스트 파일을 만들고, 플러그인을 켠 pytest를 별도 프로세스로 실행합니다. """
+    (tmp_path / "test_sample.py").write_text(textwrap.dedent(test_source), encoding="utf-8")
+    env = dict(os.environ)
+    env.pop(utility.TRACKING_ROOT_ENV, None)
+    env.pop("PYTEST_XDIST_WORKER", None)
+    env.update(env_updates)
+    # 패키지를 설치하여 진입점으로 이미 등록된 경우에도 두 번 등록되지 않도록 진입점 쪽은 끕니다.
+    command = [sys.executable, "-m", "pytest", "-q", "-p", "no:mission_python",
+               "-p", "mission_python.pytest_plugin", "-p", "no:cacheprovider", str(tmp_path)]
+    return subprocess.run(command, cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120)
+
+
+def test_env_name_matches_utility():
+    assert pytest_plugin.TRACKING_ROOT_ENV == utility.TRACKING_ROOT_ENV
+
+
+def test_worker_marks_tracking_as_done(monkeypatch):
+    monkeypatch.delenv(utility.TRACKING_ROOT_ENV, raising=False)
+    monkeypatch.setattr(pytest_plugin, "_tracking", {"ran": False, "seconds": 0.0, "worker": False})
+    pytest_plugin.pytest_load_initial_conftests(SimpleNamespace(workerinput={}), None, [])
+    assert pytest_plugin._tracking["worker"] is True
+    assert os.environ[utility.TRACKING_ROOT_ENV] == str(os.getppid())
+    # 이 표시를 물려받은 프로세스에서는 자동 기록을 건너뜁니다.
+    assert utility.claim_tracking_root() is False
+
+
+def test_summary_reports_skipped_tracking(tmp_path):
+    # 부모 프로세스(이 테스트)가 이미 자동 기록을 실행한 상태입니다.
+    result = run_pytest(tmp_path, {utility.TRACKING_ROOT_ENV: str(os.getpid())}, """
+        import mission_python.util
+
+        def test_hooks_skipped():
+            assert mission_python.util._is_tracking_root is False
+    """)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "mission-python tracking: skipped" in result.stdout
+
+
+def test_xdist_worker_skips_hooks(tmp_path):
+    result = run_pytest(tmp_path, {"PYTEST_XDIST_WORKER": "gw0"}, """
+        import os
+        import mission_python.util
+
+        def test_hooks_skipped_in_worker():
+            assert mission_python.util._is_tracking_root is False
+            assert os.environ["MISSION_PYTHON_TRACKING_ROOT"] == str(os.getppid())
+    """)
+    assert result.returncode == 0, result.stdout + result.stderr
+    # 작업자는 결과 요약을 따로 출력하지 않습니다. (컨트롤러가 출력)
+    assert "mission-python tracking" not in result.stdout
@@ -0,0 +1,48 @@
+# ==============================================================================
+# reader 모듈의 로그 읽기(iter_log_entries) 동작을 검증하는 테스트입니다.
+#
+# tests/conftest.py의 private_key fixture가 만든 테스트용 RSA 키 쌍으로
+# 실제 암호화된 로그를 만든 뒤, 다시 읽어서 원본과 비교합니다.
+#
+# 실행 방법: poetry run pytest tests/test_reader.py
+# ==============================================================================
+
+import types
+
+from mission_python.util import container, crypto, reader
+
+
+def write_legacy_log(path, count):
+    payloads = [f"entry {i}".encode() for i in range(count)]
+    path.write_bytes(b"".join(crypto.encrypt_data(payload) for payload in payloads))
+    return payloads
+
+
+def test_entries_are_yielded_lazily(tmp_path, private_key):
+    log_file = tmp_path / "log.encrypted"
+    payloads = write_legacy_log(log_file, 3)
+
+    entries = reader.iter_log_entries(str(log_file), private_key)
+    assert isinstance(entries, types.GeneratorType)
+    assert next(entries) == payloads[0]
+    assert list(entries) == payloads[1:]
+
+
+def test_mixed_and_container_logs(tmp_path, private_key):
+    log_file = tmp_path / "log.encrypted"
+    data = crypto.encrypt_data(b"legacy")
+    data += crypto.encrypt_session_record(b"session 1", str(log_file), new_file=True)
+    data += crypto.encrypt_session_record(b"session 2", str(log_file))
+    log_file.write_bytes(data)
+    assert list(reader.iter_log_entries(str(log_file), private_key)) == [b"legacy", b"session 1", b"session 2"]
+
+    container_file = str(tmp_path / "container.encrypted")
+    for record in (crypto.encrypt_data(b"a"), crypto.encrypt_data(b"b")):
+        container.append_frame(container_file, record)
+    assert list(reader.iter_log_entries(container_file, private_key)) == [b"a", b"b"]
+
+
+def test_parallel_mode_keeps_order(tmp_path, private_key):
+    log_file = tmp_path / "log.encrypted"
+    payloads = write_legacy_log(log_file, 30)
+    assert list(reader.iter_log_entries(str(log_file), private_key, workers=3)) == payloads
@@ -0,0 +1,43 @@
+# ==============================================================================
+# store 모듈의 추가 전용 저장소(BaselineStore) 동작을 검증하는 테스트입니다.
+#
+# 실행 방법: poetry run pytest tests/test_store.py
+# ==============================================================================
+
+from mission_python.util import store
+
+
+def test_ops_preserve_line_endings():
+    old = "a\r\nb\nc"
+    new = "a\r\nB\r\nc\nd"
+    assert store.apply_ops(old, store.make_ops(old, new)) == new
+
+
+def test_torn_tail_record_is_truncated_on_open(tmp_path):
+    path = tmp_path / "log.store"
+    log_file = tmp_path / "log.encrypted"
+    log_file.write_bytes(b"x" * 10)
+    baseline = store.BaselineStore(str(path), str(log_file)).open()
+    baseline.commit({"main.py": "v1\n"}, log_size=10)
+    valid_size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(b"\x00\x00\x01\x00garbage")
+
+    reopened = store.BaselineStore(str(path), str(log_file)).open()
+    assert reopened.get("main.py") == "v1\n"
+    assert reopened.recovery["store_bytes"] == 11
+    assert path.stat().st_size == valid_size
+
+
+def test_store_is_compacted_when_deltas_pile_up(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "COMPACT_MIN_BYTES", 0)
+    path = tmp_path / "log.store"
+    log_file = tmp_path / "log.encrypted"
+    log_file.write_bytes(b"")
+    baseline = store.BaselineStore(str(path), str(log_file)).open()
+    content = "".join(f"line {i}\n" for i in range(20))
+    for step in range(50):
+        content = content.replace(f"line {step % 20}\n", f"line {step % 20}!\n", 1)
+        baseline.commit({"main.py": content}, log_size=0)
+        assert path.stat().st_size <= store.COMPACT_RATIO * len(content) + 200
+    assert store.BaselineStore(str(path), str(log_file)).open().get("main.py") == content
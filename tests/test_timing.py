@@ -0,0 +1,121 @@
+# ==============================================================================
+# timing 모듈의 단계별 시간 측정(JSON Lines 이벤트) 동작을 검증하는 테스트입니다.
+#
+# 측정값은 pytest가 제공하는 임시 폴더(tmp_path)의 파일에 기록되며, 테스트가 끝나면 측정을 다시 끕니다.
+#
+# 실행 방법: poetry run pytest tests/test_timing.py
+# ==============================================================================
+
+import json
+import os
+import queue
+
+import pytest
+
+from mission_python.util import geolocation, timing, utility
+
+
+def read_events(path):
+    """ JSON Lines 파일을 이벤트 목록으로 읽습니다. """
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture
+def timing_file(tmp_path):
+    """ 임시 파일에 측정값을 기록하도록 켜고, 테스트가 끝나면 끕니다. """
+    path = tmp_path / "timing.jsonl"
+    timing.configure(str(path))
+    yield path
+    timing.configure(None)
+
+
+def test_configure_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(timing.TIMING_ENV, str(tmp_path / "custom.jsonl"))
+    timing.configure_from_env()
+    assert timing.enabled and timing.output_file == str(tmp_path / "custom.jsonl")
+
+    monkeypatch.setenv(timing.TIMING_ENV, "1")
+    timing.configure_from_env()
+    assert timing.output_file == timing.DEFAULT_TIMING_FILE
+
+    monkeypatch.setenv(timing.TIMING_ENV, "0")
+    timing.configure_from_env()
+    assert timing.enabled is False
+
+
+def test_disabled_records_nothing(tmp_path):
+    timing.configure(None)
+    target = tmp_path / "main.py"
+    target.write_text("x = 1\n", encoding="utf-8")
+    utility.flag_plain_log_enabled, previous = True, utility.flag_plain_log_enabled
+    try:
+        assert utility.log_code_changes(str(target), str(tmp_path))
+    finally:
+        utility.flag_plain_log_enabled = previous
+    assert not list(tmp_path.glob("**/*.jsonl"))
+
+
+def test_log_code_changes_phases(tmp_path, timing_file):
+    target = tmp_path / "main.py"
+    target.write_text("x = 1\n", encoding="utf-8")
+    assert utility.log_code_changes(str(target), str(tmp_path))
+    target.write_text("x = 1\ny = 2\n", encoding="utf-8")
+    assert utility.log_code_changes(str(target), str(tmp_path))
+
+    events = read_events(timing_file)
+    commits = [event for event in events if event["event"] == "log_code_changes"]
+    assert [event["kind"] for event in commits] == ["initial", "change"]
+    change = commits[1]
+    for phase in ("stat_check", "lock", "read", "digest", "splitlines", "baseline_read", "diff",
+                  "encrypt_data", "write", "baseline_write", "meta"):
+        assert phase in change["phases"], phase
+    assert change["bytes_read"] == len("x = 1\ny = 2\n")
+    assert change["entry_chars"] > 0 and change["bytes_written"] > 0
+    assert sum(change["phases"].values()) <= change["total_ms"] + 0.01
+
+    # 암호화는 바깥 이벤트의 단계이면서, 자체 단계를 가진 별도의 이벤트로도 기록됩니다.
+    encrypts = [event for event in events if event["event"] == "encrypt_data"]
+    assert len(encrypts) == 2
+    assert {"import", "key", "aes", "rsa"} <= set(encrypts[1]["phases"])
+    assert encrypts[1]["bytes_out"] == change["bytes_written"]
+
+
+def test_unchanged_path_is_marked(tmp_path, timing_file):
+    target = tmp_path / "main.py"
+    target.write_text("x = 1\n", encoding="utf-8")
+    assert utility.log_code_changes(str(target), str(tmp_path))
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    assert utility.log_code_changes(str(target), str(tmp_path))
+    assert utility.log_code_changes(str(target), str(tmp_path))
+
+    last = read_events(timing_file)[-1]
+    assert last["event"] == "log_code_changes"
+    assert last["unchanged"] is True
+    assert list(last["phases"]) == ["stat_check"]
+
+
+def test_probe_events(timing_file):
+    results = queue.Queue()
+    geolocation._start_probe("hostname", lambda: "test-host", (), results)
+    name, value, status, elapsed_ms = results.get(timeout=5)
+    assert (name, value, status) == ("hostname", "test-host", "ok")
+
+    (event,) = read_events(timing_file)
+    assert event["event"] == "probe"
+    assert event["name"] == "hostname" and event["status"] == "ok"
+    assert event["bytes"] == len('"test-host"')
+
+
+def test_error_is_recorded(timing_file):
+    @timing.timed("failing")
+    def failing():
+        timing.mark("before")
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        failing()
+    (event,) = read_events(timing_file)
+    assert event["event"] == "failing" and event["error"] == "ValueError"
+    assert "before" in event["phases"]
@@ -0,0 +1,270 @@
+# ==============================================================================
+# utility 모듈의 코드 변경 기록(log_code_changes) 동작을 검증하는 테스트입니다.
+#
+# 실제 공개키 암호화 대신, 기록된 항목을 다시 꺼내 볼 수 있는 간단한 가짜 암호화 함수를
+# 사용합니다. 모든 파일은 pytest가 제공하는 임시 폴더(tmp_path)에 만들어집니다.
+#
+# 실행 방법: poetry run pytest tests/test_utility.py
+# ==============================================================================
+
+import difflib
+import os
+import struct
+
+import pytest
+
+from mission_python.util import delta, history, utility
+
+
+def _fake_encrypt(data):
+    """ [데이터 길이 (4바이트)][데이터] 형태로만 감싸서, 테스트에서 항목을 다시 나눌 수 있게 합니다. """
+    return struct.pack('>I', len(data)) + data
+
+
+def read_entries(log_file):
+    """ 가짜 암호화로 기록된 로그 파일을 항목(문자열) 목록으로 나눕니다. """
+    data = log_file.read_bytes()
+    entries, offset = [], 0
+    while offset < len(data):
+        (length,) = struct.unpack_from('>I', data, offset)
+        entries.append(data[offset + 4:offset + 4 + length].decode('utf-8'))
+        offset += 4 + length
+    return entries
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """ 임시 프로젝트 폴더와 추적 대상 main.py 파일을 준비합니다. """
+    monkeypatch.setattr(utility.crypto, "encrypt_data", _fake_encrypt)
+    target = tmp_path / "main.py"
+    target.write_text("", encoding="utf-8")
+    return tmp_path, target
+
+
+def commit(project_root, target, content):
+    target.write_text(content, encoding="utf-8")
+    assert utility.log_code_changes(str(target), str(project_root)) is True
+
+
+def test_compact_log_replays_to_latest_version(project, monkeypatch):
+    project_root, target = project
+    monkeypatch.setattr(utility, "flag_compact_log_enabled", True)
+    monkeypatch.setattr(utility, "KEYFRAME_INTERVAL", 4)
+
+    lines = [f"line {i}\n" for i in range(200)]
+    commit(project_root, target, "".join(lines))
+    for step in range(10):
+        lines[step * 7] = f"edited {step}\n"
+        lines.insert(step * 3, f"inserted {step}\n")
+        del lines[-1]
+        commit(project_root, target, "".join(lines))
+
+    entries = read_entries(project_root / "log" / "log.encrypted")
+    kinds = [delta.parse_entry(text)["kind"] for text in entries]
+    assert kinds[0] == "initial"
+    assert kinds.count("keyframe") == 2
+    assert kinds[1:6] == ["delta"] * 4 + ["keyframe"]
+    assert delta.replay(entries) == [line.rstrip("\n") for line in lines]
+
+
+def test_compact_log_grows_with_edit_size_not_file_size(project, monkeypatch):
+    project_root, target = project
+    lines = [f"value_{i} = {i}\n" for i in range(500)]
+
+    def log_size_after_edits(compact):
+        log_dir = project_root / "log"
+        for path in log_dir.glob("*") if log_dir.exists() else []:
+            path.unlink()
+        monkeypatch.setattr(utility, "flag_compact_log_enabled", compact)
+        commit(project_root, target, "".join(lines))
+        edited = list(lines)
+        for step in range(20):
+            edited[250] = f"value_250 = {step}\n"
+            commit(project_root, target, "".join(edited))
+        return (log_dir / "log.encrypted").stat().st_size
+
+    full_size = log_size_after_edits(compact=False)
+    compact_size = log_size_after_edits(compact=True)
+    assert compact_size * 10 < full_size
+
+
+def test_apply_diff_handles_full_context_diffs():
+    old = ["a", "b", "c"]
+    new = ["a", "--b", "c", "d"]
+    diff = [line.rstrip("\n") for line in difflib.unified_diff(
+        [x + "\n" for x in old], [x + "\n" for x in new], n=10)]
+    assert delta.apply_diff(old, diff) == new
+    assert delta.apply_diff(old, delta.make_delta([x + "\n" for x in old], [x + "\n" for x in new])) == new
+
+
+def test_unchanged_file_is_detected_by_stat_without_reading(project, monkeypatch):
+    project_root, target = project
+    commit(project_root, target, "print('hello')\n")
+    # 수정 시각을 충분히 과거로 옮겨, 시각 해상도 문제(racy)가 없는 상태를 만듭니다.
+    utility.log_code_changes(str(target), str(project_root))
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    utility.log_code_changes(str(target), str(project_root))
+
+    reads = []
+    monkeypatch.setattr(utility, "read_file_content", lambda *args, **kwargs: reads.append(args))
+    assert utility.log_code_changes(str(target), str(project_root)) is True
+    assert reads == []
+
+
+def test_racy_mtime_falls_back_to_content_hash(project, monkeypatch):
+    project_root, target = project
+    commit(project_root, target, "x = 1\n")
+    before = target.stat()
+
+    # 크기와 수정 시각은 그대로 두고 내용만 바꿉니다. (시각 해상도가 낮은 파일 시스템에서 생길 수 있는 상황)
+    target.write_text("x = 2\n", encoding="utf-8")
+    os.utime(target, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    assert utility.log_code_changes(str(target), str(project_root)) is True
+    entries = read_entries(project_root / "log" / "log.encrypted")
+    assert len(entries) == 2
+    assert "+x = 2" in entries[1]
+
+
+def test_session_mode_log_is_decryptable(tmp_path, monkeypatch, private_key):
+    monkeypatch.setattr(utility, "flag_session_crypto_enabled", True)
+    target = tmp_path / "main.py"
+    for content in ("a = 1\n", "a = 2\n", "a = 3\n"):
+        commit(tmp_path, target, content)
+
+    from mission_python.util import crypto
+    data = (tmp_path / "log" / "log.encrypted").read_bytes()
+    entries = [record.decode("utf-8") for record in crypto.decrypt_records(data, private_key)]
+    assert delta.replay(entries) == ["a = 3"]
+
+
+@pytest.fixture
+def tracked_project(tmp_path, monkeypatch):
+    """ pyproject.toml에 추적할 파일 패턴이 설정된, 여러 파일로 이루어진 임시 프로젝트를 준비합니다. """
+    monkeypatch.setattr(utility.crypto, "encrypt_data", _fake_encrypt)
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\n\n[tool.mission-python]\ntrack = ["pkg/**/*.py", "assets/*.csv"]\n',
+        encoding="utf-8")
+    package = tmp_path / "pkg"
+    (package / "sub").mkdir(parents=True)
+    (tmp_path / "assets").mkdir()
+    paths = [package / f"module_{i}.py" for i in range(20)]
+    paths += [package / "sub" / f"helper_{i}.py" for i in range(5)]
+    paths += [tmp_path / "assets" / f"data_{i}.csv" for i in range(5)]
+    for i, path in enumerate(paths):
+        path.write_text(f"value = {i}\n" * 50, encoding="utf-8")
+        # 수정 시각을 과거로 두어, 시각 해상도 문제(racy) 없이 stat만으로 확인할 수 있게 합니다.
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return tmp_path, package, paths
+
+
+def commit_tracked(root, package):
+    base_dir, patterns = utility.find_track_config(str(package))
+    assert base_dir == str(root)
+    files = utility.expand_tracked_files(base_dir, patterns, exclude_dir=str(package / "log"))
+    assert utility.log_tracked_changes(files, str(package), base_dir) is True
+    return files
+
+
+def test_tracked_files_are_committed_as_one_batched_record(tracked_project, monkeypatch):
+    root, package, paths = tracked_project
+    assert len(commit_tracked(root, package)) == 30
+    entries = read_entries(package / "log" / "log.encrypted")
+    assert len(entries) == 1
+    assert len(delta.split_entries(entries[0])) == 30
+
+    paths[3].write_text("value = 'edited'\n", encoding="utf-8")
+    os.utime(paths[3], ns=(2_000_000_000, 2_000_000_000))
+    reads = []
+    original_read = utility.read_file_content
+    monkeypatch.setattr(utility, "read_file_content", lambda path, *args: reads.append(path) or original_read(path, *args))
+    commit_tracked(root, package)
+
+    # 바뀐 파일 하나만 읽고(현재 내용 + 직전 버전), 그 파일의 항목만 새 레코드에 기록합니다.
+    assert sorted(os.path.basename(path) for path in reads) == ["module_3.py", "module_3.py"]
+    entries = read_entries(package / "log" / "log.encrypted")
+    assert len(entries) == 2
+    assert delta.parse_entry(entries[1])["file"] == "pkg/module_3.py"
+
+    versions = delta.replay_files(entries)
+    assert versions["pkg/module_3.py"] == ["value = 'edited'"]
+    assert versions["assets/data_4.csv"] == ["value = 29"] * 50
+    assert len(versions) == 30
+    assert history.VersionHistory(entries, file="pkg/module_3.py").get_version(-1) == ["value = 'edited'"]
+
+
+def test_track_config_is_optional(tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n', encoding="utf-8")
+    assert utility.find_track_config(str(tmp_path)) is None
+
+
+@pytest.fixture
+def store_project(project, monkeypatch):
+    """ 추가 전용 저장소 모드를 켠 임시 프로젝트를 준비합니다. """
+    monkeypatch.setattr(utility, "flag_append_store_enabled", True)
+    monkeypatch.setattr(utility.store, "_last_sync", None)
+    return project
+
+
+def test_append_store_replaces_log_temp(store_project):
+    project_root, target = store_project
+    lines = [f"value_{i} = {i}\n" for i in range(2000)]
+    for step in range(10):
+        lines[step * 100] = f"value = {step}\r\n"
+        commit(project_root, target, "".join(lines))
+
+    log_dir = project_root / "log"
+    assert not (log_dir / "log.temp").exists()
+    # 저장소는 처음 한 번만 전체 내용을 담고, 이후에는 바뀐 줄만 추가됩니다.
+    assert (log_dir / "log.store").stat().st_size < target.stat().st_size * 1.5
+    assert delta.replay(read_entries(log_dir / "log.encrypted")) == delta.to_log_lines("".join(lines))
+
+
+def test_crash_between_log_and_baseline_is_recovered(store_project, monkeypatch):
+    project_root, target = store_project
+    commit(project_root, target, "x = 1\n")
+
+    # 로그 항목을 추가한 직후, 직전 버전을 기록하기 전에 멈춘 상황을 흉내 냅니다.
+    def crash(*args, **kwargs):
+        raise OSError("power loss")
+    with monkeypatch.context() as patched:
+        patched.setattr(utility.store.BaselineStore, "commit", crash)
+        target.write_text("x = 2\n", encoding="utf-8")
+        assert utility.log_code_changes(str(target), str(project_root)) is False
+    assert len(read_entries(project_root / "log" / "log.encrypted")) == 2
+
+    # 다음 실행에서 확정되지 않은 항목을 잘라내고, 같은 변경을 다시 기록합니다.
+    commit(project_root, target, "x = 3\n")
+    entries = read_entries(project_root / "log" / "log.encrypted")
+    assert len(entries) == 2
+    assert delta.replay(entries) == ["x = 3"]
+
+
+def test_truncated_log_gets_a_fresh_snapshot_instead_of_overwrite(store_project):
+    project_root, target = store_project
+    commit(project_root, target, "a = 1\n")
+    commit(project_root, target, "a = 2\n")
+    log_file = project_root / "log" / "log.encrypted"
+    first_entry = len(_fake_encrypt(read_entries(log_file)[0].encode("utf-8")))
+    with open(log_file, "r+b") as f:
+        f.truncate(first_entry)
+
+    commit(project_root, target, "a = 3\n")
+    entries = read_entries(log_file)
+    assert [delta.parse_entry(text)["kind"] for text in entries] == ["initial", "initial"]
+    assert delta.replay(entries) == ["a = 3"]
+
+
+@pytest.mark.parametrize("policy, commits", [("every", 3), ("batched", 1), ("os", 0)])
+def test_fsync_policy(store_project, monkeypatch, policy, commits):
+    project_root, target = store_project
+    monkeypatch.setattr(utility, "STORE_FSYNC_POLICY", policy)
+    monkeypatch.setattr(utility.store, "_last_sync", None)
+    calls = []
+    monkeypatch.setattr(utility.store.os, "fsync", lambda fd: calls.append(os.fstat(fd)))
+    for value in range(3):
+        commit(project_root, target, f"x = {value}\n")
+    # 강제로 기록하는 커밋에서는 로그 항목 다음에 저장소 레코드(커밋 완료 표시)가 기록되어야 합니다.
+    paths = [project_root / "log" / name for name in ("log.encrypted", "log.store")]
+    synced = [path.name for stat in calls for path in paths if os.path.samestat(stat, os.stat(path))]
+    assert synced == ["log.encrypted", "log.store"] * commits
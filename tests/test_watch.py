@@ -0,0 +1,75 @@
+# ==============================================================================
+# watch 모듈의 저장 감지(debounce, coalesce, 유휴 시 확인 간격) 동작을 검증하는 테스트입니다.
+#
+# 시간을 직접 지정하여 poll_once()를 호출하므로, 실제로 기다리지 않고 동작을 확인할 수 있습니다.
+#
+# 실행 방법: poetry run pytest tests/test_watch.py
+# ==============================================================================
+
+import os
+import threading
+
+import pytest
+
+from mission_python.util import watch
+
+
+@pytest.fixture
+def watched(tmp_path):
+    """ 감시할 파일과, 기록 호출 횟수를 세는 Watcher를 준비합니다. """
+    target = tmp_path / "main.py"
+    target.write_text("x = 0\n", encoding="utf-8")
+    commits = []
+    watcher = watch.Watcher(lambda: [str(target)], lambda: commits.append(target.read_text()) or True,
+                            poll_interval=0.1, max_interval=1.0, debounce=1.0, max_delay=5.0)
+    watcher.poll_once(now=0.0)
+    return target, watcher, commits
+
+
+def save(target, content, mtime):
+    target.write_text(content, encoding="utf-8")
+    os.utime(target, ns=(mtime, mtime))
+
+
+def test_burst_of_saves_is_committed_once(watched):
+    target, watcher, commits = watched
+    for step in range(5):
+        save(target, f"x = {step + 1}\n", 10 + step)
+        assert watcher.poll_once(now=1.0 + step * 0.2) is False
+
+    # 마지막 저장 후 debounce 시간이 지나야 한 번만 기록합니다.
+    assert watcher.poll_once(now=2.5) is False
+    assert watcher.poll_once(now=2.9) is True
+    assert commits == ["x = 5\n"]
+    assert watcher.poll_once(now=10.0) is False
+    assert watcher.stats["commits"] == 1
+
+
+def test_continuous_edits_are_coalesced_within_max_delay(watched):
+    target, watcher, commits = watched
+    now = 1.0
+    for step in range(40):
+        save(target, f"x = {step}" + "#" * step + "\n", 100 + step)
+        watcher.poll_once(now=now)
+        now += 0.5
+    # 저장이 멈추지 않아도, 첫 변경 후 max_delay(5초)가 지나면 그때까지의 변경을 모아서 기록합니다.
+    assert len(commits) == 3
+    assert commits[0] == "x = 10" + "#" * 10 + "\n"
+
+
+def test_idle_polling_backs_off_to_max_interval(watched):
+    _, watcher, _ = watched
+    for step in range(100):
+        watcher.poll_once(now=1.0 + step)
+    assert watcher.interval == 1.0
+    assert watcher.stats["stat_calls"] == 101
+
+
+def test_run_stops_and_reports_cpu_usage(watched):
+    _, watcher, _ = watched
+    stop = threading.Event()
+    timer = threading.Timer(0.3, stop.set)
+    timer.start()
+    watcher.run(stop_event=stop)
+    assert watcher.stats["wall_seconds"] >= 0.25
+    assert watcher.cpu_percent() < 50